@@ -0,0 +1,140 @@
+# Drive concurrent online verification against a local notary simulator and report throughput and tail latency.
+#
+#   python -m benchmarks.bench_online --bundles 400 --concurrency 16 --latency lognormal:40,0.6 --p-5xx 0.01
+#
+# Run from the repository root. Each bundle is verified in its own call so per-bundle latency includes the TL round
+# trip. --tl-batch switches to one verify_many() pass with coalesced range lookups; its percentiles are then the time
+# from the start of the pass until each bundle's result was yielded (see "latency_basis" in the report).
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import tempfile
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from oord_verify.notary_client.sim import NotarySimulator, SimConfig, entries_from_bundles
+from oord_verify.verify.merkle import compute_merkle_root_from_manifest_files
+from oord_verify.verify.verifier import Verifier
+
+
+def _build(path: Path, seq: int) -> Path:
+    data = f"payload {seq}".encode()
+    entries = [{"path": "files/a.txt", "sha256": hashlib.sha256(data).hexdigest(), "size_bytes": len(data)}]
+    root = compute_merkle_root_from_manifest_files(entries)
+    manifest = {
+        "org_id": "org-bench",
+        "batch_id": f"batch-{seq}",
+        "created_at_ms": 1700000000000,
+        "key_id": "bench-kid",
+        "signature": "",
+        "files": entries,
+        "merkle": {"root_cid": root},
+        "tl_mode": "included",
+    }
+    tl_proof = {"entry": {"seq": seq, "merkle_root": root, "signer_key_id": "bench-kid"}, "sth": {}}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("manifest.json", json.dumps(manifest))
+        z.writestr("jwks_snapshot.json", json.dumps({"keys": [{"kid": "bench-kid", "kty": "OKP", "x": ""}]}))
+        z.writestr("tl_proof.json", json.dumps(tl_proof))
+        z.writestr("files/a.txt", data)
+    return path
+
+
+def _pct(sorted_s: List[float], q: float) -> float:
+    if not sorted_s:
+        return 0.0
+    return sorted_s[min(len(sorted_s) - 1, int(q * len(sorted_s)))]
+
+
+def _per_bundle(url: str, bundles: List[Path], concurrency: int) -> Tuple[List[float], Counter]:
+    outcomes: Counter = Counter()
+
+    def one(v: Verifier, p: Path) -> Tuple[float, str]:
+        t0 = time.perf_counter()
+        _, summary = v.verify(p)
+        return time.perf_counter() - t0, summary["tl_online"].get("reason_id") or "ok"
+
+    with Verifier(tl_url=url, online=True) as v, ThreadPoolExecutor(max_workers=concurrency) as ex:
+        results = list(ex.map(lambda p: one(v, p), bundles))
+    for _, outcome in results:
+        outcomes[outcome] += 1
+    return [t for t, _ in results], outcomes
+
+
+def _batched(url: str, bundles: List[Path], concurrency: int, tl_batch: int) -> Tuple[List[float], Counter]:
+    outcomes: Counter = Counter()
+    completed: List[float] = []
+    with Verifier(tl_url=url, online=True, workers=concurrency, tl_batch=tl_batch) as v:
+        t0 = time.perf_counter()
+        for _, summary in v.verify_many(bundles):
+            completed.append(time.perf_counter() - t0)
+            outcomes[summary["tl_online"].get("reason_id") or "ok"] += 1
+    return completed, outcomes
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--bundles", type=int, default=200)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--tl-batch", type=int, default=0)
+    ap.add_argument("--latency", default="lognormal:20,0.5")
+    ap.add_argument("--p-401", type=float, default=0.0)
+    ap.add_argument("--p-404", type=float, default=0.0)
+    ap.add_argument("--p-5xx", type=float, default=0.0)
+    ap.add_argument("--p-malformed", type=float, default=0.0)
+    ap.add_argument("--p-drop", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    config = SimConfig(
+        latency=args.latency,
+        p_unauthorized=args.p_401,
+        p_not_found=args.p_404,
+        p_server_error=args.p_5xx,
+        p_malformed=args.p_malformed,
+        p_drop=args.p_drop,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory() as td:
+        bundles = [_build(Path(td) / f"b{i:05d}.zip", 10_000 + i) for i in range(args.bundles)]
+        with NotarySimulator(entries_from_bundles(bundles), config) as sim:
+            t0 = time.perf_counter()
+            if args.tl_batch:
+                latencies, outcomes = _batched(sim.url, bundles, args.concurrency, args.tl_batch)
+            else:
+                latencies, outcomes = _per_bundle(sim.url, bundles, args.concurrency)
+            wall = time.perf_counter() - t0
+            requests = dict(sim.stats)
+
+    latencies.sort()
+    report: Dict[str, Any] = {
+        "bundles": args.bundles,
+        "concurrency": args.concurrency,
+        "tl_batch": args.tl_batch,
+        "latency_spec": args.latency,
+        "latency_basis": "completion since start of pass" if args.tl_batch else "per verify() call",
+        "seconds": round(wall, 3),
+        "bundles_per_s": round(args.bundles / wall, 1),
+        "outcomes": dict(outcomes),
+        "notary_requests": requests,
+    }
+    if latencies:
+        report.update(
+            {
+                "p50_ms": round(_pct(latencies, 0.50) * 1000, 1),
+                "p95_ms": round(_pct(latencies, 0.95) * 1000, 1),
+                "p99_ms": round(_pct(latencies, 0.99) * 1000, 1),
+                "max_ms": round(latencies[-1] * 1000, 1),
+            }
+        )
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
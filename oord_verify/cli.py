@@ -1,75 +1,320 @@
 #oord-verify/oord_verify/cli.py
 import argparse
+import contextlib
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from oord_verify.verify.verifier import verify_bundle
+from oord_verify.notary_client.sim import (
+    NotarySimulator,
+    SimConfig,
+    entries_from_bundles,
+    generate_entries,
+    load_entries,
+    parse_latency,
+)
+from oord_verify.verify.conformance import find_protocol_dir, run_conformance
+from oord_verify.verify.delta import Baseline, load_baseline
+from oord_verify.verify.journal import Journal, in_shard, load_journal, merge_journals, parse_shard
+from oord_verify.verify.limits import Budgets
+from oord_verify.verify.profiling import Profiler
+from oord_verify.verify.progress import Progress
+from oord_verify.verify.results import Aggregate, ResultRecord, ResultSpool, is_env_failure
+from oord_verify.verify.sampling import Sampling
+from oord_verify.verify.verifier import Verifier
+from oord_verify.verify.watch import BUNDLE_PATTERN, POLL_INTERVAL_S, SETTLE_S, Watcher
 from oord_verify.verify.human import print_human
 from oord_verify.verify.output import wrap_json
 
-_ENV_REASON_IDS = {
-    "TL_ONLINE_UNREACHABLE",
-    "TL_ONLINE_UNAUTHORIZED",
-    "TL_ONLINE_BAD_RESPONSE",
-    "ENV_NOTARY_URL_MISSING",
-}
-
-def _is_env_failure(summary: Dict[str, Any]) -> bool:
-    if summary.get("error_kind") == "env":
-        return True
-    rids = summary.get("reason_ids")
-    if not isinstance(rids, list):
-        return False
-    for r in rids:
-        if not isinstance(r, str):
-            continue
-        if r.startswith("ENV_"):
-            return True
-        if r in _ENV_REASON_IDS:
-            return True
-    return False
-
-def _exit_code_for_results(results: List[Tuple[bool, Dict[str, Any]]]) -> int:
-    any_fail = any(not ok_i for ok_i, _ in results)
-    if not any_fail:
-        return 0
-    any_env = any(_is_env_failure(s) for ok_i, s in results if not ok_i)
-    return 2 if any_env else 1
+def _verify_target(verifier: Verifier, p: str) -> Tuple[bool, Dict[str, Any]]:
+    if p == "-":
+        return verifier.verify_stream(sys.stdin.buffer, label="-")
+    if p.startswith(("http://", "https://")):
+        return verifier.verify_url(p)
+    return verifier.verify_path(Path(p).expanduser().resolve())
 
-def _cmd_verify(args: argparse.Namespace) -> int:
-    bundle_paths = [Path(p).expanduser().resolve() for p in args.bundles]
-    results: List[Tuple[bool, Dict[str, Any]]] = []
-
-    for path in bundle_paths:
-        online_enabled = bool(args.online or args.tl_url)
-        ok, summary = verify_bundle(
-            path,
-            tl_url=args.tl_url,
-            online=online_enabled,
-            tl_api_key=args.tl_api_key,
-            tl_timeout_s=float(args.tl_timeout_s),
-        )
 
-        results.append((ok, summary))
+def _write_json_array(items: Iterable[Dict[str, Any]]) -> None:
+    # Same bytes as json.dumps(list, indent=2), written one element at a time.
+    out = sys.stdout
+    first = True
+    for item in items:
+        body = json.dumps(item, indent=2, sort_keys=True).replace("\n", "\n  ")
+        out.write(("[\n  " if first else ",\n  ") + body)
+        first = False
+    out.write("[]\n" if first else "\n]\n")
 
-    exit_code = _exit_code_for_results(results)
 
+def _print_aggregate(args: argparse.Namespace, agg: Aggregate) -> None:
+    totals = agg.as_dict()
     if args.json:
-        payload: Any
-        if len(results) == 1:
-            payload = wrap_json(results[0][1], exit_code)
+        print(json.dumps(totals, indent=2, sort_keys=True))
+        return
+    rids = ",".join(f"{k}:{v}" for k, v in totals["reason_ids"].items()) or "-"
+    print(
+        f"SUMMARY bundles={agg.bundles} passed={agg.passed} failed={agg.failed} env_failed={agg.env_failed} "
+        f"bytes_verified={agg.bytes_verified} reason_ids={rids}"
+    )
+
+
+def _report(args: argparse.Namespace, results: Iterable[Tuple[bool, Dict[str, Any]]]) -> int:
+    agg = Aggregate()
+    summary_only = bool(args.summary_only)
+    with ResultSpool() as spool:
+        for ok_i, summary_i in results:
+            record = ResultRecord.from_summary(ok_i, summary_i, keep_payload=not summary_only)
+            agg.add(record)
+            if not summary_only:
+                spool.append(record)
+
+        exit_code = agg.exit_code
+        if summary_only:
+            _print_aggregate(args, agg)
+        elif args.json:
+            if spool.count == 1:
+                (_, summary), = spool
+                print(json.dumps(wrap_json(summary, exit_code), indent=2, sort_keys=True))
+            else:
+                _write_json_array(wrap_json(s, exit_code) for _, s in spool)
+        else:
+            for i, (ok_i, summary_i) in enumerate(spool):
+                if i:
+                    print()
+                print_human(summary_i, ok_i, verbose=bool(args.verbose))
+    return exit_code
+
+
+def _resumed(
+    targets: List[str], done: Dict[str, Dict[str, Any]], fresh: Iterator[Tuple[bool, Dict[str, Any]]]
+) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+    for t in targets:
+        if t in done:
+            yield bool(done[t]["ok"]), done[t]["result"]
         else:
-            payload = [wrap_json(s, exit_code) for _, s in results]
-        print(json.dumps(payload, indent=2, sort_keys=True))
+            yield next(fresh)
+
+
+def _journaled(
+    journal: Optional[Journal], targets: List[str], results: Iterator[Tuple[bool, Dict[str, Any]]]
+) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+    for t, (ok_i, summary_i) in zip(targets, results):
+        if journal is not None:
+            exit_i = 0 if ok_i else 2 if is_env_failure(summary_i) else 1
+            journal.append(t, ok_i, wrap_json(summary_i, exit_i))
+        yield ok_i, summary_i
+
+
+def _progressed(
+    progress: Optional[Progress], total: int, results: Iterator[Tuple[bool, Dict[str, Any]]]
+) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+    if progress is None:
+        yield from results
+        return
+    progress.total_bundles = total
+    with progress:
+        for item in results:
+            progress.bundle_done()
+            yield item
+
+
+def _cmd_verify(args: argparse.Namespace) -> int:
+    if (args.shard or args.journal) and "-" in args.bundles:
+        print("error: --shard/--journal cannot be combined with stdin (-)", file=sys.stderr)
+        return 2
+    if args.resume and not args.journal:
+        print("error: --resume requires --journal", file=sys.stderr)
+        return 2
+    shard = (1, 1)
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except RuntimeError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+
+    profiler = Profiler(Path(args.profile), mode=args.profile_mode) if args.profile else None
+    try:
+        with profiler or contextlib.nullcontext():
+            return _run_verify(args, shard, baseline)
+    finally:
+        if profiler is not None:
+            print(f"profile written: {', '.join(str(p) for p in profiler.written)}", file=sys.stderr)
+
+
+def _run_verify(args: argparse.Namespace, shard: Tuple[int, int], baseline: Optional[Baseline]) -> int:
+    online_enabled = bool(args.online or args.tl_url)
+    if args.tl_batch and args.timeout_s is not None:
+        print("warning: --tl-batch has no effect with --timeout-s; online lookups are made per bundle", file=sys.stderr)
+    progress = Progress() if args.progress else None
+    with Verifier(
+        tl_url=args.tl_url,
+        online=online_enabled,
+        tl_api_key=args.tl_api_key,
+        tl_timeout_s=float(args.tl_timeout_s),
+        workers=int(args.workers),
+        all_checks=bool(args.all_checks),
+        budgets=Budgets(
+            max_members=args.max_members,
+            max_total_bytes=args.max_total_bytes,
+            max_ratio=args.max_ratio,
+            max_manifest_bytes=args.max_manifest_bytes,
+            max_orphan_bytes=args.max_orphan_bytes,
+        ),
+        max_mismatches=args.max_mismatches,
+        stop_after_mismatches=args.stop_after_mismatches,
+        tl_batch=int(args.tl_batch),
+        sampling=Sampling(rate=args.sample_rate, max_bytes=args.sample_bytes, seed=args.sample_seed),
+        timeout_s=args.timeout_s,
+        progress=progress,
+        pipeline_depth=int(args.pipeline_depth),
+        baseline=baseline,
+    ) as verifier:
+        if "-" in args.bundles:
+            results = (_verify_target(verifier, p) for p in args.bundles)
+            return _report(args, _progressed(progress, len(args.bundles), results))
+
+        targets = [
+            p if p.startswith(("http://", "https://")) else str(Path(p).expanduser().resolve()) for p in args.bundles
+        ]
+        targets = [t for t in targets if in_shard(t, *shard)]
+        done = load_journal(Path(args.journal)) if args.resume else {}
+        todo = [t for t in targets if t not in done]
+        journal = Journal(Path(args.journal)) if args.journal else None
+        try:
+            fresh = _journaled(journal, todo, verifier.verify_many(todo, ordered=True))
+            return _report(args, _resumed(targets, done, _progressed(progress, len(todo), fresh)))
+        finally:
+            if journal is not None:
+                journal.close()
+
+
+def _cmd_merge_journals(args: argparse.Namespace) -> int:
+    records = merge_journals(Path(p) for p in args.journals)
+    return _report(args, ((bool(rec["ok"]), rec["result"]) for rec in records.values()))
+
+
+def _cmd_conformance(args: argparse.Namespace) -> int:
+    try:
+        report = run_conformance(find_protocol_dir(args.protocol_dir), workers=int(args.workers))
+    except RuntimeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
     else:
-        for i, (ok_i, summary_i) in enumerate(results):
-            if i:
-                print()
-            print_human(summary_i, ok_i, verbose=bool(args.verbose))
+        for v in report["vectors"]:
+            status = "PASS" if v["ok"] else "FAIL"
+            print(f"{status} {v['name']} exit={v['exit_code']} seconds={v['seconds']:.3f}")
+            for problem in v["problems"]:
+                print(f"  {problem}")
+        for err in report["checksum_errors"]:
+            print(f"CHECKSUM {err}")
+        print(
+            f"SUMMARY vectors={len(report['vectors'])} passed={report['passed']} failed={report['failed']} "
+            f"checksum_seconds={report['checksum_seconds']:.3f} seconds={report['seconds']:.3f}"
+        )
+    return 0 if report["ok"] else 1
 
-    return exit_code
+
+def _cmd_notary_sim(args: argparse.Namespace) -> int:
+    try:
+        parse_latency(args.latency)
+        entries: Dict[int, Dict[str, Any]] = {}
+        if args.entries:
+            entries.update(load_entries(Path(args.entries)))
+        if args.from_bundles:
+            entries.update(entries_from_bundles([Path(p) for p in args.from_bundles]))
+        if args.generate:
+            entries.update(generate_entries(args.generate, args.start_seq))
+        config = SimConfig(
+            latency=args.latency,
+            p_unauthorized=args.p_401,
+            p_not_found=args.p_404,
+            p_server_error=args.p_5xx,
+            p_malformed=args.p_malformed,
+            p_drop=args.p_drop,
+            seed=args.seed,
+            supports_range=not args.no_range,
+        )
+        sim = NotarySimulator(entries, config, host=args.host, port=args.port)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    print(f"notary-sim listening on {sim.url} entries={len(entries)}", flush=True)
+    try:
+        sim.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.server_close()
+        print(json.dumps({"requests": sim.stats}, sort_keys=True), file=sys.stderr)
+    return 0
+
+
+def _cmd_watch(args: argparse.Namespace) -> int:
+    root = Path(args.dir).expanduser().resolve()
+    if not root.is_dir():
+        print(f"error: not a directory: {root}", file=sys.stderr)
+        return 2
+    agg = Aggregate()
+
+    def emit(record: Dict[str, Any]) -> None:
+        if isinstance(record.get("result"), dict):
+            agg.add(ResultRecord.from_summary(bool(record["ok"]), record["result"], keep_payload=False))
+        sys.stdout.write(json.dumps(record, sort_keys=True) + "\n")
+        sys.stdout.flush()
+
+    with Verifier(
+        tl_url=args.tl_url,
+        online=bool(args.online or args.tl_url),
+        tl_api_key=args.tl_api_key,
+        tl_timeout_s=float(args.tl_timeout_s),
+        workers=int(args.workers),
+        timeout_s=args.timeout_s,
+    ) as verifier:
+        watcher = Watcher(
+            root,
+            verifier,
+            emit,
+            pattern=args.pattern,
+            settle_s=args.settle_s,
+            poll_interval_s=args.poll_interval_s,
+            existing=bool(args.existing),
+            use_inotify=not args.poll,
+            workers=int(args.workers),
+            pass_dir=Path(args.pass_dir).expanduser().resolve() if args.pass_dir else None,
+            fail_dir=Path(args.fail_dir).expanduser().resolve() if args.fail_dir else None,
+        )
+        print(f"watching {root} ({watcher.mode}) pattern={args.pattern}", file=sys.stderr, flush=True)
+        try:
+            watcher.run(max_bundles=args.max_bundles)
+        except KeyboardInterrupt:
+            pass
+        except OSError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+    return agg.exit_code
+
+
+def _non_negative_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer, got {n}")
+    return n
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -77,7 +322,11 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     p_verify = subparsers.add_parser("verify", help="Verify one or more Oord bundles")
-    p_verify.add_argument("bundles", nargs="+", help="Path(s) to oord_bundle_*.zip")
+    p_verify.add_argument(
+        "bundles",
+        nargs="+",
+        help="Path(s) or http(s) URL(s) to oord_bundle_*.zip or extracted bundle directories ('-' streams from stdin)",
+    )
     p_verify.add_argument("--offline", action="store_true", help="Offline verification (default; accepted for back-compat)")
     p_verify.add_argument("--online", action="store_true", help="Enable online checks (TL fetch/consistency) when supported")
     p_verify.add_argument(
@@ -99,12 +348,123 @@ def build_parser() -> argparse.ArgumentParser:
         default=5.0,
         help="HTTP timeout (seconds) for online TL checks",
     )
+    p_verify.add_argument(
+        "--tl-batch",
+        type=int,
+        default=0,
+        help="Coalesce online TL lookups across up to N bundles into range requests (default 0 = one per bundle; "
+        "ignored with --timeout-s)",
+    )
+
+    p_verify.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Verify up to N bundles concurrently (results keep input order)",
+    )
+
+    p_verify.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=4,
+        help="Read and inflate large members up to N chunks ahead of hashing on a separate thread (0 = off)",
+    )
+
+    p_verify.add_argument(
+        "--timeout-s",
+        type=float,
+        default=None,
+        help="Give up on a bundle after N seconds and report TIMEOUT (exit code 2) with the checks completed so far",
+    )
+
+    p_verify.add_argument(
+        "--all-checks",
+        action="store_true",
+        help="Run every independent check (concurrently) and report all failing reason_ids instead of the first",
+    )
+
+    p_verify.add_argument(
+        "--max-members",
+        type=_non_negative_int,
+        default=None,
+        help="Reject bundles with more than N ZIP members (BUDGET_MEMBER_COUNT)",
+    )
+    p_verify.add_argument(
+        "--max-total-bytes",
+        type=_non_negative_int,
+        default=None,
+        help="Reject bundles that decompress to more than N bytes in total (BUDGET_TOTAL_BYTES)",
+    )
+    p_verify.add_argument(
+        "--max-ratio",
+        type=float,
+        default=None,
+        help="Reject members (over 1 MiB) whose compression ratio exceeds R (BUDGET_COMPRESSION_RATIO)",
+    )
+    p_verify.add_argument(
+        "--max-manifest-bytes",
+        type=_non_negative_int,
+        default=None,
+        help="Reject bundles whose manifest.json exceeds N bytes (BUDGET_MANIFEST_SIZE)",
+    )
+    p_verify.add_argument(
+        "--max-orphan-bytes",
+        type=_non_negative_int,
+        default=None,
+        help="Reject bundles with more than N bytes of files/ members missing from the manifest (BUDGET_ORPHAN_BYTES)",
+    )
+
+    p_verify.add_argument(
+        "--max-mismatches",
+        type=_non_negative_int,
+        default=None,
+        help="Report at most N hash_mismatches entries (per-reason counts are always complete)",
+    )
+    p_verify.add_argument(
+        "--stop-after-mismatches",
+        type=_non_negative_int,
+        default=None,
+        help="Stop hashing a bundle once N mismatches have been found",
+    )
+
+    p_verify.add_argument(
+        "--sample-rate",
+        type=float,
+        default=None,
+        help="Hash only a random fraction (0-1) of the manifest's files; all other checks still run in full",
+    )
+    p_verify.add_argument(
+        "--sample-bytes",
+        type=int,
+        default=None,
+        help="Hash a random subset of files totalling at most N bytes per bundle",
+    )
+    p_verify.add_argument(
+        "--sample-seed",
+        type=int,
+        default=None,
+        help="Seed for --sample-rate/--sample-bytes (random per bundle by default; always reported in the output)",
+    )
+
+    p_verify.add_argument(
+        "--baseline",
+        default=None,
+        help=(
+            "Previously verified bundle (path or URL); files whose manifest entry and ZIP CRC/sizes match it "
+            "are carried over instead of re-hashed"
+        ),
+    )
 
     p_verify.add_argument(
         "--json",
         action="store_true",
         help="Emit JSON summary instead of human-readable text",
     )
+    p_verify.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Print only aggregate counts (pass/fail/env, reason_id histogram, bytes verified) instead of per-bundle results",
+    )
     p_verify.add_argument(
         "--strict",
         action="store_true",
@@ -115,7 +475,130 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print detailed component results (hash mismatches, merkle, jwks, sig checks)",
     )
+    p_verify.add_argument(
+        "--progress",
+        action="store_true",
+        help="Report bundles done, bytes hashed, MB/s, files/s and ETA on stderr (periodic log lines when not a TTY)",
+    )
+    p_verify.add_argument(
+        "--profile",
+        default=None,
+        metavar="OUT",
+        help="Profile the run and write OUT.pstats (cProfile) and OUT.folded (per-stage collapsed stacks for flame graphs)",
+    )
+    p_verify.add_argument(
+        "--profile-mode",
+        choices=["cprofile", "sample"],
+        default="cprofile",
+        help="cprofile: full cProfile plus stack sampling; sample: low-overhead stack sampling only (no .pstats)",
+    )
+    p_verify.add_argument(
+        "--shard",
+        default=None,
+        help="Only verify shard I of N (e.g. 3/16); bundles are assigned by a stable hash of their path or URL",
+    )
+    p_verify.add_argument(
+        "--journal",
+        default=None,
+        help="Append each completed bundle result to this NDJSON journal",
+    )
+    p_verify.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip bundles already recorded in --journal and reuse their results",
+    )
     p_verify.set_defaults(func=_cmd_verify)
+
+    p_merge = subparsers.add_parser("merge-journals", help="Combine shard journals into one report and exit code")
+    p_merge.add_argument("journals", nargs="+", help="Journal files written by oord verify --journal")
+    p_merge.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit JSON summary instead of human-readable text",
+    )
+    p_merge.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print detailed component results (hash mismatches, merkle, jwks, sig checks)",
+    )
+    p_merge.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Print only aggregate counts instead of per-bundle results",
+    )
+    p_merge.set_defaults(func=_cmd_merge_journals)
+
+    p_conf = subparsers.add_parser("conformance", help="Run the oord-protocol test vectors in-process")
+    p_conf.add_argument(
+        "--protocol-dir",
+        default=None,
+        help="oord-protocol checkout (default: $OORD_PROTOCOL_DIR; one of the two is required)",
+    )
+    p_conf.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Check SHA256SUMS and verify vectors with up to N threads",
+    )
+    p_conf.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit the conformance report (per-vector results and timings) as JSON",
+    )
+    p_conf.set_defaults(func=_cmd_conformance)
+
+    p_sim = subparsers.add_parser("notary-sim", help="Serve a local stand-in notary for online load and latency tests")
+    p_sim.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    p_sim.add_argument("--port", type=int, default=8787, help="Port to listen on (0 = pick a free port)")
+    p_sim.add_argument(
+        "--entries", default=None, help="JSON array, {\"entries\": [...]} or NDJSON of recorded TL entries"
+    )
+    p_sim.add_argument("--from-bundles", nargs="+", default=None, help="Serve the TL entries recorded in these bundles")
+    p_sim.add_argument("--generate", type=int, default=0, help="Serve N synthetic entries")
+    p_sim.add_argument("--start-seq", type=int, default=1, help="First seq for --generate")
+    p_sim.add_argument(
+        "--latency",
+        default="0",
+        help="Per-request latency in ms: N, fixed:N, uniform:A,B, normal:MEAN,SD, exp:MEAN or lognormal:MEDIAN,SIGMA",
+    )
+    p_sim.add_argument("--p-401", type=float, default=0.0, help="Fraction of requests answered 401")
+    p_sim.add_argument("--p-404", type=float, default=0.0, help="Fraction of requests answered 404")
+    p_sim.add_argument("--p-5xx", type=float, default=0.0, help="Fraction of requests answered 503")
+    p_sim.add_argument("--p-malformed", type=float, default=0.0, help="Fraction of requests answered with broken JSON")
+    p_sim.add_argument("--p-drop", type=float, default=0.0, help="Fraction of connections dropped without a response")
+    p_sim.add_argument("--seed", type=int, default=None, help="Seed for latency and fault injection")
+    p_sim.add_argument("--no-range", action="store_true", help="Do not serve the /v1/tl/entries range endpoint")
+    p_sim.set_defaults(func=_cmd_notary_sim)
+
+    p_watch = subparsers.add_parser("watch", help="Verify bundles as they arrive in a directory (NDJSON on stdout)")
+    p_watch.add_argument("dir", help="Landing directory to watch")
+    p_watch.add_argument("--pattern", default=BUNDLE_PATTERN, help="File name pattern of bundles to verify")
+    p_watch.add_argument(
+        "--settle-s",
+        type=float,
+        default=SETTLE_S,
+        help="Without a close/rename event, wait until a file's size and mtime are unchanged for N seconds",
+    )
+    p_watch.add_argument(
+        "--poll-interval-s", type=float, default=POLL_INTERVAL_S, help="Directory scan interval when polling"
+    )
+    p_watch.add_argument("--poll", action="store_true", help="Poll the directory even where inotify is available")
+    p_watch.add_argument("--existing", action="store_true", help="Also verify bundles already present at startup")
+    p_watch.add_argument("--workers", type=int, default=1, help="Verify up to N bundles concurrently")
+    p_watch.add_argument("--pass-dir", default=None, help="Move bundles that pass (exit code 0) into this directory")
+    p_watch.add_argument("--fail-dir", default=None, help="Move bundles that fail (exit code 1) into this directory")
+    p_watch.add_argument(
+        "--max-bundles", type=int, default=None, help="Exit after N results (exit code as for oord verify)"
+    )
+    p_watch.add_argument("--online", action="store_true", help="Enable online checks (TL fetch/consistency)")
+    p_watch.add_argument("--tl-url", help="Optional Core base URL for online TL verification")
+    p_watch.add_argument("--notary-url", dest="tl_url", help="Alias for --tl-url")
+    p_watch.add_argument("--tl-api-key", default=None, help="Optional bearer token for TL reads when not public")
+    p_watch.add_argument("--tl-timeout-s", default=5.0, help="HTTP timeout (seconds) for online TL checks")
+    p_watch.add_argument(
+        "--timeout-s", type=float, default=None, help="Give up on a bundle after N seconds and report TIMEOUT"
+    )
+    p_watch.set_defaults(func=_cmd_watch)
     return parser
 
 
@@ -1,24 +1,71 @@
 from __future__ import annotations
 
+import http.client
 import json
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 from urllib import error as urlerror
 from urllib import request
+from urllib.parse import urljoin, urlsplit
 
 from oord_verify.notary_client.errors import (
     NotaryBadResponse,
+    NotaryHTTPError,
     NotaryNotFound,
     NotaryUnauthorized,
     NotaryUnreachable,
+    NotaryUnsupported,
 )
 
 
+class ConnectionPool:
+    def __init__(self, max_idle: int = 8) -> None:
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scheme: str, netloc: str, timeout_s: float) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout_s
+                return conn
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=timeout_s)
+
+    def put(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for c in conns:
+            c.close()
+
+
+_MAX_REDIRECTS = 5
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+def _proxied(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.scheme in request.getproxies() and not request.proxy_bypass(parts.hostname or "")
+
+
 @dataclass(frozen=True)
 class NotaryClient:
     base_url: str
     api_key: Optional[str] = None
     timeout_s: float = 5.0
+    pool: Optional[ConnectionPool] = field(default=None, compare=False, repr=False)
 
     def _headers(self) -> Dict[str, str]:
         h = {"Content-Type": "application/json"}
@@ -26,13 +73,57 @@ class NotaryClient:
             h["Authorization"] = f"Bearer {self.api_key}"
         return h
 
-    def get_tl_entry_by_seq(self, seq: int) -> Dict[str, Any]:
+    def _get_pooled(self, url: str) -> Tuple[int, str, Optional[str]]:
+        assert self.pool is not None
+        parts = urlsplit(url)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        for attempt in (0, 1):
+            conn = self.pool.get(parts.scheme, parts.netloc, self.timeout_s)
+            try:
+                conn.request("GET", target, headers=self._headers())
+                resp = conn.getresponse()
+                raw = resp.read().decode("utf-8")
+            except (OSError, http.client.HTTPException, UnicodeDecodeError) as e:
+                conn.close()
+                # An idle keep-alive connection may have been dropped by the server; retry once on a fresh one.
+                if attempt or isinstance(e, (TimeoutError, UnicodeDecodeError)):
+                    raise NotaryUnreachable(str(e)) from e
+                continue
+            if resp.will_close:
+                conn.close()
+            else:
+                self.pool.put(parts.scheme, parts.netloc, conn)
+            return resp.status, raw, resp.getheader("Location")
+        raise NotaryUnreachable("unreachable")  # pragma: no cover
+
+    def _get(self, path: str) -> Tuple[int, str]:
         base = self.base_url.rstrip("/")
-        url = f"{base}/v1/tl/entries/{int(seq)}"
-        req = request.Request(url, headers=self._headers(), method="GET")
+        url = f"{base}{path}"
+        # The pooled connection talks to the notary directly and follows redirects like urlopen does. URLs that
+        # HTTP(S)_PROXY/NO_PROXY route through a proxy, at any hop, go through urlopen instead.
+        redirects = 0
+        while self.pool is not None and not _proxied(url):
+            status, raw, location = self._get_pooled(url)
+            if status in _REDIRECT_CODES and location and redirects < _MAX_REDIRECTS:
+                url = urljoin(url, location)
+                redirects += 1
+                if urlsplit(url).scheme not in ("http", "https"):
+                    raise NotaryHTTPError(status)
+                continue
+            if status < 300:
+                return status, raw
+            if status in (401, 403):
+                raise NotaryUnauthorized(f"http {status}")
+            if status == 404:
+                raise NotaryNotFound("not found")
+            if status in (405, 501):
+                raise NotaryUnsupported(f"http {status}")
+            raise NotaryHTTPError(status)
 
+        req = request.Request(url, headers=self._headers(), method="GET")
         try:
-            with request.urlopen(req, timeout=self.timeout_s) as resp:
+            # A fresh opener picks up the current proxy environment, matching the _proxied() decision above.
+            with request.build_opener().open(req, timeout=self.timeout_s) as resp:
                 status = getattr(resp, "status", 200)
                 raw = resp.read().decode("utf-8")
         except urlerror.HTTPError as e:
@@ -40,7 +131,9 @@ class NotaryClient:
                 raise NotaryUnauthorized(f"http {e.code}") from e
             if e.code == 404:
                 raise NotaryNotFound("not found") from e
-            raise NotaryUnreachable(f"http {e.code}") from e
+            if e.code in (405, 501):
+                raise NotaryUnsupported(f"http {e.code}") from e
+            raise NotaryHTTPError(e.code) from e
         except (urlerror.URLError, TimeoutError, ValueError) as e:
             raise NotaryUnreachable(str(e)) from e
 
@@ -48,6 +141,10 @@ class NotaryClient:
             raise NotaryUnauthorized(f"http {status}")
         if status == 404:
             raise NotaryNotFound("not found")
+        return status, raw
+
+    def _get_json(self, path: str) -> Dict[str, Any]:
+        _, raw = self._get(path)
 
         try:
             obj = json.loads(raw)
@@ -57,3 +154,18 @@ class NotaryClient:
         if not isinstance(obj, dict):
             raise NotaryBadResponse("response was not a JSON object")
         return obj
+
+    def get_tl_entry_by_seq(self, seq: int) -> Dict[str, Any]:
+        return self._get_json(f"/v1/tl/entries/{int(seq)}")
+
+    def get_tl_entries_range(self, start: int, end: int) -> List[Dict[str, Any]]:
+        # 404, 405 and 501 mean the server has no range endpoint (NotaryUnsupported); per-entry GETs still work. Any
+        # other failure is about this request only and propagates as it is.
+        try:
+            obj = self._get_json(f"/v1/tl/entries?start={int(start)}&end={int(end)}")
+        except NotaryNotFound as e:
+            raise NotaryUnsupported(f"range endpoint not available: {e}") from e
+        entries = obj.get("entries")
+        if not isinstance(entries, list) or not all(isinstance(x, dict) for x in entries):
+            raise NotaryBadResponse("range response missing entries[]")
+        return entries
@@ -19,3 +19,13 @@ class NotaryNotFound(NotaryError):
 
 class NotaryBadResponse(NotaryError):
     pass
+
+
+class NotaryUnsupported(NotaryUnreachable):
+    pass
+
+
+class NotaryHTTPError(NotaryUnreachable):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"http {status}")
+        self.status = status
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from oord_verify.verify.zipio import ZipBundle, load_tl_proof
+
+Latency = Callable[[random.Random], float]
+
+
+def parse_latency(spec: str) -> Latency:
+    # Milliseconds: "0", "fixed:20", "uniform:5,50", "normal:20,5", "exp:20" (mean) or "lognormal:20,0.5"
+    # (median, sigma). Returned samplers yield seconds.
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    try:
+        params = [float(x) for x in args.split(",")]
+    except ValueError:
+        raise ValueError(f"invalid latency spec {spec!r}")
+    shapes: Dict[str, Latency] = {}
+    if len(params) == 1:
+        (a,) = params
+        shapes = {"fixed": lambda rng: a, "exp": lambda rng: rng.expovariate(1 / a) if a > 0 else 0.0}
+    elif len(params) == 2:
+        a, b = params
+        shapes = {
+            "uniform": lambda rng: rng.uniform(a, b),
+            "normal": lambda rng: rng.gauss(a, b),
+            "lognormal": lambda rng: a * rng.lognormvariate(0.0, b),
+        }
+    if kind not in shapes:
+        raise ValueError(f"invalid latency spec {spec!r}")
+    shape = shapes[kind]
+    return lambda rng: max(0.0, shape(rng)) / 1000.0
+
+
+@dataclass(frozen=True)
+class SimConfig:
+    latency: str = "0"
+    p_unauthorized: float = 0.0
+    p_not_found: float = 0.0
+    p_server_error: float = 0.0
+    p_malformed: float = 0.0
+    p_drop: float = 0.0
+    seed: Optional[int] = None
+    supports_range: bool = True
+
+
+def generate_entries(count: int, start_seq: int = 1, signer_kid: str = "sim-kid") -> Dict[int, Dict[str, Any]]:
+    entries: Dict[int, Dict[str, Any]] = {}
+    for seq in range(start_seq, start_seq + count):
+        root = "cid:sha256:" + hashlib.sha256(f"sim-entry-{seq}".encode()).hexdigest()
+        entries[seq] = {"entry": {"seq": seq, "merkle_root": root, "signer_key_id": signer_kid}, "sth": {}}
+    return entries
+
+
+def load_entries(path: Path) -> Dict[int, Dict[str, Any]]:
+    # Accepts a JSON array, {"entries": [...]} or NDJSON; each record is a TL response object ({"entry": {...}}) or a
+    # bare entry, keyed by its seq.
+    text = path.read_text("utf-8")
+    try:
+        obj = json.loads(text)
+        records = obj.get("entries") if isinstance(obj, dict) else obj
+    except json.JSONDecodeError:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    if not isinstance(records, list):
+        raise RuntimeError(f"{path}: expected a list of TL entries")
+    return index_entries(records)
+
+
+def index_entries(records: Iterable[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    entries: Dict[int, Dict[str, Any]] = {}
+    for rec in records:
+        if not isinstance(rec, dict):
+            continue
+        if not isinstance(rec.get("entry"), dict):
+            rec = {"entry": rec}
+        seq = rec["entry"].get("seq")
+        if isinstance(seq, int):
+            entries[seq] = rec
+    return entries
+
+
+class _SimHandler(BaseHTTPRequestHandler):
+    server: "NotarySimulator"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in one write. Unbuffered, a kept-alive connection sends them as two segments, and Nagle
+    # plus the client's delayed ACK add ~40 ms to every reused request.
+    wbufsize = -1
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        sim = self.server
+        outcome, delay = sim.draw()
+        if delay:
+            time.sleep(delay)
+        sim.count(outcome)
+        if outcome == "drop":
+            self.close_connection = True
+            try:
+                self.connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            return
+        if outcome == "unauthorized":
+            self._send(401, b'{"error": "unauthorized"}')
+            return
+        if outcome == "not_found":
+            self._send(404, b'{"error": "not found"}')
+            return
+        if outcome == "server_error":
+            self._send(503, b'{"error": "unavailable"}')
+            return
+        if outcome == "malformed":
+            self._send(200, b'{"entry": {"seq": ')
+            return
+
+        parts = urlsplit(self.path)
+        if parts.path == "/v1/tl/entries":
+            if not sim.config.supports_range:
+                self._send(404, b'{"error": "no such route"}')
+                return
+            try:
+                q = parse_qs(parts.query)
+                start, end = int(q["start"][0]), int(q["end"][0])
+            except (KeyError, ValueError):
+                self._send(400, b'{"error": "start and end are required"}')
+                return
+            found = [sim.entries[s] for s in range(start, end + 1) if s in sim.entries]
+            self._send(200, json.dumps({"entries": found}).encode())
+            return
+        head, _, tail = parts.path.rpartition("/")
+        if head != "/v1/tl/entries" or not tail.isdigit() or int(tail) not in sim.entries:
+            self._send(404, b'{"error": "not found"}')
+            return
+        self._send(200, json.dumps(sim.entries[int(tail)]).encode())
+
+
+class NotarySimulator(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        entries: Dict[int, Dict[str, Any]],
+        config: Optional[SimConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        super().__init__((host, port), _SimHandler)
+        self.entries = entries
+        self.config = config or SimConfig()
+        self.stats: Dict[str, int] = {}
+        self._latency = parse_latency(self.config.latency)
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        c = self.config
+        self._faults = [
+            ("unauthorized", c.p_unauthorized),
+            ("not_found", c.p_not_found),
+            ("server_error", c.p_server_error),
+            ("malformed", c.p_malformed),
+            ("drop", c.p_drop),
+        ]
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def draw(self) -> Tuple[str, float]:
+        with self._lock:
+            delay = self._latency(self._rng)
+            r = self._rng.random()
+        for outcome, p in self._faults:
+            if r < p:
+                return outcome, delay
+            r -= p
+        return "ok", delay
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            self.stats[outcome] = self.stats.get(outcome, 0) + 1
+
+    def start(self) -> "NotarySimulator":
+        self._thread = threading.Thread(target=self.serve_forever, name="oord-notary-sim", daemon=True)
+        self._thread.start()
+        return self
+
+    def __enter__(self) -> "NotarySimulator":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+
+def entries_from_bundles(paths: List[Path]) -> Dict[int, Dict[str, Any]]:
+    # A bundle's tl_proof.json is the TL response recorded at notarization time.
+    records = []
+    for p in paths:
+        with p.open("rb") as f:
+            records.append(load_tl_proof(ZipBundle(f)))
+    return index_entries(records)
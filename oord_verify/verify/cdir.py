@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import bz2
+import hashlib
+import struct
+import threading
+import zipfile
+import zlib
+from array import array
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+CENTRAL_SIG = b"PK\x01\x02"
+LOCAL_SIG = b"PK\x03\x04"
+EOCD_SIG = b"PK\x05\x06"
+ZIP64_EOCD_SIG = b"PK\x06\x06"
+ZIP64_LOCATOR_SIG = b"PK\x06\x07"
+
+EOCD = struct.Struct("<4s4H2LH")
+ZIP64_LOCATOR = struct.Struct("<4sLQL")
+ZIP64_EOCD = struct.Struct("<4sQ2H2L4Q")
+CENTRAL = struct.Struct("<4s4B4HL2L5H2L")
+LOCAL = struct.Struct("<4s5HL2L2H")
+
+FLAG_ENCRYPTED = 0x01
+FLAG_UTF8 = 0x800
+_MAX_COMMENT = 0xFFFF
+_CHUNK = 1024 * 1024
+_RUN_SLACK = 1024
+
+Decompressor = Union["zlib._Decompress", bz2.BZ2Decompressor]
+# (sha256 digests, 32 bytes per member; inflated sizes; errors by position) for one run of small members.
+RunDigests = Tuple[bytearray, "array[int]", Dict[int, Exception]]
+
+
+def normalize_name(raw: bytes, flags: int) -> bytes:
+    # Names are kept as UTF-8 bytes, truncated at NUL the way zipfile.ZipInfo does.
+    nul = raw.find(b"\0")
+    if nul >= 0:
+        raw = raw[:nul]
+    if raw.isascii():
+        return raw
+    if flags & FLAG_UTF8:
+        try:
+            raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise zipfile.BadZipFile(f"member name is not valid UTF-8: {e}")
+        return raw
+    return raw.decode("cp437").encode("utf-8")
+
+
+def zip64_extra(extra: bytes, usize: int, csize: int, offset: int) -> Tuple[int, int, int]:
+    i = 0
+    while i + 4 <= len(extra):
+        tag, ln = struct.unpack_from("<HH", extra, i)
+        if tag == 0x0001:
+            j = i + 4
+            end = j + ln
+            if usize == 0xFFFFFFFF:
+                if j + 8 > end:
+                    raise zipfile.BadZipFile("corrupt zip64 extra field")
+                (usize,) = struct.unpack_from("<Q", extra, j)
+                j += 8
+            if csize == 0xFFFFFFFF:
+                if j + 8 > end:
+                    raise zipfile.BadZipFile("corrupt zip64 extra field")
+                (csize,) = struct.unpack_from("<Q", extra, j)
+                j += 8
+            if offset == 0xFFFFFFFF:
+                if j + 8 > end:
+                    raise zipfile.BadZipFile("corrupt zip64 extra field")
+                (offset,) = struct.unpack_from("<Q", extra, j)
+            break
+        i += 4 + ln
+    return usize, csize, offset
+
+
+def _find_end_records(fp: BinaryIO) -> Tuple[int, int, int, int]:
+    fp.seek(0, 2)
+    file_size = fp.tell()
+    # Most archives carry no comment, so try the minimal tail before searching the maximal one.
+    for comment in (0, _MAX_COMMENT):
+        tail_len = min(file_size, EOCD.size + comment + ZIP64_LOCATOR.size + ZIP64_EOCD.size)
+        fp.seek(file_size - tail_len)
+        tail = fp.read(tail_len)
+        pos = tail.rfind(EOCD_SIG, max(0, len(tail) - EOCD.size - comment))
+        if pos >= 0 and pos + EOCD.size <= len(tail):
+            break
+    else:
+        raise zipfile.BadZipFile("File is not a zip file")
+    _, disk, _, _, count, cd_size, cd_offset, _ = EOCD.unpack_from(tail, pos)
+    eocd_at = file_size - tail_len + pos
+
+    loc = pos - ZIP64_LOCATOR.size
+    if loc >= 0 and tail[loc : loc + 4] == ZIP64_LOCATOR_SIG:
+        _, _, _, disks = ZIP64_LOCATOR.unpack_from(tail, loc)
+        if disks > 1:
+            raise zipfile.BadZipFile("zipfiles that span multiple disks are not supported")
+        rec = loc - ZIP64_EOCD.size
+        if rec < 0 or tail[rec : rec + 4] != ZIP64_EOCD_SIG:
+            raise zipfile.BadZipFile("zip64 end of central directory record not found")
+        fields = ZIP64_EOCD.unpack_from(tail, rec)
+        count, cd_size, cd_offset = fields[7], fields[8], fields[9]
+        eocd_at = file_size - tail_len + rec
+    elif disk not in (0, 0xFFFF):
+        raise zipfile.BadZipFile("zipfiles that span multiple disks are not supported")
+
+    # Bytes prepended to the archive (e.g. a self-extractor stub) shift every recorded offset.
+    concat = eocd_at - cd_size - cd_offset
+    if concat < 0:
+        raise zipfile.BadZipFile("Bad offset for central directory")
+    return count, cd_size, cd_offset + concat, concat
+
+
+class CentralDirectory:
+    # One member costs a few dozen bytes: names share a single UTF-8 buffer, numeric fields live in typed
+    # arrays and lookups go through an open-addressing table of member indices.
+    def __init__(self, fp: BinaryIO) -> None:
+        count, cd_size, cd_start, concat = _find_end_records(fp)
+        fp.seek(cd_start)
+        cd = fp.read(cd_size)
+        if len(cd) != cd_size:
+            raise zipfile.BadZipFile("truncated central directory")
+
+        names = bytearray()
+        self.name_ends = array("Q")
+        self.offsets = array("Q")
+        self.compressed = array("Q")
+        self.sizes = array("Q")
+        self.crcs = array("L")
+        self.methods = array("H")
+        self.flags = array("H")
+
+        pos = 0
+        while pos + CENTRAL.size <= cd_size:
+            fields = CENTRAL.unpack_from(cd, pos)
+            if fields[0] != CENTRAL_SIG:
+                raise zipfile.BadZipFile("Bad magic number for central directory")
+            flags, method, crc, csize, usize = fields[5], fields[6], fields[9], fields[10], fields[11]
+            nlen, xlen, clen, offset = fields[12], fields[13], fields[14], fields[18]
+            pos += CENTRAL.size
+            raw = cd[pos : pos + nlen]
+            pos += nlen
+            if 0xFFFFFFFF in (usize, csize, offset):
+                usize, csize, offset = zip64_extra(cd[pos : pos + xlen], usize, csize, offset)
+            pos += xlen + clen
+
+            names += normalize_name(raw, flags)
+            self.name_ends.append(len(names))
+            self.offsets.append(offset + concat)
+            self.compressed.append(csize)
+            self.sizes.append(usize)
+            self.crcs.append(crc)
+            self.methods.append(method)
+            self.flags.append(flags)
+        if pos > cd_size:
+            raise zipfile.BadZipFile("truncated central directory")
+        if count != len(self.offsets) and count not in (0xFFFF, 0xFFFFFFFF):
+            raise zipfile.BadZipFile("central directory entry count does not match end record")
+
+        self.names = bytes(names)
+        self._build_index()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _raw_name(self, i: int) -> bytes:
+        start = self.name_ends[i - 1] if i else 0
+        return self.names[start : self.name_ends[i]]
+
+    def name(self, i: int) -> str:
+        return self._raw_name(i).decode("utf-8")
+
+    def _build_index(self) -> None:
+        size = 8
+        while size < 2 * len(self):
+            size *= 2
+        self._mask = size - 1
+        self._slots = array("q", [-1]) * size
+        for i in range(len(self)):
+            raw = self._raw_name(i)
+            slot = hash(raw) & self._mask
+            while True:
+                j = self._slots[slot]
+                if j < 0 or self._raw_name(j) == raw:
+                    # Duplicate names resolve to the last entry, as in zipfile.getinfo().
+                    self._slots[slot] = i
+                    break
+                slot = (slot + 1) & self._mask
+
+    def index(self, name: str) -> int:
+        raw = name.encode("utf-8")
+        slot = hash(raw) & self._mask
+        while True:
+            j = self._slots[slot]
+            if j < 0:
+                raise KeyError(name)
+            if self._raw_name(j) == raw:
+                return j
+            slot = (slot + 1) & self._mask
+
+    def __iter__(self) -> Iterator[Tuple[str, int, int]]:
+        for i in range(len(self)):
+            yield self.name(i), self.compressed[i], self.sizes[i]
+
+
+def _inflate(decomp: Optional[Decompressor], data: bytes) -> Iterator[bytes]:
+    # Output is bounded per call so a tiny, highly compressed chunk cannot inflate to gigabytes at once.
+    if decomp is None:
+        yield data
+        return
+    if isinstance(decomp, bz2.BZ2Decompressor):
+        out = decomp.decompress(data, _CHUNK)
+        while out:
+            yield out
+            if decomp.eof or decomp.needs_input:
+                return
+            out = decomp.decompress(b"", _CHUNK)
+        return
+    out = decomp.decompress(data, _CHUNK)
+    while out:
+        yield out
+        if not decomp.unconsumed_tail:
+            return
+        out = decomp.decompress(decomp.unconsumed_tail, _CHUNK)
+
+
+class MemberReader:
+    # With `coalesce` set, reads smaller than that are served from one shared block read, so runs of small members
+    # visited in offset order cost one sequential read instead of three small ones each.
+    def __init__(self, fp: BinaryIO, cdir: CentralDirectory, coalesce: int = 0) -> None:
+        self.fp = fp
+        self.cdir = cdir
+        self.coalesce = coalesce
+        self._lock = threading.Lock()
+        self._block = b""
+        self._block_at = 0
+        # In-memory sources (see BufferFile) expose view() so payload data is inflated and hashed without a copy.
+        self._view = getattr(fp, "view", None)
+
+    def _pread(self, pos: int, n: int) -> bytes:
+        with self._lock:
+            if n >= self.coalesce:
+                self.fp.seek(pos)
+                return self.fp.read(n)
+            start = pos - self._block_at
+            if start < 0 or start + n > len(self._block):
+                self.fp.seek(pos)
+                self._block = self.fp.read(self.coalesce)
+                self._block_at = pos
+                start = 0
+            return self._block[start : start + n]
+
+    def chunks(self, i: int, name: str) -> Iterator[bytes]:
+        cd = self.cdir
+        if cd.flags[i] & FLAG_ENCRYPTED:
+            raise RuntimeError(f"File {name!r} is encrypted, password required for extraction")
+        method = cd.methods[i]
+        decomp: Optional[Decompressor]
+        if method == zipfile.ZIP_STORED:
+            decomp = None
+        elif method == zipfile.ZIP_DEFLATED:
+            decomp = zlib.decompressobj(-15)
+        elif method == zipfile.ZIP_BZIP2:
+            decomp = bz2.BZ2Decompressor()
+        else:
+            raise NotImplementedError(f"compression method {method}")
+
+        head = self._pread(cd.offsets[i], LOCAL.size)
+        if len(head) != LOCAL.size or head[:4] != LOCAL_SIG:
+            raise zipfile.BadZipFile("Bad magic number for file header")
+        fields = LOCAL.unpack(head)
+        nlen, xlen = fields[9], fields[10]
+        start = cd.offsets[i] + LOCAL.size
+        local_name = normalize_name(self._pread(start, nlen), fields[2])
+        if local_name != cd._raw_name(i):
+            raise zipfile.BadZipFile(f"File name in directory {name!r} and header {local_name!r} differ.")
+        return self._data(i, name, start + nlen + xlen, decomp)
+
+    def _data(self, i: int, name: str, pos: int, decomp: Optional[Decompressor]) -> Iterator[bytes]:
+        cd = self.cdir
+        left = cd.compressed[i]
+        crc = 0
+        size = 0
+        while left > 0:
+            n = min(_CHUNK, left)
+            b = self._view(pos, n) if self._view is not None else self._pread(pos, n)
+            if not b:
+                raise zipfile.BadZipFile(f"truncated data for file {name!r}")
+            pos += len(b)
+            left -= len(b)
+            for out in _inflate(decomp, b):
+                crc = zlib.crc32(out, crc)
+                size += len(out)
+                if size > cd.sizes[i]:
+                    raise zipfile.BadZipFile(f"{name}: size does not match header")
+                yield out
+        if decomp is not None and not decomp.eof:
+            raise zipfile.BadZipFile(f"{name}: compressed data ended prematurely")
+        if crc != cd.crcs[i]:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+        if size != cd.sizes[i]:
+            raise zipfile.BadZipFile(f"{name}: size does not match header")
+
+    def plan_runs(self, indices: Sequence[int], member_limit: int, run_limit: int) -> List[List[int]]:
+        # Groups offset-ordered stored/deflated members of at most member_limit bytes into runs spanning at most
+        # run_limit bytes of archive; anything else breaks the run and is read member by member.
+        cd = self.cdir
+        offsets, compressed, sizes, methods, flags, name_ends = (
+            cd.offsets, cd.compressed, cd.sizes, cd.methods, cd.flags, cd.name_ends
+        )
+        runs: List[List[int]] = []
+        run: List[int] = []
+        run_start = 0
+        for i in indices:
+            csize = compressed[i]
+            if (
+                csize > member_limit
+                or sizes[i] > member_limit
+                or methods[i] not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+                or flags[i] & FLAG_ENCRYPTED
+            ):
+                run = []
+                continue
+            nlen = name_ends[i] - (name_ends[i - 1] if i else 0)
+            end = offsets[i] + LOCAL.size + nlen + csize + _RUN_SLACK
+            if not run or end - run_start > run_limit:
+                run = []
+                runs.append(run)
+                run_start = offsets[i]
+            run.append(i)
+        return runs
+
+    def run_span(self, indices: Sequence[int]) -> Tuple[int, int]:
+        # Byte range covering a run of members sorted by offset. The last member's local extra field is assumed to
+        # fit in _RUN_SLACK bytes; digest_run() reads that member's data separately when it does not.
+        cd = self.cdir
+        last = indices[-1]
+        end = cd.offsets[last] + LOCAL.size + len(cd._raw_name(last)) + cd.compressed[last] + _RUN_SLACK
+        return cd.offsets[indices[0]], end
+
+    def digest_run(self, indices: Sequence[int]) -> RunDigests:
+        # Hashes a run of small stored/deflated members from one contiguous read: local headers are parsed out of
+        # the buffer and each member is inflated in one call. Checks and error messages match chunks()/_data();
+        # errors are kept per member so they surface only when that member's digest is asked for.
+        cd = self.cdir
+        n = len(indices)
+        digests = bytearray(32 * n)
+        sizes = array("Q", bytes(8 * n))
+        errors: Dict[int, Exception] = {}
+        base, end = self.run_span(indices)
+        buf = self._view(base, end - base) if self._view is not None else memoryview(self._pread(base, end - base))
+        unpack = LOCAL.unpack_from
+        crc32 = zlib.crc32
+        sha256 = hashlib.sha256
+        for k, i in enumerate(indices):
+            try:
+                pos = cd.offsets[i] - base
+                if pos + LOCAL.size > len(buf) or buf[pos : pos + 4] != LOCAL_SIG:
+                    raise zipfile.BadZipFile("Bad magic number for file header")
+                fields = unpack(buf, pos)
+                start = pos + LOCAL.size
+                raw = cd._raw_name(i)
+                local_name = bytes(buf[start : start + fields[9]])
+                if local_name != raw:
+                    local_name = normalize_name(local_name, fields[2])
+                    if local_name != raw:
+                        raise zipfile.BadZipFile(
+                            f"File name in directory {cd.name(i)!r} and header {local_name!r} differ."
+                        )
+                start += fields[9] + fields[10]
+                csize, usize = cd.compressed[i], cd.sizes[i]
+                if start + csize <= len(buf):
+                    data = buf[start : start + csize]
+                else:
+                    data = memoryview(self._pread(base + start, csize))
+                    if len(data) != csize:
+                        raise zipfile.BadZipFile(f"truncated data for file {cd.name(i)!r}")
+                if cd.methods[i] == zipfile.ZIP_STORED:
+                    out: Union[bytes, memoryview] = data
+                else:
+                    d = zlib.decompressobj(-15)
+                    # One byte over the declared size is enough to tell an oversized member apart.
+                    out = d.decompress(data, usize + 1)
+                    if len(out) <= usize and not d.eof:
+                        raise zipfile.BadZipFile(f"{cd.name(i)}: compressed data ended prematurely")
+                if len(out) != usize:
+                    raise zipfile.BadZipFile(f"{cd.name(i)}: size does not match header")
+                if crc32(out) != cd.crcs[i]:
+                    raise zipfile.BadZipFile(f"Bad CRC-32 for file {cd.name(i)!r}")
+                digests[32 * k : 32 * k + 32] = sha256(out).digest()
+                sizes[k] = usize
+            except zipfile.BadZipFile as e:
+                errors[k] = e
+        return digests, sizes, errors
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from oord_verify.verify.output import wrap_json
+from oord_verify.verify.results import ResultRecord
+from oord_verify.verify.verifier import Verifier
+
+
+def find_protocol_dir(explicit: Optional[str] = None) -> Path:
+    # The checkout must be named: an explicit path, else $OORD_PROTOCOL_DIR. Guessing from where this package happens
+    # to be installed would run whatever suite sits next to it.
+    cand = explicit or os.environ.get("OORD_PROTOCOL_DIR")
+    if not cand:
+        raise RuntimeError("no oord-protocol checkout given (pass --protocol-dir or set OORD_PROTOCOL_DIR)")
+    p = Path(cand).expanduser().resolve()
+    if not p.is_dir():
+        raise RuntimeError(f"protocol vectors not found: {p} is not a directory")
+    return p
+
+
+def parse_sha256sums(path: Path) -> Dict[str, str]:
+    sums: Dict[str, str] = {}
+    for line in path.read_text("utf-8").splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            sums[parts[-1].lstrip("*")] = parts[0].lower()
+    return sums
+
+
+def _sha256_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def check_sha256sums(base: Path, sums: Dict[str, str], workers: int = 4) -> Dict[str, Optional[str]]:
+    # Maps each listed file to None when it matches, or to the reason it does not.
+    def check(rel: str) -> Optional[str]:
+        p = base / rel
+        if not p.is_file():
+            return "missing"
+        actual = _sha256_file(p)
+        return None if actual == sums[rel] else f"sha256 mismatch (expected {sums[rel]}, got {actual})"
+
+    rels = sorted(sums)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="oord-conformance-sum") as pool:
+        return dict(zip(rels, pool.map(check, rels)))
+
+
+def diff_subset(expected: Any, actual: Any, path: str) -> List[str]:
+    if isinstance(expected, dict):
+        if not isinstance(actual, dict):
+            return [f"{path}: expected object, got {type(actual).__name__}"]
+        problems: List[str] = []
+        for k, v in expected.items():
+            if k not in actual:
+                problems.append(f"{path}: missing key {k!r}")
+            else:
+                problems.extend(diff_subset(v, actual[k], f"{path}.{k}"))
+        return problems
+    if expected != actual:
+        return [f"{path}: expected {expected!r}, got {actual!r}"]
+    return []
+
+
+@dataclass(frozen=True)
+class VectorResult:
+    name: str
+    ok: bool
+    exit_code: int
+    expected_exit_code: int
+    reason_ids: List[str]
+    expected_reason_ids: List[str]
+    seconds: float
+    problems: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "ok": self.ok,
+            "exit_code": self.exit_code,
+            "expected_exit_code": self.expected_exit_code,
+            "reason_ids": self.reason_ids,
+            "expected_reason_ids": self.expected_reason_ids,
+            "seconds": round(self.seconds, 6),
+            "problems": self.problems,
+        }
+
+
+def _run_vector(
+    verifier: Verifier, name: str, bundle: Path, expected: Dict[str, Any], sum_error: Optional[str]
+) -> VectorResult:
+    problems = [f"{bundle.name}: {sum_error}"] if sum_error else []
+    exp_rids = sorted(r for r in expected.get("reason_ids") or [] if isinstance(r, str))
+    exp_exit = expected.get("exit_code")
+    if not isinstance(exp_exit, int):
+        exp_exit = 1 if exp_rids else 0
+
+    t0 = time.perf_counter()
+    ok, summary = verifier.verify_path(bundle)
+    seconds = time.perf_counter() - t0
+
+    exit_code = ResultRecord.from_summary(ok, summary, keep_payload=False).exit_code
+    out = wrap_json(summary, exit_code)
+    rids = sorted(r for r in out["reason_ids"] if isinstance(r, str))
+    if rids != exp_rids:
+        problems.append(f"{name}: reason_ids {rids} != expected {exp_rids}")
+    if exit_code != exp_exit:
+        problems.append(f"{name}: exit code {exit_code} != expected {exp_exit}")
+    rest = {k: v for k, v in expected.items() if k not in ("reason_ids", "exit_code")}
+    problems.extend(diff_subset(rest, out, name))
+    return VectorResult(
+        name=name,
+        ok=not problems,
+        exit_code=exit_code,
+        expected_exit_code=exp_exit,
+        reason_ids=rids,
+        expected_reason_ids=exp_rids,
+        seconds=seconds,
+        problems=problems,
+    )
+
+
+def run_conformance(protocol_dir: Path, workers: int = 4, version: str = "v1") -> Dict[str, Any]:
+    vectors_dir = protocol_dir / "test-vectors" / version
+    bundles_dir = vectors_dir / "bundles"
+    expected_dir = vectors_dir / "expected"
+    sums_file = vectors_dir / "SHA256SUMS"
+    for required in (bundles_dir, expected_dir, sums_file):
+        if not required.exists():
+            raise RuntimeError(f"protocol vectors incomplete: missing {required}")
+
+    t0 = time.perf_counter()
+    sums = parse_sha256sums(sums_file)
+    sum_errors = check_sha256sums(vectors_dir, sums, workers)
+    checksum_seconds = time.perf_counter() - t0
+
+    names = sorted(p.stem for p in expected_dir.glob("*.json"))
+    expected = {n: json.loads((expected_dir / f"{n}.json").read_text("utf-8")) for n in names}
+
+    def run(name: str) -> VectorResult:
+        rel = f"bundles/{name}.zip"
+        bundle = bundles_dir / f"{name}.zip"
+        if not bundle.is_file():
+            return VectorResult(
+                name=name,
+                ok=False,
+                exit_code=2,
+                expected_exit_code=-1,
+                reason_ids=[],
+                expected_reason_ids=[],
+                seconds=0.0,
+                problems=[f"{name}: missing bundle {bundle}"],
+            )
+        err = sum_errors.get(rel, "missing from SHA256SUMS")
+        return _run_vector(verifier, name, bundle, expected[name], err)
+
+    with Verifier() as verifier, ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="oord-conformance"
+    ) as pool:
+        results = list(pool.map(run, names))
+
+    failed = [r for r in results if not r.ok]
+    # Checksum failures for files that are not vector bundles (e.g. docs) still fail the run.
+    stray = sorted(f"{rel}: {err}" for rel, err in sum_errors.items() if err and not rel.startswith("bundles/"))
+    return {
+        "protocol_dir": str(protocol_dir),
+        "version": version,
+        "vectors": [r.as_dict() for r in results],
+        "checksum_errors": stray,
+        "passed": len(results) - len(failed),
+        "failed": len(failed),
+        "ok": not failed and not stray and bool(results),
+        "checksum_seconds": round(checksum_seconds, 6),
+        "seconds": round(time.perf_counter() - t0, 6),
+    }
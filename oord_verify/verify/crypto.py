@@ -1,6 +1,8 @@
 import hashlib
 import json
+import threading
 from base64 import urlsafe_b64decode
+from collections import OrderedDict
 from typing import Any, Dict, Optional, Tuple
 
 try:
@@ -9,6 +11,35 @@ except Exception:  # pragma: no cover
     Ed25519PublicKey = None  # type: ignore[assignment]
 
 
+class KeyRing:
+    # Parsed public keys by raw bytes, least recently used first. Keys come from the bundles themselves, so the ring
+    # is capped for long-lived verifiers.
+    def __init__(self, max_keys: int = 1024) -> None:
+        self.max_keys = max(1, int(max_keys))
+        self._keys: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, pub_bytes: bytes) -> Any:
+        with self._lock:
+            pub = self._keys.get(pub_bytes)
+            if pub is not None:
+                self._keys.move_to_end(pub_bytes)
+        if pub is None:
+            pub = Ed25519PublicKey.from_public_bytes(pub_bytes)
+            with self._lock:
+                self._keys[pub_bytes] = pub
+                self._keys.move_to_end(pub_bytes)
+                while len(self._keys) > self.max_keys:
+                    self._keys.popitem(last=False)
+        return pub
+
+
+def _load_public_key(pub_bytes: bytes, keyring: Optional[KeyRing]) -> Any:
+    if keyring is None:
+        return Ed25519PublicKey.from_public_bytes(pub_bytes)
+    return keyring.load(pub_bytes)
+
+
 def jwks_fingerprint(jwks: Dict[str, Any]) -> str:
     raw = json.dumps(jwks, sort_keys=True, separators=(",", ":")).encode("utf-8")
     return hashlib.sha256(raw).hexdigest()
@@ -24,7 +55,9 @@ def manifest_unsigned_bytes(manifest: Dict[str, Any]) -> bytes:
     return canonical_json_bytes(unsigned)
 
 
-def verify_manifest_signature(manifest: Dict[str, Any], jwks: Dict[str, Any]) -> Tuple[Optional[bool], Optional[str]]:
+def verify_manifest_signature(
+    manifest: Dict[str, Any], jwks: Dict[str, Any], keyring: Optional[KeyRing] = None
+) -> Tuple[Optional[bool], Optional[str]]:
     if Ed25519PublicKey is None:
         return None, None
 
@@ -52,7 +85,7 @@ def verify_manifest_signature(manifest: Dict[str, Any], jwks: Dict[str, Any]) ->
         return False, f"invalid JWKS x encoding for manifest key: {e!s}"
 
     try:
-        pub = Ed25519PublicKey.from_public_bytes(pub_bytes)
+        pub = _load_public_key(pub_bytes, keyring)
     except Exception as e:  # pragma: no cover
         return False, f"invalid Ed25519 public key bytes for manifest key: {e!s}"
 
@@ -76,6 +109,7 @@ def verify_tl_signature(
     sth_sig: Optional[str],
     jwks: Dict[str, Any],
     signer_kid: Optional[str],
+    keyring: Optional[KeyRing] = None,
 ) -> Tuple[Optional[bool], Optional[str]]:
     if merkle_root is None or seq is None or not sth_sig or not signer_kid or Ed25519PublicKey is None:
         return None, None
@@ -94,7 +128,7 @@ def verify_tl_signature(
 
     try:
         pub_bytes = urlsafe_b64decode(x_b64 + "===")
-        pub = Ed25519PublicKey.from_public_bytes(pub_bytes)
+        pub = _load_public_key(pub_bytes, keyring)
         sig_bytes = urlsafe_b64decode(sth_sig + "===")
     except Exception as e:  # pragma: no cover
         return False, f"invalid JWKS/sig encoding: {e!s}"
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(RuntimeError):
+    def __init__(self, stage: str, timeout_s: float) -> None:
+        super().__init__(f"verification exceeded its {timeout_s:g}s deadline during {stage}")
+        self.stage = stage
+        self.timeout_s = timeout_s
+
+
+class Deadline:
+    def __init__(self, timeout_s: float) -> None:
+        self.timeout_s = float(timeout_s)
+        self.expires_at = time.monotonic() + self.timeout_s
+        # Last stage checked; I/O helpers that do not know the caller's stage report a timeout against it.
+        self.stage = "open"
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def cap(self, timeout_s: float) -> float:
+        return max(0.001, min(timeout_s, self.remaining()))
+
+    def check(self, stage: str) -> None:
+        self.stage = stage
+        if self.expired():
+            raise DeadlineExceeded(stage, self.timeout_s)
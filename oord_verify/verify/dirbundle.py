@@ -0,0 +1,177 @@
+import hashlib
+import os
+import queue
+import stat
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from oord_verify.verify.zipio import HASH_CHUNK_SIZE, ChunkCallback, Fingerprint
+
+# Files hashed concurrently ahead of the verifier; local NVMe only reaches full bandwidth with several reads in flight.
+HASH_WORKERS = 8
+_AHEAD_PER_WORKER = 4
+# How often digest() calls on_chunk(0) while a pool worker has not reported a chunk, so the deadline is still checked.
+_POLL_S = 0.05
+
+
+def _raise(e: OSError) -> None:
+    raise e
+
+
+def walk_members(root: Path) -> Dict[str, int]:
+    # Regular files only, keyed by their bundle-relative "/" path; symlinks are never followed, so a member name can
+    # only resolve to a file inside root.
+    sizes: Dict[str, int] = {}
+    for dirpath, dirnames, filenames in os.walk(root, onerror=_raise):
+        dirnames.sort()
+        rel = os.path.relpath(dirpath, root)
+        prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+        for fn in sorted(filenames):
+            st = os.lstat(os.path.join(dirpath, fn))
+            if stat.S_ISREG(st.st_mode):
+                sizes[prefix + fn] = st.st_size
+    return sizes
+
+
+def _file_digest(
+    path: str, on_chunk: Optional[ChunkCallback] = None, cancel: Optional[threading.Event] = None
+) -> Tuple[str, int]:
+    # A set cancel event stops the read at the next chunk; the partial result is never used.
+    with open(path, "rb", buffering=0) as f:
+        if on_chunk is None and cancel is None:
+            h = hashlib.file_digest(f, "sha256")
+            return h.hexdigest(), f.tell()
+        h = hashlib.sha256()
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        size = 0
+        while cancel is None or not cancel.is_set():
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+            size += n
+            if on_chunk is not None:
+                on_chunk(n)
+        return h.hexdigest(), size
+
+
+class _Job:
+    # A member being hashed on the pool. The worker posts each chunk's size to chunks and None when it stops, so the
+    # caller can report progress and check its deadline per chunk from its own thread.
+    def __init__(self) -> None:
+        self.chunks: "queue.SimpleQueue[Optional[int]]" = queue.SimpleQueue()
+        self.future: Optional["Future[Tuple[str, int]]"] = None
+
+    def run(self, path: str, cancel: threading.Event) -> Tuple[str, int]:
+        try:
+            return _file_digest(path, self.chunks.put, cancel)
+        finally:
+            self.chunks.put(None)
+
+
+class DirBundle:
+    # An extracted bundle: the same members as the ZIP, read straight from disk with no inflate. Scheduled members
+    # are hashed on a thread pool ahead of the caller; their chunks are reported to on_chunk when the caller collects
+    # the digest, and an exception from on_chunk (deadline, budget) or close() stops the workers at the next chunk.
+    def __init__(self, root: Path, workers: int = HASH_WORKERS) -> None:
+        self.root = root
+        self.workers = max(1, int(workers))
+        self._sizes = walk_members(root)
+        self._queue: Deque[str] = deque()
+        self._pending: Dict[str, _Job] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cancel = threading.Event()
+
+    def __enter__(self) -> "DirBundle":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._queue.clear()
+        self._pending.clear()
+        if self._executor is not None:
+            # The verifier may stop early (mismatch limit, budget, deadline); hashes not yet started are dropped and
+            # running ones stop at their next chunk without being waited for.
+            self._cancel.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _path(self, name: str) -> str:
+        if name not in self._sizes:
+            raise KeyError(name)
+        return os.path.join(self.root, *name.split("/"))
+
+    def namelist(self) -> List[str]:
+        return list(self._sizes)
+
+    def entries(self) -> Iterator[Tuple[str, int, int]]:
+        return ((name, size, size) for name, size in self._sizes.items())
+
+    def info(self, name: str) -> Tuple[int, int]:
+        size = self._sizes[name]
+        return size, size
+
+    def fingerprint(self, name: str) -> Optional[Fingerprint]:
+        # There is no central directory to compare against a baseline, so nothing is carried over.
+        if name not in self._sizes:
+            raise KeyError(name)
+        return None
+
+    def read(self, name: str) -> bytes:
+        try:
+            with open(self._path(name), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise KeyError(name)
+
+    def schedule(self, names: List[str]) -> List[str]:
+        if self.workers > 1:
+            self._queue.extend(n for n in names if n in self._sizes and n not in self._pending)
+            self._fill()
+        return list(names)
+
+    def _fill(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="oord-verify-read")
+        limit = self.workers * _AHEAD_PER_WORKER
+        while self._queue and len(self._pending) < limit:
+            name = self._queue.popleft()
+            if name not in self._pending:
+                job = _Job()
+                job.future = self._executor.submit(job.run, self._path(name), self._cancel)
+                self._pending[name] = job
+
+    def digest(self, name: str, on_chunk: Optional[ChunkCallback] = None) -> Tuple[str, int]:
+        path = self._path(name)
+        job = self._pending.pop(name, None)
+        try:
+            if job is None:
+                return _file_digest(path, on_chunk)
+            self._fill()
+            self._collect(job, on_chunk)
+            assert job.future is not None
+            return job.future.result()
+        except FileNotFoundError:
+            raise KeyError(name)
+
+    def _collect(self, job: _Job, on_chunk: Optional[ChunkCallback]) -> None:
+        try:
+            while True:
+                try:
+                    n = job.chunks.get(timeout=_POLL_S)
+                except queue.Empty:
+                    n = 0
+                if n is None:
+                    return
+                if on_chunk is not None:
+                    on_chunk(n)
+        except BaseException:
+            # The bundle is abandoned; nothing still queued or running is worth finishing.
+            self._cancel.set()
+            raise
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import http.client
+import io
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from oord_verify.verify.deadline import Deadline, DeadlineExceeded
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+)")
+
+
+class HTTPRangeError(OSError):
+    pass
+
+
+class HTTPRangeFile(io.RawIOBase):
+    def __init__(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout_s: float = 30.0,
+        tail_size: int = 64 * 1024,
+        min_fetch: int = 64 * 1024,
+        max_fetch: int = 8 * 1024 * 1024,
+        max_segments: int = 4,
+        prefetch: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> None:
+        super().__init__()
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise HTTPRangeError(f"unsupported bundle URL: {url!r}")
+        self.url = url
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._headers = dict(headers or {})
+        self._timeout_s = timeout_s
+        self._deadline = deadline
+        self._min_fetch = min_fetch
+        self._max_fetch = max_fetch
+        self._max_segments = max_segments
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns: List[http.client.HTTPConnection] = []
+        self._segments: List[Tuple[int, bytes]] = []
+        self._window = min_fetch
+        self._last_end = -1
+        self._pending: Optional[Tuple[int, Future[bytes]]] = None
+        self._pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self._pos = 0
+
+        self.requests = 0
+        self.bytes_fetched = 0
+
+        start, tail, size = self._get(f"bytes=-{int(tail_size)}")
+        self.size = size
+        if tail:
+            self._segments.append((start, tail))
+
+    def _conn(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            conn = cls(self._netloc, timeout=self._timeout_s)
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def _get(self, range_value: str) -> Tuple[int, bytes, int]:
+        headers = dict(self._headers)
+        headers["Range"] = range_value
+        timeout_s = self._timeout_s
+        if self._deadline is not None:
+            self._deadline.check(self._deadline.stage)
+            timeout_s = self._deadline.cap(timeout_s)
+        for attempt in (0, 1):
+            conn = self._conn()
+            conn.timeout = timeout_s
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout_s)
+            try:
+                conn.request("GET", self._target, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                self._local.conn = None
+                if self._deadline is not None and self._deadline.expired():
+                    raise DeadlineExceeded(self._deadline.stage, self._deadline.timeout_s) from e
+                if attempt:
+                    raise HTTPRangeError(f"GET {self.url} failed: {e}") from e
+        if resp.will_close:
+            conn.close()
+            self._local.conn = None
+
+        with self._lock:
+            self.requests += 1
+            self.bytes_fetched += len(body)
+
+        if resp.status == 416:
+            return 0, b"", 0
+        if resp.status != 206:
+            raise HTTPRangeError(f"GET {self.url} returned http {resp.status} (range requests required)")
+        m = _CONTENT_RANGE.match(resp.getheader("Content-Range") or "")
+        if not m:
+            raise HTTPRangeError(f"GET {self.url} returned an invalid Content-Range header")
+        start, end, size = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        if len(body) != end - start + 1:
+            raise HTTPRangeError(f"GET {self.url} returned a short body for {range_value}")
+        return start, body, size
+
+    def _fetch(self, start: int, length: int) -> bytes:
+        end = min(self.size, start + length) - 1
+        if end < start:
+            return b""
+        got_start, body, _ = self._get(f"bytes={start}-{end}")
+        if got_start != start:
+            raise HTTPRangeError(f"GET {self.url} returned an unexpected range start")
+        return body
+
+    def _remember(self, start: int, data: bytes) -> None:
+        self._segments.append((start, data))
+        if len(self._segments) > self._max_segments:
+            # The first segment is the archive tail (central directory); keep it.
+            del self._segments[1]
+
+    def _lookup(self, pos: int) -> Optional[Tuple[int, bytes]]:
+        for seg in reversed(self._segments):
+            if seg[0] <= pos < seg[0] + len(seg[1]):
+                return seg
+        return None
+
+    def _load(self, pos: int, want: int) -> None:
+        if self._pending is not None and self._pending[0] == pos:
+            data = self._pending[1].result()
+            self._pending = None
+            self._window = min(self._window * 2, self._max_fetch)
+        else:
+            if self._pending is not None:
+                self._pending[1].cancel()
+                self._pending = None
+            if pos == self._last_end:
+                self._window = min(self._window * 2, self._max_fetch)
+            else:
+                self._window = self._min_fetch
+            data = self._fetch(pos, max(want, self._window))
+        self._remember(pos, data)
+        self._last_end = pos + len(data)
+
+        if self._pool is not None and self._window > self._min_fetch and self._last_end < self.size:
+            nxt = self._last_end
+            self._pending = (nxt, self._pool.submit(self._fetch, nxt, self._window))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence {whence}")
+        if pos < 0:
+            raise ValueError("negative seek position")
+        self._pos = pos
+        return pos
+
+    def read(self, n: int = -1) -> bytes:
+        if n is None or n < 0:
+            n = self.size - self._pos
+        n = max(0, min(n, self.size - self._pos))
+        parts: List[bytes] = []
+        while n > 0:
+            seg = self._lookup(self._pos)
+            if seg is None:
+                self._load(self._pos, n)
+                continue
+            off = self._pos - seg[0]
+            chunk = seg[1][off : off + n]
+            parts.append(chunk)
+            self._pos += len(chunk)
+            n -= len(chunk)
+        return b"".join(parts)
+
+    def readinto(self, b) -> int:  # type: ignore[no-untyped-def]
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        for conn in self._conns:
+            conn.close()
+        super().close()
@@ -68,6 +68,25 @@ def print_human(summary: Dict[str, Any], ok: bool, verbose: bool) -> None:
     if summary.get("hashes_ok") is False:
         for m in summary.get("hash_mismatches", []):
             print(f"  mismatch={m}")
+        counts = summary.get("hash_mismatch_counts")
+        if isinstance(counts, dict) and counts:
+            counts_s = ",".join(f"{k}:{v}" for k, v in sorted(counts.items()))
+            print(f"  mismatch_counts={counts_s} truncated={summary.get('hash_mismatches_truncated')}")
+    sampling = summary.get("sampling")
+    if isinstance(sampling, dict):
+        detect = sampling.get("detection_probability") or {}
+        print(
+            f"sampling seed={sampling.get('seed')} "
+            f"members={sampling.get('members_sampled')}/{sampling.get('members_total')} "
+            f"bytes={sampling.get('bytes_sampled')}/{sampling.get('bytes_total')} "
+            f"p_detect_one={detect.get('one_member', 0.0):.3f}"
+        )
+    delta = summary.get("delta")
+    if isinstance(delta, dict):
+        print(
+            f"delta baseline={delta.get('baseline')} carried_over={delta.get('carried_over')} "
+            f"rehashed={delta.get('rehashed')}"
+        )
 
     merkle = summary.get("merkle", {})
     if isinstance(merkle, dict):
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Optional, Tuple
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    try:
+        i_s, n_s = spec.split("/", 1)
+        index, count = int(i_s), int(n_s)
+    except ValueError:
+        raise ValueError(f"invalid shard {spec!r} (expected I/N, e.g. 3/16)")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"invalid shard {spec!r} (I must be between 1 and N)")
+    return index, count
+
+
+def shard_of(key: str, count: int) -> int:
+    # Stable across machines and Python runs (unlike hash()), so every host computes the same partition.
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def in_shard(key: str, index: int, count: int) -> bool:
+    return count == 1 or shard_of(key, count) == index
+
+
+def load_journal(path: Path) -> Dict[str, Dict[str, Any]]:
+    records: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-append leaves at most one torn trailing line; that bundle is simply redone.
+                continue
+            if isinstance(rec, dict) and isinstance(rec.get("bundle"), str) and isinstance(rec.get("result"), dict):
+                records[rec["bundle"]] = rec
+    return records
+
+
+def merge_journals(paths: Iterable[Path]) -> Dict[str, Dict[str, Any]]:
+    merged: Dict[str, Dict[str, Any]] = {}
+    for p in paths:
+        merged.update(load_journal(p))
+    return dict(sorted(merged.items()))
+
+
+class Journal:
+    def __init__(self, path: Path, fsync: bool = True) -> None:
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._f: Optional[BinaryIO] = None
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def append(self, bundle: str, ok: bool, result: Dict[str, Any]) -> None:
+        line = (json.dumps({"bundle": bundle, "ok": ok, "result": result}, sort_keys=True) + "\n").encode("utf-8")
+        with self._lock:
+            if self._f is None:
+                self._f = self.path.open("ab+")
+                if self._f.tell():
+                    self._f.seek(-1, os.SEEK_END)
+                    if self._f.read(1) != b"\n":
+                        self._f.write(b"\n")
+            self._f.write(line)
+            self._f.flush()
+            if self.fsync:
+                os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._f is not None:
+                self._f.close()
+                self._f = None
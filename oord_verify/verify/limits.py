@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+# Highly compressible small members (JSON, sparse text) are legitimate; only
+# judge the compression ratio once a member inflates past this size.
+RATIO_MIN_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Budgets:
+    max_members: Optional[int] = None
+    max_total_bytes: Optional[int] = None
+    max_ratio: Optional[float] = None
+    max_manifest_bytes: Optional[int] = None
+    max_orphan_bytes: Optional[int] = None
+
+    def enabled(self) -> bool:
+        return any(
+            v is not None
+            for v in (
+                self.max_members,
+                self.max_total_bytes,
+                self.max_ratio,
+                self.max_manifest_bytes,
+                self.max_orphan_bytes,
+            )
+        )
+
+
+class BudgetExceeded(RuntimeError):
+    # at_least: actual is only a lower bound, because checking stopped at the breach (members of a stream).
+    def __init__(
+        self,
+        reason_id: str,
+        message: str,
+        limit: Union[int, float],
+        actual: Union[int, float],
+        at_least: bool = False,
+    ) -> None:
+        super().__init__(message)
+        self.reason_id = reason_id
+        self.limit = limit
+        self.actual = actual
+        self.at_least = at_least
+
+
+def _ratio_exceeded(budgets: Budgets, name: str, compressed: int, uncompressed: int) -> None:
+    if budgets.max_ratio is None or uncompressed <= RATIO_MIN_BYTES:
+        return
+    ratio = uncompressed / compressed if compressed > 0 else float("inf")
+    if ratio > budgets.max_ratio:
+        raise BudgetExceeded(
+            "BUDGET_COMPRESSION_RATIO",
+            f"{name}: compression ratio {ratio:.1f} exceeds budget {budgets.max_ratio}",
+            budgets.max_ratio,
+            ratio,
+        )
+
+
+def check_manifest_size(budgets: Budgets, size: int) -> None:
+    if budgets.max_manifest_bytes is not None and size > budgets.max_manifest_bytes:
+        raise BudgetExceeded(
+            "BUDGET_MANIFEST_SIZE",
+            f"manifest.json is {size} bytes, budget is {budgets.max_manifest_bytes}",
+            budgets.max_manifest_bytes,
+            size,
+        )
+
+
+def check_entries(budgets: Budgets, entries: Iterable[Tuple[str, int, int]]) -> None:
+    count = 0
+    total = 0
+    for name, compressed, uncompressed in entries:
+        count += 1
+        total += uncompressed
+        if budgets.max_members is not None and count > budgets.max_members:
+            # Only counted from here on, so the breach below reports the real member count.
+            continue
+        _ratio_exceeded(budgets, name, compressed, uncompressed)
+        if name == "manifest.json":
+            check_manifest_size(budgets, uncompressed)
+    if budgets.max_members is not None and count > budgets.max_members:
+        raise BudgetExceeded(
+            "BUDGET_MEMBER_COUNT",
+            f"bundle has {count} members, budget is {budgets.max_members}",
+            budgets.max_members,
+            count,
+        )
+    if budgets.max_total_bytes is not None and total > budgets.max_total_bytes:
+        raise BudgetExceeded(
+            "BUDGET_TOTAL_BYTES",
+            f"bundle declares {total} decompressed bytes, budget is {budgets.max_total_bytes}",
+            budgets.max_total_bytes,
+            total,
+        )
+
+
+def check_orphans(budgets: Budgets, declared_bytes: int) -> None:
+    if budgets.max_orphan_bytes is not None and declared_bytes > budgets.max_orphan_bytes:
+        raise BudgetExceeded(
+            "BUDGET_ORPHAN_BYTES",
+            f"{declared_bytes} bytes of unlisted files/ members, budget is {budgets.max_orphan_bytes}",
+            budgets.max_orphan_bytes,
+            declared_bytes,
+        )
+
+
+class BudgetMeter:
+    def __init__(self, budgets: Budgets) -> None:
+        self.budgets = budgets
+        self.members = 0
+        self.total_bytes = 0
+        self.orphan_bytes = 0
+        self._lock = threading.Lock()
+
+    def add_member(self) -> None:
+        with self._lock:
+            self.members += 1
+            count = self.members
+        if self.budgets.max_members is not None and count > self.budgets.max_members:
+            raise BudgetExceeded(
+                "BUDGET_MEMBER_COUNT",
+                f"bundle has more than {self.budgets.max_members} members",
+                self.budgets.max_members,
+                count,
+                at_least=True,
+            )
+
+    def counter(self, name: str, compressed: Callable[[], int], orphan: bool = False) -> Callable[[int], None]:
+        seen = 0
+
+        def on_chunk(n: int) -> None:
+            nonlocal seen
+            seen += n
+            with self._lock:
+                self.total_bytes += n
+                total = self.total_bytes
+                if orphan:
+                    self.orphan_bytes += n
+                orphans = self.orphan_bytes
+            b = self.budgets
+            if b.max_total_bytes is not None and total > b.max_total_bytes:
+                raise BudgetExceeded(
+                    "BUDGET_TOTAL_BYTES",
+                    f"decompressed more than {b.max_total_bytes} bytes",
+                    b.max_total_bytes,
+                    total,
+                )
+            if orphan and b.max_orphan_bytes is not None and orphans > b.max_orphan_bytes:
+                raise BudgetExceeded(
+                    "BUDGET_ORPHAN_BYTES",
+                    f"hashed more than {b.max_orphan_bytes} bytes of unlisted files/ members",
+                    b.max_orphan_bytes,
+                    orphans,
+                )
+            if name == "manifest.json":
+                check_manifest_size(b, seen)
+            _ratio_exceeded(b, name, compressed(), seen)
+
+        return on_chunk
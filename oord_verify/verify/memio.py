@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import io
+from typing import Any, Optional
+
+
+class BufferFile(io.RawIOBase):
+    # A seekable, read-only file over any buffer-protocol object (bytes, bytearray, mmap, shared memory). read()
+    # copies like any file; view() hands out slices of the caller's buffer, which MemberReader uses for payload data.
+    def __init__(self, buf: Any) -> None:
+        super().__init__()
+        view = memoryview(buf)
+        if view.ndim != 1 or view.format != "B":
+            view = view.cast("B")
+        self._buf = view
+        self.size = len(view)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if pos < 0:
+            raise ValueError("negative seek position")
+        self._pos = pos
+        return pos
+
+    def view(self, pos: int, n: int) -> memoryview:
+        return self._buf[pos : pos + n]
+
+    def read(self, n: Optional[int] = -1) -> bytes:
+        end = self.size if n is None or n < 0 else min(self.size, self._pos + n)
+        out = bytes(self._buf[self._pos : end]) if end > self._pos else b""
+        self._pos = max(self._pos, end)
+        return out
+
+    def readinto(self, b: Any) -> int:
+        out = memoryview(b).cast("B")
+        n = max(0, min(len(out), self.size - self._pos))
+        out[:n] = self._buf[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            # Let the caller close or unlink shared memory once verification is done.
+            self._buf.release()
+        super().close()
@@ -1,10 +1,56 @@
 import hashlib
-from typing import Dict, List, Tuple
+import heapq
+import struct
+import tempfile
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from oord_verify.verify.deadline import Deadline
 
-def compute_merkle_root_from_manifest_files(files: List[Dict[str, object]]) -> str:
-    entries: List[Tuple[str, bytes]] = []
+# Manifests with more entries than this that are not already path-sorted are sorted on disk in runs of this size.
+EXTERNAL_SORT_THRESHOLD = 1_000_000
+_DEADLINE_EVERY = 1 << 16
+_RECORD = struct.Struct("<I32s")
 
+
+class MerkleBuilder:
+    # Consumes leaves left to right and keeps one pending node per level, so memory is O(log n). A level with an
+    # odd node count promotes its last node unchanged, exactly as the level-by-level construction does.
+    def __init__(self) -> None:
+        self._pending: List[Optional[bytes]] = []
+        self.count = 0
+
+    def add(self, digest: bytes) -> None:
+        node = hashlib.sha256(b"leaf:" + digest).digest()
+        self.count += 1
+        pending = self._pending
+        level = 0
+        while level < len(pending):
+            left = pending[level]
+            if left is None:
+                break
+            node = hashlib.sha256(b"node:" + left + node).digest()
+            pending[level] = None
+            level += 1
+        if level == len(pending):
+            pending.append(node)
+        else:
+            pending[level] = node
+
+    def root(self) -> bytes:
+        if not self.count:
+            raise ValueError("cannot compute Merkle root for empty file list")
+        carry: Optional[bytes] = None
+        for node in self._pending:
+            if node is not None and carry is not None:
+                carry = hashlib.sha256(b"node:" + node + carry).digest()
+            elif node is not None:
+                carry = node
+        assert carry is not None
+        return carry
+
+
+def _leaves(files: Iterable[Dict[str, object]]) -> Iterator[Tuple[str, bytes]]:
     for fe in files:
         if not isinstance(fe, dict):
             raise ValueError("files entries must be objects")
@@ -22,31 +68,72 @@ def compute_merkle_root_from_manifest_files(files: List[Dict[str, object]]) -> s
             digest = bytes.fromhex(h)
         except ValueError:
             raise ValueError("sha256 must be valid hex")
-        entries.append((path, digest))
-
-    if not entries:
-        raise ValueError("cannot compute Merkle root for empty file list")
-
-    entries.sort(key=lambda item: item[0])
-
-    level: List[bytes] = []
-    for _, digest in entries:
-        level.append(hashlib.sha256(b"leaf:" + digest).digest())
-
-    while len(level) > 1:
-        next_level: List[bytes] = []
-        i = 0
-        n = len(level)
-        while i < n:
-            left = level[i]
-            if i + 1 < n:
-                right = level[i + 1]
-                i += 2
-                node = hashlib.sha256(b"node:" + left + right).digest()
-            else:
-                i += 1
-                node = left
-            next_level.append(node)
-        level = next_level
-
-    return "cid:sha256:" + level[0].hex()
+        yield path, digest
+
+
+def _write_run(run: List[Tuple[str, bytes]]) -> BinaryIO:
+    f = tempfile.TemporaryFile("w+b")
+    for path, digest in run:
+        raw = path.encode("utf-8", "surrogatepass")
+        f.write(_RECORD.pack(len(raw), digest))
+        f.write(raw)
+    f.seek(0)
+    return f
+
+
+def _read_run(f: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+    while True:
+        head = f.read(_RECORD.size)
+        if not head:
+            return
+        n, digest = _RECORD.unpack(head)
+        yield f.read(n).decode("utf-8", "surrogatepass"), digest
+
+
+def external_sort(
+    leaves: Iterable[Tuple[str, bytes]], run_size: int = EXTERNAL_SORT_THRESHOLD
+) -> Iterator[Tuple[str, bytes]]:
+    # Sorted runs are spilled to temp files and merged; runs keep manifest order and the merge is stable, so
+    # duplicate paths come out in the same order as an in-memory stable sort.
+    runs: List[BinaryIO] = []
+    try:
+        it = iter(leaves)
+        while True:
+            run = list(islice(it, run_size))
+            if not run:
+                break
+            run.sort(key=lambda item: item[0])
+            runs.append(_write_run(run))
+        yield from heapq.merge(*(_read_run(f) for f in runs), key=lambda item: item[0])
+    finally:
+        for f in runs:
+            f.close()
+
+
+def _sorted_leaves(files: List[Dict[str, object]]) -> Iterator[Tuple[str, bytes]]:
+    if len(files) > EXTERNAL_SORT_THRESHOLD:
+        return external_sort(_leaves(files))
+    return iter(sorted(_leaves(files), key=lambda item: item[0]))
+
+
+def _build(leaves: Iterable[Tuple[str, bytes]], deadline: Optional[Deadline]) -> Tuple[MerkleBuilder, bool]:
+    # Returns the builder and whether the leaves arrived in path order; stops feeding at the first out-of-order path.
+    builder = MerkleBuilder()
+    prev: Optional[str] = None
+    for path, digest in leaves:
+        if prev is not None and path < prev:
+            return builder, False
+        prev = path
+        builder.add(digest)
+        if deadline is not None and builder.count % _DEADLINE_EVERY == 0:
+            deadline.check("merkle")
+    return builder, True
+
+
+def compute_merkle_root_from_manifest_files(files: List[Dict[str, object]], deadline: Optional[Deadline] = None) -> str:
+    builder, in_order = _build(_leaves(files), deadline)
+    if not in_order:
+        # Validation errors are still raised for the first bad entry in manifest order: the sort pass re-reads
+        # every entry from the start.
+        builder, _ = _build(_sorted_leaves(files), deadline)
+    return "cid:sha256:" + builder.root().hex()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterator, Optional, Tuple
+
+from oord_verify.verify.deadline import Deadline, DeadlineExceeded
+
+_POLL_S = 0.1
+_DONE = object()
+
+
+def prefetch(chunks: Iterator[bytes], depth: int, deadline: Optional[Deadline] = None) -> Iterator[bytes]:
+    # A reader thread drives `chunks` (file or HTTP reads plus inflate, which release the GIL) while the caller
+    # hashes; the bounded queue caps chunks in flight at `depth` and blocks the reader when the hasher falls behind.
+    q: "queue.Queue[Tuple[object, Optional[BaseException]]]" = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def put(item: object, error: Optional[BaseException] = None) -> bool:
+        while not stop.is_set():
+            try:
+                q.put((item, error), timeout=_POLL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(None, e)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    reader = threading.Thread(target=produce, name="oord-verify-read", daemon=True)
+    reader.start()
+    timed_out = False
+    try:
+        while True:
+            try:
+                item, error = q.get(timeout=_POLL_S)
+            except queue.Empty:
+                if deadline is not None:
+                    deadline.check("hashes")
+                continue
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item  # type: ignore[misc]
+    except DeadlineExceeded:
+        timed_out = True
+        raise
+    finally:
+        # The consumer may stop early (budget, deadline or mismatch limit); unblock and retire the reader. Past the
+        # deadline a reader stuck in a slow read is not waited for; it is a daemon and exits at its next put().
+        stop.set()
+        reader.join(_POLL_S if timed_out else None)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Stage labels per thread, only maintained while a Profiler is running so verification pays nothing otherwise.
+_stages: Dict[int, str] = {}
+_active = 0
+# Helper threads inherit a label from their name.
+_THREAD_STAGES = {"oord-verify-read": "hashes", "oord-progress": "progress"}
+_MAX_DEPTH = 128
+
+
+def set_stage(stage: Optional[str]) -> None:
+    if not _active:
+        return
+    if stage is None:
+        _stages.pop(threading.get_ident(), None)
+    else:
+        _stages[threading.get_ident()] = stage
+
+
+def staged(stage: str, fn: Callable[..., T], *args: Any) -> T:
+    set_stage(stage)
+    try:
+        return fn(*args)
+    finally:
+        set_stage(None)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Profiler:
+    # cProfile covers the calling thread in full detail; a sampler thread snapshots every thread's stack each
+    # `interval_s` and files it under the thread's current verification stage, which is what the flame graph shows.
+    def __init__(self, out: Path, mode: str = "cprofile", interval_s: float = 0.005) -> None:
+        if mode not in ("cprofile", "sample"):
+            raise ValueError(f"unknown profile mode {mode!r} (expected cprofile or sample)")
+        self.out = out
+        self.mode = mode
+        self.interval_s = interval_s
+        self.samples: "Counter[Tuple[str, ...]]" = Counter()
+        self.written: List[Path] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "Profiler":
+        global _active
+        _active += 1
+        self._thread = threading.Thread(target=self._sample_loop, name="oord-profile", daemon=True)
+        self._thread.start()
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        global _active
+        if self._profile is not None:
+            self._profile.disable()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        _active -= 1
+        if not _active:
+            _stages.clear()
+        self.write()
+
+    def _sample_loop(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval_s):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for tid, frame in sys._current_frames().items():
+                if tid == me:
+                    continue
+                name = names.get(tid, "")
+                stage = _stages.get(tid) or _THREAD_STAGES.get(name.rsplit("_", 1)[0]) or "idle"
+                stack: List[str] = []
+                f: Optional[FrameType] = frame
+                while f is not None and len(stack) < _MAX_DEPTH:
+                    stack.append(_frame_label(f))
+                    f = f.f_back
+                stack.append(f"stage:{stage}")
+                self.samples[tuple(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        # Brendan Gregg's collapsed-stack format: "root;child;leaf count", one stack per line.
+        return "".join(f"{';'.join(stack)} {n}\n" for stack, n in sorted(self.samples.items()))
+
+    def stage_totals(self) -> Dict[str, int]:
+        totals: "Counter[str]" = Counter()
+        for stack, n in list(self.samples.items()):
+            totals[stack[0][len("stage:") :]] += n
+        return dict(totals)
+
+    def write(self) -> None:
+        self.out.parent.mkdir(parents=True, exist_ok=True)
+        folded = self.out.with_name(self.out.name + ".folded")
+        folded.write_text(self.folded(), encoding="utf-8")
+        self.written = [folded]
+        if self._profile is not None:
+            pstats = self.out.with_name(self.out.name + ".pstats")
+            self._profile.dump_stats(str(pstats))
+            self.written.append(pstats)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Any, Optional, TextIO
+
+
+def _fmt_eta(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    s = int(seconds)
+    return f"{s // 3600}:{s // 60 % 60:02d}:{s % 60:02d}"
+
+
+class Progress:
+    # Counters are bumped from the hashing loop (one lock round-trip per 1 MiB chunk); a ticker thread owns all
+    # rendering, so stalls still show up as 0 MB/s instead of a frozen line.
+    def __init__(
+        self,
+        total_bundles: Optional[int] = None,
+        stream: Optional[TextIO] = None,
+        interval_s: Optional[float] = None,
+        tty: Optional[bool] = None,
+    ) -> None:
+        self.stream = stream if stream is not None else sys.stderr
+        self.tty = self.stream.isatty() if tty is None else tty
+        self.interval_s = interval_s if interval_s is not None else (0.5 if self.tty else 10.0)
+        self.total_bundles = total_bundles
+        self.bundles = 0
+        self.files = 0
+        self.bytes = 0
+        self.expected_bytes = 0
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._last = (self._start, 0, 0)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._width = 0
+
+    def __enter__(self) -> "Progress":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="oord-progress", daemon=True)
+            self._thread.start()
+
+    def expect(self, n: int) -> None:
+        with self._lock:
+            self.expected_bytes += n
+
+    def add_bytes(self, n: int) -> None:
+        with self._lock:
+            self.bytes += n
+
+    def file_done(self) -> None:
+        with self._lock:
+            self.files += 1
+
+    def bundle_done(self) -> None:
+        with self._lock:
+            self.bundles += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            self.render()
+
+    def line(self, now: Optional[float] = None) -> str:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bundles, files, nbytes, expected = self.bundles, self.files, self.bytes, self.expected_bytes
+            last_t, last_bytes, last_files = self._last
+            self._last = (now, nbytes, files)
+        dt = max(now - last_t, 1e-9)
+        mb_s = (nbytes - last_bytes) / dt / 1e6
+        files_s = (files - last_files) / dt
+        elapsed = now - self._start
+
+        eta: Optional[float] = None
+        if self.total_bundles and self.total_bundles > 1 and bundles:
+            eta = elapsed / bundles * (self.total_bundles - bundles)
+        elif expected > nbytes and nbytes:
+            eta = (expected - nbytes) / (nbytes / max(elapsed, 1e-9))
+
+        total = self.total_bundles if self.total_bundles is not None else "-"
+        if self.tty:
+            return (
+                f"bundles {bundles}/{total}  {nbytes / 1e6:.1f} MB hashed  {mb_s:.1f} MB/s  "
+                f"{files_s:.0f} files/s  ETA {_fmt_eta(eta)}"
+            )
+        return (
+            f"progress bundles={bundles}/{total} bytes={nbytes} mb_s={mb_s:.1f} files_s={files_s:.1f} "
+            f"eta_s={int(eta) if eta is not None else '-'} elapsed_s={elapsed:.1f}"
+        )
+
+    def render(self, final: bool = False) -> None:
+        text = self.line()
+        try:
+            if self.tty:
+                pad = max(0, self._width - len(text))
+                self._width = len(text)
+                self.stream.write("\r" + text + " " * pad + ("\n" if final else ""))
+            else:
+                self.stream.write(text + "\n")
+            self.stream.flush()
+        except (OSError, ValueError):
+            # A closed or broken stderr must never fail the verification itself.
+            self._stop.set()
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.render(final=True)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Tuple
+
+ENV_REASON_IDS = {
+    "TL_ONLINE_UNREACHABLE",
+    "TL_ONLINE_UNAUTHORIZED",
+    "TL_ONLINE_BAD_RESPONSE",
+    "ENV_NOTARY_URL_MISSING",
+    "TIMEOUT",
+}
+
+
+def is_env_failure(summary: Dict[str, Any]) -> bool:
+    if summary.get("error_kind") == "env":
+        return True
+    rids = summary.get("reason_ids")
+    if not isinstance(rids, list):
+        return False
+    for r in rids:
+        if not isinstance(r, str):
+            continue
+        if r.startswith("ENV_"):
+            return True
+        if r in ENV_REASON_IDS:
+            return True
+    return False
+
+
+def _bytes_verified(summary: Dict[str, Any]) -> int:
+    if summary.get("hashes_ok") is not True:
+        return 0
+    # Members carried over from a delta baseline, or left out of a sample, were never hashed.
+    delta = summary.get("delta")
+    sampling = summary.get("sampling")
+    if isinstance(delta, dict):
+        n = delta.get("bytes_rehashed")
+    elif isinstance(sampling, dict):
+        n = sampling.get("bytes_sampled")
+    else:
+        batch = summary.get("batch")
+        n = batch.get("total_bytes") if isinstance(batch, dict) else None
+    return n if isinstance(n, int) else 0
+
+
+@dataclass(frozen=True, slots=True)
+class ResultRecord:
+    ok: bool
+    env: bool
+    reason_ids: Tuple[str, ...]
+    bytes_verified: int
+    payload: bytes
+
+    @classmethod
+    def from_summary(cls, ok: bool, summary: Dict[str, Any], keep_payload: bool = True) -> "ResultRecord":
+        # Without keep_payload the summary is not serialized, for callers that only aggregate or need the exit code.
+        rids = summary.get("reason_ids")
+        return cls(
+            ok=bool(ok),
+            env=not ok and is_env_failure(summary),
+            reason_ids=tuple(r for r in rids if isinstance(r, str)) if isinstance(rids, list) else (),
+            bytes_verified=_bytes_verified(summary),
+            payload=json.dumps(summary, separators=(",", ":")).encode("utf-8") if keep_payload else b"",
+        )
+
+    @property
+    def exit_code(self) -> int:
+        return 0 if self.ok else 2 if self.env else 1
+
+    def summary(self) -> Dict[str, Any]:
+        return json.loads(self.payload)
+
+
+@dataclass
+class Aggregate:
+    bundles: int = 0
+    passed: int = 0
+    failed: int = 0
+    env_failed: int = 0
+    bytes_verified: int = 0
+    reason_ids: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: ResultRecord) -> None:
+        self.bundles += 1
+        self.bytes_verified += record.bytes_verified
+        if record.ok:
+            self.passed += 1
+        else:
+            self.failed += 1
+            if record.env:
+                self.env_failed += 1
+        for rid in record.reason_ids:
+            self.reason_ids[rid] = self.reason_ids.get(rid, 0) + 1
+
+    @property
+    def exit_code(self) -> int:
+        if not self.failed:
+            return 0
+        return 2 if self.env_failed else 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "bundles": self.bundles,
+            "passed": self.passed,
+            "failed": self.failed,
+            "env_failed": self.env_failed,
+            "bytes_verified": self.bytes_verified,
+            "reason_ids": dict(sorted(self.reason_ids.items())),
+            "exit_code": self.exit_code,
+        }
+
+
+class ResultSpool:
+    # Records go to an anonymous temp file so a batch's output costs disk, not memory, until the exit code is known.
+    def __init__(self) -> None:
+        self._f = tempfile.TemporaryFile("w+b")
+        self.count = 0
+
+    def __enter__(self) -> "ResultSpool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def append(self, record: ResultRecord) -> None:
+        self._f.write((b"1" if record.ok else b"0") + record.payload + b"\n")
+        self.count += 1
+
+    def __iter__(self) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        self._f.flush()
+        self._f.seek(0)
+        for line in self._f:
+            yield line[:1] == b"1", json.loads(line[1:])
+        self._f.seek(0, 2)
+
+    def close(self) -> None:
+        self._f.close()
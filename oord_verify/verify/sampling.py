@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+import random
+import secrets
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class Sampling:
+    rate: Optional[float] = None
+    max_bytes: Optional[int] = None
+    seed: Optional[int] = None
+
+    def enabled(self) -> bool:
+        return self.rate is not None or self.max_bytes is not None
+
+
+def detection_probability(total: int, sampled: int, corrupted: int) -> float:
+    # Hypergeometric: chance that a uniform sample of `sampled` out of `total` members hits at least one of
+    # `corrupted` bad members.
+    if corrupted <= 0 or total <= 0:
+        return 0.0
+    if sampled + corrupted > total:
+        return 1.0
+    miss = 1.0
+    for i in range(sampled):
+        miss *= (total - corrupted - i) / (total - i)
+    return 1.0 - miss
+
+
+def _manifest_members(manifest: Dict[str, Any]) -> List[Tuple[str, int]]:
+    files = manifest.get("files")
+    if not isinstance(files, list):
+        return []
+    out = []
+    for fe in files:
+        if isinstance(fe, dict) and isinstance(fe.get("path"), str) and isinstance(fe.get("size_bytes"), int):
+            out.append((fe["path"], max(0, fe["size_bytes"])))
+    return out
+
+
+def choose_sample(manifest: Dict[str, Any], sampling: Sampling) -> Tuple[Set[str], Dict[str, Any]]:
+    seed = sampling.seed if sampling.seed is not None else secrets.randbits(63)
+    members = _manifest_members(manifest)
+    order = list(range(len(members)))
+    random.Random(seed).shuffle(order)
+
+    limit = len(members)
+    if sampling.rate is not None:
+        limit = min(limit, math.ceil(max(0.0, sampling.rate) * len(members)))
+
+    chosen: Set[str] = set()
+    sampled_bytes = 0
+    for i in order:
+        if len(chosen) >= limit:
+            break
+        path, size = members[i]
+        if sampling.max_bytes is not None and sampled_bytes + size > sampling.max_bytes:
+            continue
+        chosen.add(path)
+        sampled_bytes += size
+
+    total = len(members)
+    total_bytes = sum(size for _, size in members)
+    report = {
+        "seed": seed,
+        "rate": sampling.rate,
+        "max_bytes": sampling.max_bytes,
+        "members_total": total,
+        "members_sampled": len(chosen),
+        "bytes_total": total_bytes,
+        "bytes_sampled": sampled_bytes,
+        "coverage": len(chosen) / total if total else 1.0,
+        "byte_coverage": sampled_bytes / total_bytes if total_bytes else 1.0,
+        "detection_probability": {
+            "one_member": detection_probability(total, len(chosen), 1),
+            "one_percent": detection_probability(total, len(chosen), math.ceil(total / 100)),
+        },
+    }
+    return chosen, report
@@ -0,0 +1,410 @@
+import bz2
+import hashlib
+import lzma
+import struct
+import zipfile
+import zlib
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from oord_verify.verify.cdir import (
+    CENTRAL,
+    CENTRAL_SIG,
+    EOCD,
+    EOCD_SIG,
+    FLAG_ENCRYPTED,
+    LOCAL,
+    LOCAL_SIG,
+    ZIP64_EOCD,
+    ZIP64_EOCD_SIG,
+    ZIP64_LOCATOR_SIG,
+    normalize_name,
+    zip64_extra,
+)
+from oord_verify.verify.deadline import Deadline
+from oord_verify.verify.limits import BudgetMeter, Budgets
+from oord_verify.verify.zipio import HASH_CHUNK_SIZE, ChunkCallback, Fingerprint
+
+BUFFERED_MEMBERS = ("manifest.json", "jwks_snapshot.json", "tl_proof.json")
+
+_DESCRIPTOR_SIG = b"PK\x07\x08"
+
+_FLAG_LZMA_EOS = 0x02
+_FLAG_DESCRIPTOR = 0x08
+_LZMA_UNKNOWN_SIZE = b"\xff" * 8
+
+# (member name, offset of its local header in the stream) -> (CRC-32, uncompressed size) as streamed.
+_Seen = Dict[Tuple[str, int], Tuple[int, int]]
+
+
+class _Reader:
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self._pending = b""
+        self._pos = 0
+        # Stream position of the next byte read() returns.
+        self.offset = 0
+
+    def read(self, n: int) -> bytes:
+        if self._pos < len(self._pending):
+            out = self._pending[self._pos : self._pos + n]
+            self._pos += len(out)
+        else:
+            out = self._fp.read(n)
+        self.offset += len(out)
+        return out
+
+    def read_exact(self, n: int, what: str) -> bytes:
+        parts: List[bytes] = []
+        need = n
+        while need > 0:
+            b = self.read(need)
+            if not b:
+                raise zipfile.BadZipFile(f"truncated stream while reading {what}")
+            parts.append(b)
+            need -= len(b)
+        return b"".join(parts)
+
+    def unread(self, b: bytes) -> None:
+        if b:
+            self._pending = b + self._pending[self._pos :]
+            self._pos = 0
+            self.offset -= len(b)
+
+    def skip_to(self, sig: bytes) -> bytes:
+        # Skips bytes prepended to the archive (e.g. a self-extractor stub) up to the first sig; b"" if there is none.
+        buf = b""
+        while True:
+            i = buf.find(sig)
+            if i >= 0:
+                self.unread(buf[i + len(sig) :])
+                return sig
+            b = self.read(HASH_CHUNK_SIZE)
+            if not b:
+                return b""
+            buf = buf[-(len(sig) - 1) :] + b
+
+
+class StreamedBundle:
+    def __init__(
+        self,
+        entries: List[Tuple[str, int, int]],
+        members: Dict[str, bytes],
+        digests: Dict[str, Tuple[str, int]],
+    ) -> None:
+        self._entries = entries
+        self._info = {name: (csize, usize) for name, csize, usize in entries}
+        self._members = members
+        self._digests = digests
+
+    def namelist(self) -> List[str]:
+        return [name for name, _, _ in self._entries]
+
+    def entries(self) -> Iterator[Tuple[str, int, int]]:
+        return iter(self._entries)
+
+    def info(self, name: str) -> Tuple[int, int]:
+        return self._info[name]
+
+    def read(self, name: str) -> bytes:
+        if name in self._members:
+            return self._members[name]
+        if name in self._digests:
+            raise RuntimeError(f"{name} was not buffered while streaming the bundle")
+        raise KeyError(name)
+
+    def digest(self, name: str, on_chunk: Optional[ChunkCallback] = None) -> Tuple[str, int]:
+        # The member was hashed while streaming; its bytes are still reported for progress and the verifier's budgets.
+        sha, size = self._digests[name]
+        if on_chunk is not None and size:
+            on_chunk(size)
+        return sha, size
+
+    def schedule(self, names: List[str]) -> List[str]:
+        return list(names)
+
+    def fingerprint(self, name: str) -> Optional[Fingerprint]:
+        # Streamed members were already hashed while reading, so there is nothing to carry over.
+        if name not in self._info:
+            raise KeyError(name)
+        return None
+
+
+def _decode_name(raw: bytes, flags: int) -> str:
+    return normalize_name(raw, flags).decode("utf-8")
+
+
+def _zip64_sizes(extra: bytes, usize: int, csize: int) -> Tuple[int, int, bool]:
+    i = 0
+    while i + 4 <= len(extra):
+        tag, ln = struct.unpack("<HH", extra[i : i + 4])
+        body = extra[i + 4 : i + 4 + ln]
+        if tag == 0x0001:
+            j = 0
+            if usize == 0xFFFFFFFF and j + 8 <= len(body):
+                usize = struct.unpack("<Q", body[j : j + 8])[0]
+                j += 8
+            if csize == 0xFFFFFFFF and j + 8 <= len(body):
+                csize = struct.unpack("<Q", body[j : j + 8])[0]
+            return usize, csize, True
+        i += 4 + ln
+    return usize, csize, False
+
+
+def _stored_until_descriptor(r: _Reader, name: str, zip64: bool, consumed: List[int]) -> Iterator[bytes]:
+    # Stored members written by streaming producers carry no size up front; the
+    # end is the first descriptor signature whose CRC and sizes match the data.
+    fmt = "<LQQ" if zip64 else "<LLL"
+    dlen = struct.calcsize(fmt)
+    crc = 0
+    size = 0
+    buf = b""
+    pos = 0
+    while True:
+        i = buf.find(_DESCRIPTOR_SIG, pos)
+        if i >= 0 and i + 4 + dlen <= len(buf):
+            if i > pos:
+                out = buf[pos:i]
+                crc = zlib.crc32(out, crc)
+                size += len(out)
+                consumed[0] = size
+                yield out
+            dcrc, dcsize, dusize = struct.unpack(fmt, buf[i + 4 : i + 4 + dlen])
+            if dcrc == crc and dcsize == size and dusize == size:
+                r.unread(buf[i:])
+                return
+            crc = zlib.crc32(_DESCRIPTOR_SIG, crc)
+            size += 4
+            consumed[0] = size
+            yield _DESCRIPTOR_SIG
+            pos = i + 4
+            continue
+
+        keep = i if i >= 0 else max(pos, len(buf) - 3)
+        if keep > pos:
+            out = buf[pos:keep]
+            crc = zlib.crc32(out, crc)
+            size += len(out)
+            consumed[0] = size
+            yield out
+        buf = buf[keep:]
+        pos = 0
+        b = r.read(HASH_CHUNK_SIZE)
+        if not b:
+            raise zipfile.BadZipFile(f"truncated stream while reading {name}")
+        buf += b
+
+
+def _lzma_decompressor(
+    r: _Reader, name: str, flags: int, usize: int, has_descriptor: bool, consumed: List[int]
+) -> lzma.LZMADecompressor:
+    # ZIP's LZMA data starts with a version, the properties length and the properties. Those properties followed by
+    # the uncompressed size (unknown when the data ends with an end marker) form an .lzma "alone" header.
+    head = r.read_exact(4, name)
+    (plen,) = struct.unpack("<H", head[2:])
+    props = r.read_exact(plen, name)
+    consumed[0] += 4 + plen
+    if plen != 5:
+        raise zipfile.BadZipFile(f"{name}: unexpected LZMA properties length {plen}")
+    if flags & _FLAG_LZMA_EOS:
+        size = _LZMA_UNKNOWN_SIZE
+    elif has_descriptor:
+        raise NotImplementedError(f"{name}: LZMA data without an end marker cannot be read in stream mode")
+    else:
+        size = struct.pack("<Q", usize)
+    d = lzma.LZMADecompressor(lzma.FORMAT_ALONE)
+    d.decompress(props + size)
+    return d
+
+
+def _member_chunks(
+    r: _Reader,
+    name: str,
+    method: int,
+    flags: int,
+    csize: int,
+    usize: int,
+    has_descriptor: bool,
+    zip64: bool,
+    consumed: List[int],
+) -> Iterator[bytes]:
+    if method == zipfile.ZIP_STORED:
+        if has_descriptor:
+            yield from _stored_until_descriptor(r, name, zip64, consumed)
+            return
+        left = csize
+        while left > 0:
+            b = r.read(min(HASH_CHUNK_SIZE, left))
+            if not b:
+                raise zipfile.BadZipFile(f"truncated stream while reading {name}")
+            left -= len(b)
+            consumed[0] += len(b)
+            yield b
+        return
+
+    d: Union["zlib._Decompress", bz2.BZ2Decompressor, lzma.LZMADecompressor]
+    if method == zipfile.ZIP_DEFLATED:
+        d = zlib.decompressobj(-15)
+    elif method == zipfile.ZIP_BZIP2:
+        d = bz2.BZ2Decompressor()
+    elif method == zipfile.ZIP_LZMA:
+        d = _lzma_decompressor(r, name, flags, usize, has_descriptor, consumed)
+    else:
+        # Reported like zipfile's own NotImplementedError in path mode.
+        raise NotImplementedError(f"{name}: unsupported compression method {method} in stream mode")
+
+    left = None if has_descriptor else csize - consumed[0]
+    while not d.eof:
+        want = HASH_CHUNK_SIZE if left is None else min(HASH_CHUNK_SIZE, left)
+        if want == 0:
+            break
+        b = r.read(want)
+        if not b:
+            raise zipfile.BadZipFile(f"truncated stream while reading {name}")
+        if left is not None:
+            left -= len(b)
+        consumed[0] += len(b)
+        out = d.decompress(b)
+        if out:
+            yield out
+    if not d.eof:
+        raise zipfile.BadZipFile(f"{name}: compressed data ended prematurely")
+    r.unread(d.unused_data)
+    if left:
+        r.read_exact(left, name)
+
+
+def _read_local_member(
+    r: _Reader,
+    offset: int,
+    members: Dict[str, bytes],
+    digests: Dict[str, Tuple[str, int]],
+    seen: _Seen,
+    meter: Optional[BudgetMeter],
+    deadline: Optional[Deadline] = None,
+) -> None:
+    head = r.read_exact(LOCAL.size - 4, "local file header")
+    _, _, flags, method, _, _, crc, csize, usize, nlen, xlen = LOCAL.unpack(LOCAL_SIG + head)
+    name = _decode_name(r.read_exact(nlen, "member name"), flags)
+    extra = r.read_exact(xlen, "extra field")
+    if flags & FLAG_ENCRYPTED:
+        raise zipfile.BadZipFile(f"{name}: encrypted members are not supported")
+    usize, csize, zip64 = _zip64_sizes(extra, usize, csize)
+    has_descriptor = bool(flags & _FLAG_DESCRIPTOR)
+
+    buffered = name in BUFFERED_MEMBERS
+    parts: List[bytes] = []
+    h = hashlib.sha256()
+    size = 0
+    crc_actual = 0
+    consumed = [0]
+    on_chunk: Optional[ChunkCallback] = None
+    if meter is not None:
+        meter.add_member()
+        on_chunk = meter.counter(name, lambda: consumed[0])
+    for chunk in _member_chunks(r, name, method, flags, csize, usize, has_descriptor, zip64, consumed):
+        if deadline is not None:
+            deadline.check("hashes")
+        h.update(chunk)
+        crc_actual = zlib.crc32(chunk, crc_actual)
+        size += len(chunk)
+        if on_chunk is not None:
+            on_chunk(len(chunk))
+        if buffered:
+            parts.append(chunk)
+
+    if has_descriptor:
+        sig = r.read_exact(4, "data descriptor")
+        if sig != _DESCRIPTOR_SIG:
+            r.unread(sig)
+        if zip64:
+            crc, _, usize = struct.unpack("<LQQ", r.read_exact(20, "data descriptor"))
+        else:
+            crc, _, usize = struct.unpack("<LLL", r.read_exact(12, "data descriptor"))
+
+    if crc_actual != crc:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+    if size != usize:
+        raise zipfile.BadZipFile(f"{name}: size does not match header")
+
+    # Later members with the same name replace earlier ones, as duplicate names resolve to the last entry in path mode.
+    digests[name] = (h.hexdigest(), size)
+    if buffered:
+        members[name] = b"".join(parts)
+    seen[(name, offset)] = (crc, size)
+
+
+def _read_central_directory(r: _Reader, sig: bytes, seen: _Seen) -> List[Tuple[str, int, int]]:
+    # Central directory offsets are only comparable with stream offsets once the end record gives the directory's
+    # recorded start, so entries are matched against the streamed local headers after it has been read.
+    cd_at = r.offset - 4
+    listed: List[Tuple[str, int, int, int, int]] = []
+    while sig == CENTRAL_SIG:
+        head = r.read_exact(CENTRAL.size - 4, "central directory")
+        fields = CENTRAL.unpack(CENTRAL_SIG + head)
+        flags, crc, csize, usize = fields[5], fields[9], fields[10], fields[11]
+        nlen, xlen, clen, offset = fields[12], fields[13], fields[14], fields[18]
+        name = _decode_name(r.read_exact(nlen, "central directory name"), flags)
+        extra = r.read_exact(xlen, "central directory extra")
+        r.read_exact(clen, "central directory comment")
+        usize, csize, offset = zip64_extra(extra, usize, csize, offset)
+        listed.append((name, csize, usize, crc, offset))
+        sig = r.read_exact(4, "central directory")
+
+    zip64_cd_offset: Optional[int] = None
+    if sig == ZIP64_EOCD_SIG:
+        (rec_size,) = struct.unpack("<Q", r.read_exact(8, "zip64 end of central directory"))
+        rec = r.read_exact(rec_size, "zip64 end of central directory")
+        if rec_size >= ZIP64_EOCD.size - 12:
+            zip64_cd_offset = ZIP64_EOCD.unpack(ZIP64_EOCD_SIG + bytes(8) + rec[: ZIP64_EOCD.size - 12])[9]
+        sig = r.read_exact(4, "end of central directory")
+    if sig == ZIP64_LOCATOR_SIG:
+        r.read_exact(16, "zip64 end of central directory locator")
+        sig = r.read_exact(4, "end of central directory")
+    if sig != EOCD_SIG:
+        raise zipfile.BadZipFile("end of central directory record not found")
+    cd_offset = EOCD.unpack(EOCD_SIG + r.read_exact(EOCD.size - 4, "end of central directory"))[6]
+    if cd_offset == 0xFFFFFFFF and zip64_cd_offset is not None:
+        cd_offset = zip64_cd_offset
+    # Bytes prepended to the archive shift every recorded offset, as in CentralDirectory.
+    concat = cd_at - cd_offset
+    if concat < 0:
+        raise zipfile.BadZipFile("Bad offset for central directory")
+
+    entries: List[Tuple[str, int, int]] = []
+    unlisted = dict(seen)
+    for name, csize, usize, crc, offset in listed:
+        key = (name, offset + concat)
+        if key not in seen:
+            raise zipfile.BadZipFile(f"{name}: listed in central directory but no local header was streamed")
+        if seen[key] != (crc, usize):
+            raise zipfile.BadZipFile(f"{name}: central directory does not match local header")
+        unlisted.pop(key, None)
+        entries.append((name, csize, usize))
+    if unlisted:
+        raise zipfile.BadZipFile(f"{min(unlisted)[0]}: streamed member missing from central directory")
+    return entries
+
+
+def read_bundle_stream(
+    fp: BinaryIO, budgets: Optional[Budgets] = None, deadline: Optional[Deadline] = None
+) -> StreamedBundle:
+    r = _Reader(fp)
+    members: Dict[str, bytes] = {}
+    digests: Dict[str, Tuple[str, int]] = {}
+    seen: _Seen = {}
+    meter = BudgetMeter(budgets) if budgets is not None and budgets.enabled() else None
+
+    sig = r.read(4)
+    if sig not in (LOCAL_SIG, CENTRAL_SIG, EOCD_SIG):
+        r.unread(sig)
+        sig = r.skip_to(LOCAL_SIG)
+    if not sig:
+        raise zipfile.BadZipFile("File is not a zip file")
+    while sig == LOCAL_SIG:
+        _read_local_member(r, r.offset - 4, members, digests, seen, meter, deadline)
+        sig = r.read_exact(4, "next record")
+
+    if sig not in (CENTRAL_SIG, ZIP64_EOCD_SIG, ZIP64_LOCATOR_SIG, EOCD_SIG):
+        raise zipfile.BadZipFile("unexpected record in stream")
+    entries = _read_central_directory(r, sig, seen)
+    return StreamedBundle(entries, members, digests)
@@ -1,14 +1,18 @@
-import json
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from oord_verify.notary_client.client import NotaryClient
 from oord_verify.notary_client.errors import (
     NotaryBadResponse,
+    NotaryHTTPError,
     NotaryNotFound,
     NotaryUnauthorized,
+    NotaryError,
     NotaryUnreachable,
+    NotaryUnsupported,
 )
 
+LookupResult = Union[Dict[str, Any], NotaryError]
+
 def normalize_tl_fields(tl_obj: Dict[str, Any]) -> Tuple[Optional[str], Optional[int], Optional[str], Optional[str]]:
     entry = tl_obj.get("entry") or {}
     sth = tl_obj.get("sth") or {}
@@ -36,18 +40,22 @@ def normalize_tl_fields(tl_obj: Dict[str, Any]) -> Tuple[Optional[str], Optional
 
     return merkle_root, seq_int, sth_sig, signer_kid
 
-def online_tl_check(client: NotaryClient, seq: int, merkle_root: str, sth_sig: Optional[str]) -> Tuple[bool, Optional[str], Optional[str]]:
-    try:
-        obj = client.get_tl_entry_by_seq(int(seq))
-    except NotaryUnauthorized as e:
+Classification = Tuple[bool, Optional[str], Optional[str]]
+
+
+def classify_tl_error(e: Exception) -> Classification:
+    if isinstance(e, NotaryUnauthorized):
         return False, "TL_ONLINE_UNAUTHORIZED", f"TL online unauthorized: {e}"
-    except NotaryNotFound as e:
+    if isinstance(e, NotaryNotFound):
         return False, "TL_ONLINE_NOT_FOUND", f"TL online not found: {e}"
-    except NotaryUnreachable as e:
+    if isinstance(e, NotaryUnreachable):
         return False, "TL_ONLINE_UNREACHABLE", f"TL online unreachable: {e}"
-    except NotaryBadResponse as e:
+    if isinstance(e, NotaryBadResponse):
         return False, "TL_ONLINE_BAD_RESPONSE", f"TL online bad response: {e}"
+    raise e
+
 
+def classify_tl_entry(obj: Dict[str, Any], seq: int, merkle_root: str) -> Classification:
     entry = obj.get("entry") or obj
     live_root, live_seq, live_sth, _ = normalize_tl_fields(entry)
 
@@ -56,3 +64,91 @@ def online_tl_check(client: NotaryClient, seq: int, merkle_root: str, sth_sig: O
     if live_seq != seq or live_root != merkle_root:
         return False, "TL_ONLINE_CONTRADICTION", f"TL mismatch (live seq={live_seq}, root={live_root})"
     return True, None, None
+
+
+def classify_lookup(res: LookupResult, seq: int, merkle_root: str) -> Classification:
+    if isinstance(res, Exception):
+        return classify_tl_error(res)
+    return classify_tl_entry(res, int(seq), merkle_root)
+
+
+def fetch_tl_entry(client: NotaryClient, seq: int) -> LookupResult:
+    try:
+        return client.get_tl_entry_by_seq(int(seq))
+    except (NotaryUnauthorized, NotaryNotFound, NotaryUnreachable, NotaryBadResponse) as e:
+        return e
+
+
+def online_tl_check(client: NotaryClient, seq: int, merkle_root: str, sth_sig: Optional[str]) -> Classification:
+    return classify_lookup(fetch_tl_entry(client, seq), seq, merkle_root)
+
+
+def coalesce_seqs(seqs: Iterable[int], max_gap: int = 64, max_span: int = 1000) -> List[Tuple[int, int]]:
+    ranges: List[Tuple[int, int]] = []
+    for seq in sorted(set(seqs)):
+        if ranges:
+            start, end = ranges[-1]
+            if seq - end <= max_gap and seq - start < max_span:
+                ranges[-1] = (start, seq)
+                continue
+        ranges.append((seq, seq))
+    return ranges
+
+
+class TLBatcher:
+    def __init__(self, client: NotaryClient, max_gap: int = 64, max_span: int = 1000) -> None:
+        self.client = client
+        self.max_gap = max_gap
+        self.max_span = max_span
+        self.range_supported = True
+        self.requests = 0
+
+    def _fetch_range(self, start: int, end: int, want: Set[int]) -> Dict[int, LookupResult]:
+        self.requests += 1
+        try:
+            items = self.client.get_tl_entries_range(start, end)
+        except NotaryUnsupported:
+            self.range_supported = False
+            raise
+        except (NotaryHTTPError, NotaryBadResponse):
+            # Possibly transient (5xx, a proxy's error page): this window is looked up per entry, later ones try
+            # ranges again.
+            return {seq: self._fetch_one(seq) for seq in sorted(want)}
+        except (NotaryUnauthorized, NotaryUnreachable) as e:
+            return {seq: e for seq in want}
+        out: Dict[int, LookupResult] = {}
+        for item in items:
+            _, live_seq, _, _ = normalize_tl_fields(item.get("entry") or item)
+            if live_seq in want:
+                out[live_seq] = item
+        # A page may be capped or paginated, so absence from it proves nothing; ask for the stragglers one by one.
+        for seq in sorted(want - out.keys()):
+            out[seq] = self._fetch_one(seq)
+        return out
+
+    def _fetch_one(self, seq: int) -> LookupResult:
+        self.requests += 1
+        return fetch_tl_entry(self.client, seq)
+
+    def lookup(self, seqs: Iterable[int]) -> Dict[int, LookupResult]:
+        want = {int(s) for s in seqs}
+        out: Dict[int, LookupResult] = {}
+        for start, end in coalesce_seqs(want, self.max_gap, self.max_span):
+            in_range = {s for s in want if start <= s <= end}
+            if self.range_supported and start != end:
+                try:
+                    out.update(self._fetch_range(start, end, in_range))
+                    continue
+                except NotaryUnsupported:
+                    pass
+            for seq in sorted(in_range):
+                out[seq] = self._fetch_one(seq)
+        return out
+
+    def check(self, pending: Iterable[Tuple[int, str]]) -> List[Classification]:
+        pending = list(pending)
+        found = self.lookup(seq for seq, _ in pending)
+        results: List[Classification] = []
+        for seq, merkle_root in pending:
+            results.append(classify_lookup(found[int(seq)], seq, merkle_root))
+        return results
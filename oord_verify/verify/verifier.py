@@ -1,13 +1,46 @@
-import hashlib
+import copy
+import heapq
+import threading
 import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from oord_verify.verify.crypto import jwks_fingerprint, verify_manifest_signature, verify_tl_signature
+from oord_verify.verify.crypto import KeyRing, jwks_fingerprint, verify_manifest_signature, verify_tl_signature
+from oord_verify.verify.deadline import Deadline, DeadlineExceeded
+from oord_verify.verify.delta import Baseline
+from oord_verify.verify.dirbundle import DirBundle
+from oord_verify.verify.httpio import HTTPRangeError, HTTPRangeFile
+from oord_verify.verify.limits import BudgetExceeded, BudgetMeter, Budgets, check_entries, check_orphans
+from oord_verify.verify.memio import BufferFile
 from oord_verify.verify.merkle import compute_merkle_root_from_manifest_files
-from oord_verify.verify.tl import normalize_tl_fields, online_tl_check
-from oord_verify.notary_client.client import NotaryClient
-from oord_verify.verify.zipio import load_jwks, load_manifest, load_tl_proof
+from oord_verify.verify.profiling import set_stage, staged
+from oord_verify.verify.results import ENV_REASON_IDS
+from oord_verify.verify.progress import Progress
+from oord_verify.verify.sampling import Sampling, choose_sample
+from oord_verify.verify.tl import (
+    LookupResult,
+    TLBatcher,
+    classify_lookup,
+    fetch_tl_entry,
+    normalize_tl_fields,
+    online_tl_check,
+)
+from oord_verify.notary_client.client import ConnectionPool, NotaryClient
+from oord_verify.verify.stream import read_bundle_stream
+from oord_verify.verify.zipio import (
+    COALESCE_BYTES,
+    PIPELINE_DEPTH,
+    Bundle,
+    ChunkCallback,
+    ZipBundle,
+    load_jwks,
+    load_manifest,
+    load_tl_proof,
+)
 
 
 def _safe_int(v: Any) -> Optional[int]:
@@ -22,10 +55,6 @@ def _safe_int(v: Any) -> Optional[int]:
     return None
 
 
-def _sha256_bytes(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
-
-
 def _manifest_meta(manifest: Dict[str, Any]) -> Dict[str, Any]:
     org_id = manifest.get("org_id") if isinstance(manifest.get("org_id"), str) else None
     batch_id = manifest.get("batch_id") if isinstance(manifest.get("batch_id"), str) else None
@@ -59,57 +88,191 @@ def _manifest_meta(manifest: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _check_hashes_from_manifest(z: zipfile.ZipFile, manifest: Dict[str, Any]) -> Tuple[bool, List[Dict[str, str]]]:
-    mismatches: List[Dict[str, str]] = []
-    files = manifest.get("files") or []
-    if not isinstance(files, list):
-        mismatches.append({"file": "<manifest>", "reason": "files_not_array"})
-        return False, mismatches
+def _member_counter(
+    z: Bundle,
+    meter: Optional[BudgetMeter],
+    name: str,
+    orphan: bool = False,
+    deadline: Optional[Deadline] = None,
+    progress: Optional[Progress] = None,
+) -> Optional[ChunkCallback]:
+    counter: Optional[ChunkCallback] = None
+    if meter is not None:
+        compressed, _ = z.info(name)
+        counter = meter.counter(name, lambda: compressed, orphan=orphan)
+    if deadline is None and progress is None:
+        return counter
+
+    def on_chunk(n: int) -> None:
+        if deadline is not None:
+            deadline.check("hashes")
+        if counter is not None:
+            counter(n)
+        if progress is not None:
+            progress.add_bytes(n)
+
+    return on_chunk
+
+
+def _has_member(z: Bundle, name: str) -> bool:
+    try:
+        z.info(name)
+    except KeyError:
+        return False
+    return True
+
+
+class MismatchLog:
+    def __init__(self, max_entries: Optional[int] = None, stop_after: Optional[int] = None) -> None:
+        self.max_entries = max_entries
+        self.stop_after = stop_after
+        self.entries: List[Dict[str, str]] = []
+        self.counts: Dict[str, int] = {}
+        self.total = 0
+        self.truncated = False
+        # Max-heap (negated keys) of the max_entries lowest (manifest position, arrival) keys seen so far.
+        self._deferred: List[Tuple[int, int, Dict[str, str]]] = []
+        self._seq = 0
 
-    expected_paths: List[str] = []
-    for fe in files:
+    def _count(self, entry: Dict[str, str]) -> None:
+        reason = entry["reason"]
+        self.counts[reason] = self.counts.get(reason, 0) + 1
+        self.total += 1
+
+    def add(self, entry: Dict[str, str]) -> None:
+        self._count(entry)
+        if self.max_entries is None or len(self.entries) < self.max_entries:
+            self.entries.append(entry)
+        else:
+            self.truncated = True
+
+    def defer(self, pos: int, entry: Dict[str, str]) -> None:
+        self._count(entry)
+        self._seq += 1
+        heapq.heappush(self._deferred, (-pos, -self._seq, entry))
+        if self.max_entries is not None and len(self._deferred) > self.max_entries:
+            heapq.heappop(self._deferred)
+            self.truncated = True
+
+    def flush(self) -> None:
+        for _, _, entry in sorted(self._deferred, reverse=True):
+            if self.max_entries is None or len(self.entries) < self.max_entries:
+                self.entries.append(entry)
+            else:
+                self.truncated = True
+        self._deferred.clear()
+
+    def should_stop(self) -> bool:
+        return self.stop_after is not None and self.total >= self.stop_after
+
+
+def _hash_members(
+    z: Bundle,
+    files: List[Any],
+    meter: Optional[BudgetMeter],
+    log: MismatchLog,
+    sample: Optional[Set[str]],
+    deadline: Optional[Deadline],
+    progress: Optional[Progress],
+) -> bool:
+    jobs: List[Tuple[int, str, str, int]] = []
+    expected_paths: Set[str] = set()
+    for pos, fe in enumerate(files):
+        if log.should_stop():
+            return False
         if not isinstance(fe, dict):
-            mismatches.append({"file": "<?>", "reason": "invalid_manifest_entry"})
+            log.defer(pos, {"file": "<?>", "reason": "invalid_manifest_entry"})
             continue
         path = fe.get("path")
         sha_expected = fe.get("sha256")
         size_expected = fe.get("size_bytes")
         if not isinstance(path, str) or not isinstance(sha_expected, str) or not isinstance(size_expected, int):
-            mismatches.append({"file": str(path), "reason": "invalid_manifest_entry"})
+            log.defer(pos, {"file": str(path), "reason": "invalid_manifest_entry"})
             continue
-        expected_paths.append(path)
+        expected_paths.add(path)
+        if sample is not None and path not in sample:
+            # Unsampled members are only checked against the archive directory, which costs no payload I/O.
+            try:
+                _, size_declared = z.info(path)
+            except KeyError:
+                log.defer(pos, {"file": path, "reason": "missing_from_zip", "expected": sha_expected})
+                continue
+            if size_declared != size_expected:
+                actual, expected = str(size_declared), str(size_expected)
+                log.defer(pos, {"file": path, "reason": "size_mismatch", "actual": actual, "expected": expected})
+            continue
+        jobs.append((pos, path, sha_expected, size_expected))
+
+    by_name: Dict[str, List[Tuple[int, str, str, int]]] = {}
+    for job in jobs:
+        by_name.setdefault(job[1], []).append(job)
+    counted = meter is not None or deadline is not None or progress is not None
+    for path in z.schedule([job[1] for job in jobs]):
+        pos, _, sha_expected, size_expected = by_name[path].pop(0)
+        if log.should_stop():
+            return False
+        if deadline is not None:
+            deadline.check("hashes")
         try:
-            data = z.read(path)
+            on_chunk = _member_counter(z, meter, path, deadline=deadline, progress=progress) if counted else None
+            sha_actual, size_actual = z.digest(path, on_chunk)
         except KeyError:
-            mismatches.append({"file": path, "reason": "missing_from_zip", "expected": sha_expected})
+            log.defer(pos, {"file": path, "reason": "missing_from_zip", "expected": sha_expected})
             continue
-        sha_actual = _sha256_bytes(data)
+        if progress is not None:
+            progress.file_done()
         if sha_actual != sha_expected:
-            mismatches.append({"file": path, "reason": "hash_mismatch", "actual": sha_actual, "expected": sha_expected})
-        if len(data) != size_expected:
-            mismatches.append(
-                {"file": path, "reason": "size_mismatch", "actual": str(len(data)), "expected": str(size_expected)}
-            )
+            log.defer(pos, {"file": path, "reason": "hash_mismatch", "actual": sha_actual, "expected": sha_expected})
+        if size_actual != size_expected:
+            actual, expected = str(size_actual), str(size_expected)
+            log.defer(pos, {"file": path, "reason": "size_mismatch", "actual": actual, "expected": expected})
 
-    names = set(z.namelist())
-    for name in sorted(n for n in names if n.startswith("files/")):
-        if name not in expected_paths:
-            data = z.read(name)
-            mismatches.append({"file": name, "reason": "missing_from_manifest", "actual": _sha256_bytes(data)})
+    orphans = {n: usize for n, _, usize in z.entries() if n.startswith("files/") and n not in expected_paths}
+    if meter is not None and orphans:
+        check_orphans(meter.budgets, sum(orphans.values()))
+    rank = {name: len(files) + k for k, name in enumerate(sorted(orphans))}
+    for name in z.schedule(sorted(orphans)):
+        if log.should_stop():
+            return False
+        on_chunk = _member_counter(z, meter, name, orphan=True, deadline=deadline, progress=progress)
+        sha_actual, _ = z.digest(name, on_chunk)
+        if progress is not None:
+            progress.file_done()
+        log.defer(rank[name], {"file": name, "reason": "missing_from_manifest", "actual": sha_actual})
+    return True
 
-    return len(mismatches) == 0, mismatches
 
+def _check_hashes_from_manifest(
+    z: Bundle,
+    manifest: Dict[str, Any],
+    meter: Optional[BudgetMeter] = None,
+    log: Optional[MismatchLog] = None,
+    sample: Optional[Set[str]] = None,
+    deadline: Optional[Deadline] = None,
+    progress: Optional[Progress] = None,
+) -> Tuple[bool, List[Dict[str, str]]]:
+    if log is None:
+        log = MismatchLog()
+    files = manifest.get("files") or []
+    if not isinstance(files, list):
+        log.add({"file": "<manifest>", "reason": "files_not_array"})
+        return False, log.entries
 
-def verify_bundle(
-    path: Path,
-    tl_url: Optional[str] = None,
-    online: bool = False,
-    tl_api_key: Optional[str] = None,
-    tl_timeout_s: float = 5.0,
-) -> Tuple[bool, Dict[str, Any]]:
-    summary: Dict[str, Any] = {
+    try:
+        # Members are read in archive order (see Bundle.schedule) but reported in manifest order.
+        complete = _hash_members(z, files, meter, log, sample, deadline, progress)
+    finally:
+        log.flush()
+    if not complete:
+        # Remaining entries were never examined, so the report is partial.
+        log.truncated = True
+    return log.total == 0, log.entries
+
+
+def _new_summary(bundle_path: str, online: bool) -> Dict[str, Any]:
+    return {
         "reason_ids": [],
-        "bundle_path": str(path),
+        "bundle_path": bundle_path,
         "error": None,
         "error_kind": None,
         "batch": {
@@ -122,6 +285,8 @@ def verify_bundle(
         },
         "hashes_ok": None,
         "hash_mismatches": [],
+        "hash_mismatch_counts": {},
+        "hash_mismatches_truncated": False,
         "tl": {
             "present": None,
             "ok": None,
@@ -138,258 +303,833 @@ def verify_bundle(
         "merkle": {"ok": None, "manifest_root": None, "recomputed_root": None, "error": None},
     }
 
-    if not path.is_file():
-        summary["error"] = "bundle path does not exist or is not a file"
-        summary["error_kind"] = "env"
-        summary["reason_ids"] = ["ENV_PATH_MISSING"]
-        return False, summary
 
-    try:
-        with zipfile.ZipFile(path, "r") as z:
-            try:
-                manifest = load_manifest(z)
-            except RuntimeError as e:
-                msg = str(e)
-                summary["error"] = msg
-                if "manifest.json missing from bundle" in msg:
-                    summary["reason_ids"] = ["BUNDLE_MANIFEST_MISSING"]
-                elif "manifest.json is not valid JSON" in msg:
-                    summary["reason_ids"] = ["BUNDLE_MANIFEST_INVALID_JSON"]
-                elif "manifest.json must be a JSON object" in msg:
-                    summary["reason_ids"] = ["BUNDLE_MANIFEST_INVALID_SHAPE"]
-                else:
-                    summary["reason_ids"] = ["BUNDLE_MANIFEST_INVALID_SHAPE"]
-                return False, summary
-
-            m = _manifest_meta(manifest)
-            if isinstance(summary.get("batch"), dict):
-                summary["batch"].update(m)
-            summary["manifest_sig"]["key_id"] = m.get("key_id")
-
-            hashes_ok, mismatches = _check_hashes_from_manifest(z, manifest)
-            summary["hashes_ok"] = hashes_ok
-            summary["hash_mismatches"] = mismatches
-            if not hashes_ok:
-                summary["reason_ids"] = ["HASH_MISMATCH"]
-                summary["error"] = "hash mismatch (bundle payload does not match manifest)"
-                return False, summary
-
-            merkle_info = manifest.get("merkle")
-            if not isinstance(merkle_info, dict):
-                summary["merkle"]["ok"] = False
-                summary["merkle"]["error"] = "manifest.merkle is missing or not an object"
-                summary["error"] = summary["merkle"]["error"]
-                summary["reason_ids"] = ["MERKLE_SCHEMA_INVALID"]
-                return False, summary
-
-            manifest_root = merkle_info.get("root_cid")
-            if not isinstance(manifest_root, str):
-                summary["merkle"]["ok"] = False
-                summary["merkle"]["error"] = "manifest.merkle.root_cid is missing or not a string"
-                summary["error"] = summary["merkle"]["error"]
-                summary["reason_ids"] = ["MERKLE_SCHEMA_INVALID"]
-                return False, summary
-
-            summary["merkle"]["manifest_root"] = manifest_root
-            try:
-                recomputed_root = compute_merkle_root_from_manifest_files(manifest.get("files") or [])
-            except ValueError as e:
-                summary["merkle"]["ok"] = False
-                summary["merkle"]["error"] = f"failed to recompute Merkle root from manifest.files: {e}"
-                summary["error"] = summary["merkle"]["error"]
-                summary["reason_ids"] = ["MERKLE_COMPUTE_ERROR"]
-                return False, summary
-
-            summary["merkle"]["recomputed_root"] = recomputed_root
-            if recomputed_root != manifest_root:
-                summary["merkle"]["ok"] = False
-                summary["merkle"]["error"] = "recomputed Merkle root does not match manifest.merkle.root_cid"
-                summary["error"] = summary["merkle"]["error"]
-                summary["reason_ids"] = ["MERKLE_MISMATCH"]
-                return False, summary
-            summary["merkle"]["ok"] = True
+_Failure = Tuple[str, str]
+_TLFields = Tuple[str, int, Optional[str], Optional[str]]
+_Prefetch = Tuple[int, "Future[LookupResult]"]
+# How often a wait on another thread wakes up to check the deadline.
+_POLL_S = 0.1
 
-            try:
-                jwks = load_jwks(z)
-            except RuntimeError as e:
-                msg = str(e)
-                summary["jwks"]["present"] = False
-                summary["jwks"]["ok"] = False
-                summary["jwks"]["error"] = msg
-                summary["error"] = msg
-                if "jwks_snapshot.json missing from bundle" in msg:
-                    summary["reason_ids"] = ["JWKS_MISSING"]
-                elif "jwks_snapshot.json is not valid JSON" in msg:
-                    summary["reason_ids"] = ["JWKS_INVALID_JSON"]
-                else:
-                    summary["reason_ids"] = ["JWKS_INVALID_SHAPE"]
-                return False, summary
-
-            kids: List[str] = []
-            for k in jwks.get("keys", []):
-                kid = k.get("kid")
-                if kid:
-                    kids.append(kid)
-            summary["jwks"].update(
-                {"present": True, "ok": True, "kids": kids, "fingerprint": jwks_fingerprint(jwks), "error": None}
+
+def _await(future: "Future[LookupResult]", deadline: Optional[Deadline], stage: str) -> LookupResult:
+    if deadline is None:
+        return future.result()
+    while True:
+        try:
+            return future.result(timeout=_POLL_S)
+        except TimeoutError:
+            deadline.check(stage)
+
+
+def _fail(summary: Dict[str, Any], failure: Optional[_Failure]) -> Tuple[bool, Dict[str, Any]]:
+    assert failure is not None
+    summary["reason_ids"] = [failure[0]]
+    summary["error"] = failure[1]
+    return False, summary
+
+
+def _fail_budget(summary: Dict[str, Any], e: BudgetExceeded) -> Tuple[bool, Dict[str, Any]]:
+    actual = e.actual if e.actual != float("inf") else None
+    summary["error"] = str(e)
+    summary["reason_ids"] = [e.reason_id]
+    summary["budget"] = {"reason_id": e.reason_id, "limit": e.limit, "actual": actual, "at_least": e.at_least}
+    return False, summary
+
+
+def _fail_timeout(summary: Dict[str, Any], e: DeadlineExceeded) -> Tuple[bool, Dict[str, Any]]:
+    summary["error"] = str(e)
+    summary["reason_ids"] = ["TIMEOUT"]
+    summary["timeout"] = {"timeout_s": e.timeout_s, "stage": e.stage}
+    return False, summary
+
+
+def _fail_bad_zip(summary: Dict[str, Any], e: Exception) -> Tuple[bool, Dict[str, Any]]:
+    summary["error"] = f"bad zip file: {e}"
+    summary["error_kind"] = "env"
+    summary["reason_ids"] = ["ZIP_BAD"]
+    return False, summary
+
+
+def _fail_runtime(summary: Dict[str, Any], e: Exception) -> Tuple[bool, Dict[str, Any]]:
+    summary["error"] = str(e)
+    if not summary.get("reason_ids"):
+        summary["reason_ids"] = ["RUNTIME_ERROR"]
+    return False, summary
+
+
+class Verifier:
+    def __init__(
+        self,
+        tl_url: Optional[str] = None,
+        online: bool = False,
+        tl_api_key: Optional[str] = None,
+        tl_timeout_s: float = 5.0,
+        http_headers: Optional[Dict[str, str]] = None,
+        workers: int = 1,
+        cache_size: int = 0,
+        all_checks: bool = False,
+        budgets: Optional[Budgets] = None,
+        max_mismatches: Optional[int] = None,
+        stop_after_mismatches: Optional[int] = None,
+        tl_batch: int = 0,
+        sampling: Optional[Sampling] = None,
+        timeout_s: Optional[float] = None,
+        progress: Optional[Progress] = None,
+        pipeline_depth: int = PIPELINE_DEPTH,
+        baseline: Optional[Baseline] = None,
+    ) -> None:
+        self.tl_url = tl_url
+        self.online = online
+        self.tl_api_key = tl_api_key
+        self.tl_timeout_s = float(tl_timeout_s)
+        self.http_headers = http_headers
+        self.workers = max(1, int(workers))
+        self.cache_size = max(0, int(cache_size))
+        self.all_checks = bool(all_checks)
+        self.budgets = budgets or Budgets()
+        self.max_mismatches = max_mismatches
+        self.stop_after_mismatches = stop_after_mismatches
+        self.tl_batch = max(0, int(tl_batch))
+        self.sampling = sampling or Sampling()
+        self.timeout_s = float(timeout_s) if timeout_s is not None else None
+        self.progress = progress
+        self.pipeline_depth = max(0, int(pipeline_depth))
+        self.baseline = baseline
+        self.keyring = KeyRing()
+        self._notary_pool = ConnectionPool()
+        self._client: Optional[NotaryClient] = None
+        self._cache: "OrderedDict[Tuple[str, int, int], Tuple[bool, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._check_executor: Optional[ThreadPoolExecutor] = None
+        self._batcher: Optional[TLBatcher] = None
+        self._deferred = threading.local()
+
+    def __enter__(self) -> "Verifier":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            executors = [self._executor, self._check_executor]
+            self._executor = self._check_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._notary_pool.close()
+
+    def _notary(self) -> NotaryClient:
+        if self._client is None:
+            assert self.tl_url
+            self._client = NotaryClient(
+                base_url=self.tl_url, api_key=self.tl_api_key, timeout_s=self.tl_timeout_s, pool=self._notary_pool
             )
+        return self._client
 
-            ok_manifest_sig, ms_err = verify_manifest_signature(manifest, jwks)
-            summary["manifest_sig"]["sig_verified"] = ok_manifest_sig
-            summary["manifest_sig"]["error"] = ms_err
-            if ok_manifest_sig is False:
-                summary["manifest_sig"]["ok"] = False
-                summary["error"] = ms_err or "manifest signature verification failed"
-                summary["reason_ids"] = ["MANIFEST_SIG_INVALID"]
-                return False, summary
-            summary["manifest_sig"]["ok"] = ok_manifest_sig
-
-            m_tl_mode = manifest.get("tl_mode")
-            if not isinstance(m_tl_mode, str):
-                summary["tl"]["present"] = False
-                summary["tl"]["ok"] = False
-                summary["tl"]["error"] = "manifest.tl_mode missing or not a string"
-                summary["error"] = summary["tl"]["error"]
-                summary["reason_ids"] = ["TL_MODE_MISSING"]
-                return False, summary
-            if m_tl_mode not in ("included", "none"):
-                summary["tl"]["present"] = False
-                summary["tl"]["ok"] = False
-                summary["tl"]["error"] = f"invalid manifest.tl_mode={m_tl_mode!r} (expected 'included'|'none')"
-                summary["error"] = summary["tl"]["error"]
-                summary["reason_ids"] = ["TL_MODE_INVALID"]
-                return False, summary
-
-            tl_required = m_tl_mode == "included"
-            summary["tl"]["required"] = tl_required
-
-            names = set(z.namelist())
-            tl_file_present = "tl_proof.json" in names
-            if m_tl_mode == "none" and tl_file_present:
-                summary["tl"]["present"] = True
-                summary["tl"]["ok"] = False
-                summary["tl"]["error"] = "tl_proof.json present but manifest.tl_mode=none"
-                summary["error"] = summary["tl"]["error"]
-                summary["reason_ids"] = ["TL_PROOF_UNEXPECTED"]
-                return False, summary
-
-            tl_obj: Optional[Dict[str, Any]] = None
-            try:
-                tl_obj = load_tl_proof(z)
-            except RuntimeError as e:
-                msg = str(e)
-                if "tl_proof.json missing from bundle" in msg:
-                    if tl_required:
-                        summary["tl"]["present"] = False
-                        summary["tl"]["ok"] = False
-                        summary["tl"]["error"] = "tl_proof.json missing but manifest.tl_mode=included"
-                        summary["error"] = summary["tl"]["error"]
-                        summary["reason_ids"] = ["TL_PROOF_MISSING"]
-                        return False, summary
-                    summary["tl"]["present"] = False
-                    summary["tl"]["ok"] = True
-                    summary["tl"]["error"] = None
-                    tl_obj = None
-                else:
-                    summary["tl"]["present"] = False
-                    summary["tl"]["ok"] = False
-                    summary["tl"]["error"] = msg
-                    summary["error"] = msg
-                    summary["reason_ids"] = ["TL_PROOF_JSON_INVALID"]
-                    return False, summary
-
-            merkle_root: Optional[str] = None
-            seq: Optional[int] = None
-            sth_sig: Optional[str] = None
-            signer_kid: Optional[str] = None
-
-            if tl_obj is not None:
-                merkle_root, seq, sth_sig, signer_kid = normalize_tl_fields(tl_obj)
-                if merkle_root is None or seq is None:
-                    summary["tl"]["present"] = True
-                    summary["tl"]["ok"] = False
-                    summary["tl"]["error"] = "tl_proof.json missing merkle_root or seq"
-                    summary["error"] = summary["tl"]["error"]
-                    summary["reason_ids"] = ["TL_PROOF_SCHEMA_INVALID"]
-                    return False, summary
-
-                manifest_root_for_tl = summary["merkle"]["manifest_root"]
-                if isinstance(manifest_root_for_tl, str) and merkle_root != manifest_root_for_tl:
-                    summary["tl"]["present"] = True
-                    summary["tl"]["ok"] = False
-                    summary["tl"]["error"] = "tl_proof merkle_root does not match manifest.merkle.root_cid"
-                    summary["error"] = summary["tl"]["error"]
-                    summary["reason_ids"] = ["TL_ROOT_MISMATCH"]
-                    return False, summary
-
-                summary["tl"].update(
-                    {
-                        "present": True,
-                        "ok": True,
-                        "seq": seq,
-                        "merkle_root": merkle_root,
-                        "sth_sig": sth_sig,
-                        "signer_kid": signer_kid,
-                        "sig_verified": None,
-                        "error": None,
-                    }
-                )
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="oord-verify")
+            return self._executor
 
-            if tl_obj is not None and merkle_root is not None and seq is not None:
-                ok_sig, sig_err = verify_tl_signature(
-                    merkle_root=merkle_root, seq=int(seq), sth_sig=sth_sig, jwks=jwks, signer_kid=signer_kid
+    def _checks(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._check_executor is None:
+                self._check_executor = ThreadPoolExecutor(
+                    max_workers=5 * self.workers, thread_name_prefix="oord-verify-check"
                 )
-                summary["tl"]["sig_verified"] = ok_sig
-                if ok_sig is False:
-                    summary["tl"]["ok"] = False
-                    summary["tl"]["error"] = sig_err or "TL signature verification failed"
-                    summary["error"] = summary["tl"]["error"]
-                    if sig_err and "not found in JWKS" in sig_err:
-                        summary["reason_ids"] = ["TL_KEY_MISSING"]
-                    else:
-                        summary["reason_ids"] = ["TL_PROOF_SIG_INVALID"]
-                    return False, summary
-
-            online_enabled = bool(online or tl_url)
-            summary["tl_online"]["enabled"] = online_enabled
-
-            if online_enabled:
-                if not tl_url:
-                    summary["tl_online"]["ok"] = False
-                    summary["tl_online"]["reason_id"] = "ENV_NOTARY_URL_MISSING"
-                    summary["tl_online"]["error"] = "online enabled but no --tl-url/--notary-url provided"
-                    summary["error"] = summary["tl_online"]["error"]
-                    summary["reason_ids"] = ["ENV_NOTARY_URL_MISSING"]
-                    return False, summary
-
-                if tl_obj is None or seq is None or merkle_root is None:
-                    summary["tl_online"]["ok"] = None
-                    summary["tl_online"]["reason_id"] = None
-                    summary["tl_online"]["error"] = None
-                else:
-                    client = NotaryClient(base_url=tl_url, api_key=tl_api_key, timeout_s=float(tl_timeout_s))
-                    ok_online, rid, err = online_tl_check(client, int(seq), merkle_root, sth_sig)
-                    summary["tl_online"]["ok"] = ok_online
-                    summary["tl_online"]["reason_id"] = rid
-                    summary["tl_online"]["error"] = err
-                    if not ok_online and rid:
-                        summary["error"] = err or "online TL check failed"
-                        summary["reason_ids"] = [rid]
-                        return False, summary
+            return self._check_executor
+
+    def _cache_get(self, key: Tuple[str, int, int]) -> Optional[Tuple[bool, Dict[str, Any]]]:
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is None:
+                return None
+            self._cache.move_to_end(key)
+        return hit[0], copy.deepcopy(hit[1])
+
+    def _cache_put(self, key: Tuple[str, int, int], ok: bool, summary: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[key] = (ok, copy.deepcopy(summary))
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _step_manifest(self, z: Bundle, summary: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[_Failure]]:
+        try:
+            manifest = load_manifest(z)
+        except DeadlineExceeded:
+            raise
+        except RuntimeError as e:
+            msg = str(e)
+            if "manifest.json missing from bundle" in msg:
+                return None, ("BUNDLE_MANIFEST_MISSING", msg)
+            if "manifest.json is not valid JSON" in msg:
+                return None, ("BUNDLE_MANIFEST_INVALID_JSON", msg)
+            return None, ("BUNDLE_MANIFEST_INVALID_SHAPE", msg)
+
+        m = _manifest_meta(manifest)
+        if isinstance(summary.get("batch"), dict):
+            summary["batch"].update(m)
+        summary["manifest_sig"]["key_id"] = m.get("key_id")
+        return manifest, None
+
+    def _step_hashes(
+        self, z: Bundle, manifest: Dict[str, Any], summary: Dict[str, Any], deadline: Optional[Deadline] = None
+    ) -> Optional[_Failure]:
+        meter = BudgetMeter(self.budgets) if self.budgets.enabled() else None
+        log = MismatchLog(self.max_mismatches, self.stop_after_mismatches)
+        sample: Optional[Set[str]] = None
+        if self.sampling.enabled():
+            sample, summary["sampling"] = choose_sample(manifest, self.sampling)
+        if self.baseline is not None:
+            # Members unchanged since the baseline are only checked against the archive directory, like unsampled ones.
+            sample, summary["delta"] = self.baseline.plan(z, manifest, sample)
+        if self.progress is not None:
+            if "delta" in summary:
+                self.progress.expect(summary["delta"]["bytes_rehashed"])
+            elif sample is not None:
+                self.progress.expect(summary["sampling"]["bytes_sampled"])
             else:
-                summary["tl_online"]["ok"] = None
-                summary["tl_online"]["reason_id"] = None
-                summary["tl_online"]["error"] = None
-
-    except zipfile.BadZipFile as e:
-        summary["error"] = f"bad zip file: {e}"
-        summary["error_kind"] = "env"
-        summary["reason_ids"] = ["ZIP_BAD"]
-        return False, summary
-    except RuntimeError as e:
-        summary["error"] = str(e)
-        if not summary.get("reason_ids"):
-            summary["reason_ids"] = ["RUNTIME_ERROR"]
+                self.progress.expect(_manifest_meta(manifest)["total_bytes"])
+        try:
+            hashes_ok, mismatches = _check_hashes_from_manifest(
+                z, manifest, meter, log, sample, deadline, self.progress
+            )
+        except DeadlineExceeded:
+            # Keep what was found before the deadline; hashes_ok stays unknown.
+            summary["hash_mismatches"] = log.entries
+            summary["hash_mismatch_counts"] = dict(log.counts)
+            summary["hash_mismatches_truncated"] = True
+            raise
+        summary["hashes_ok"] = hashes_ok
+        summary["hash_mismatches"] = mismatches
+        summary["hash_mismatch_counts"] = dict(log.counts)
+        summary["hash_mismatches_truncated"] = log.truncated
+        if not hashes_ok:
+            return "HASH_MISMATCH", "hash mismatch (bundle payload does not match manifest)"
+        return None
+
+    def _step_merkle(
+        self, manifest: Dict[str, Any], summary: Dict[str, Any], deadline: Optional[Deadline] = None
+    ) -> Optional[_Failure]:
+        merkle_info = manifest.get("merkle")
+        if not isinstance(merkle_info, dict):
+            summary["merkle"]["ok"] = False
+            summary["merkle"]["error"] = "manifest.merkle is missing or not an object"
+            return "MERKLE_SCHEMA_INVALID", summary["merkle"]["error"]
+
+        manifest_root = merkle_info.get("root_cid")
+        if not isinstance(manifest_root, str):
+            summary["merkle"]["ok"] = False
+            summary["merkle"]["error"] = "manifest.merkle.root_cid is missing or not a string"
+            return "MERKLE_SCHEMA_INVALID", summary["merkle"]["error"]
+
+        summary["merkle"]["manifest_root"] = manifest_root
+        try:
+            recomputed_root = compute_merkle_root_from_manifest_files(manifest.get("files") or [], deadline)
+        except ValueError as e:
+            summary["merkle"]["ok"] = False
+            summary["merkle"]["error"] = f"failed to recompute Merkle root from manifest.files: {e}"
+            return "MERKLE_COMPUTE_ERROR", summary["merkle"]["error"]
+
+        summary["merkle"]["recomputed_root"] = recomputed_root
+        if recomputed_root != manifest_root:
+            summary["merkle"]["ok"] = False
+            summary["merkle"]["error"] = "recomputed Merkle root does not match manifest.merkle.root_cid"
+            return "MERKLE_MISMATCH", summary["merkle"]["error"]
+        summary["merkle"]["ok"] = True
+        return None
+
+    def _step_jwks(self, z: Bundle, summary: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[_Failure]]:
+        try:
+            jwks = load_jwks(z)
+        except DeadlineExceeded:
+            raise
+        except RuntimeError as e:
+            msg = str(e)
+            summary["jwks"]["present"] = False
+            summary["jwks"]["ok"] = False
+            summary["jwks"]["error"] = msg
+            if "jwks_snapshot.json missing from bundle" in msg:
+                return None, ("JWKS_MISSING", msg)
+            if "jwks_snapshot.json is not valid JSON" in msg:
+                return None, ("JWKS_INVALID_JSON", msg)
+            return None, ("JWKS_INVALID_SHAPE", msg)
+
+        kids: List[str] = []
+        for k in jwks.get("keys", []):
+            kid = k.get("kid")
+            if kid:
+                kids.append(kid)
+        summary["jwks"].update(
+            {"present": True, "ok": True, "kids": kids, "fingerprint": jwks_fingerprint(jwks), "error": None}
+        )
+        return jwks, None
+
+    def _step_manifest_sig(
+        self, manifest: Dict[str, Any], jwks: Dict[str, Any], summary: Dict[str, Any]
+    ) -> Optional[_Failure]:
+        ok_manifest_sig, ms_err = verify_manifest_signature(manifest, jwks, keyring=self.keyring)
+        summary["manifest_sig"]["sig_verified"] = ok_manifest_sig
+        summary["manifest_sig"]["error"] = ms_err
+        if ok_manifest_sig is False:
+            summary["manifest_sig"]["ok"] = False
+            return "MANIFEST_SIG_INVALID", ms_err or "manifest signature verification failed"
+        summary["manifest_sig"]["ok"] = ok_manifest_sig
+        return None
+
+    def _step_tl_proof(
+        self, z: Bundle, manifest: Dict[str, Any], manifest_root: Optional[str], summary: Dict[str, Any]
+    ) -> Tuple[Optional[_TLFields], Optional[_Failure]]:
+        m_tl_mode = manifest.get("tl_mode")
+        if not isinstance(m_tl_mode, str):
+            summary["tl"]["present"] = False
+            summary["tl"]["ok"] = False
+            summary["tl"]["error"] = "manifest.tl_mode missing or not a string"
+            return None, ("TL_MODE_MISSING", summary["tl"]["error"])
+        if m_tl_mode not in ("included", "none"):
+            summary["tl"]["present"] = False
+            summary["tl"]["ok"] = False
+            summary["tl"]["error"] = f"invalid manifest.tl_mode={m_tl_mode!r} (expected 'included'|'none')"
+            return None, ("TL_MODE_INVALID", summary["tl"]["error"])
+
+        tl_required = m_tl_mode == "included"
+        summary["tl"]["required"] = tl_required
+
+        tl_file_present = _has_member(z, "tl_proof.json")
+        if m_tl_mode == "none" and tl_file_present:
+            summary["tl"]["present"] = True
+            summary["tl"]["ok"] = False
+            summary["tl"]["error"] = "tl_proof.json present but manifest.tl_mode=none"
+            return None, ("TL_PROOF_UNEXPECTED", summary["tl"]["error"])
+
+        try:
+            tl_obj = load_tl_proof(z)
+        except DeadlineExceeded:
+            raise
+        except RuntimeError as e:
+            msg = str(e)
+            if "tl_proof.json missing from bundle" in msg:
+                if tl_required:
+                    summary["tl"]["present"] = False
+                    summary["tl"]["ok"] = False
+                    summary["tl"]["error"] = "tl_proof.json missing but manifest.tl_mode=included"
+                    return None, ("TL_PROOF_MISSING", summary["tl"]["error"])
+                summary["tl"]["present"] = False
+                summary["tl"]["ok"] = True
+                summary["tl"]["error"] = None
+                return None, None
+            summary["tl"]["present"] = False
+            summary["tl"]["ok"] = False
+            summary["tl"]["error"] = msg
+            return None, ("TL_PROOF_JSON_INVALID", msg)
+
+        merkle_root, seq, sth_sig, signer_kid = normalize_tl_fields(tl_obj)
+        if merkle_root is None or seq is None:
+            summary["tl"]["present"] = True
+            summary["tl"]["ok"] = False
+            summary["tl"]["error"] = "tl_proof.json missing merkle_root or seq"
+            return None, ("TL_PROOF_SCHEMA_INVALID", summary["tl"]["error"])
+
+        fields = (merkle_root, int(seq), sth_sig, signer_kid)
+        if isinstance(manifest_root, str) and merkle_root != manifest_root:
+            summary["tl"]["present"] = True
+            summary["tl"]["ok"] = False
+            summary["tl"]["error"] = "tl_proof merkle_root does not match manifest.merkle.root_cid"
+            return fields, ("TL_ROOT_MISMATCH", summary["tl"]["error"])
+
+        summary["tl"].update(
+            {
+                "present": True,
+                "ok": True,
+                "seq": seq,
+                "merkle_root": merkle_root,
+                "sth_sig": sth_sig,
+                "signer_kid": signer_kid,
+                "sig_verified": None,
+                "error": None,
+            }
+        )
+        return fields, None
+
+    def _step_tl_sig(self, tl: _TLFields, jwks: Dict[str, Any], summary: Dict[str, Any]) -> Optional[_Failure]:
+        merkle_root, seq, sth_sig, signer_kid = tl
+        ok_sig, sig_err = verify_tl_signature(
+            merkle_root=merkle_root,
+            seq=seq,
+            sth_sig=sth_sig,
+            jwks=jwks,
+            signer_kid=signer_kid,
+            keyring=self.keyring,
+        )
+        summary["tl"]["sig_verified"] = ok_sig
+        if ok_sig is False:
+            summary["tl"]["ok"] = False
+            summary["tl"]["error"] = summary["tl"]["error"] or sig_err or "TL signature verification failed"
+            if sig_err and "not found in JWKS" in sig_err:
+                return "TL_KEY_MISSING", sig_err
+            return "TL_PROOF_SIG_INVALID", sig_err or "TL signature verification failed"
+        return None
+
+    def _prefetch_online(self, z: Bundle, deadline: Optional[Deadline] = None) -> Optional[_Prefetch]:
+        # Starts the notary lookup as soon as the TL proof can be read, so the round trip overlaps payload hashing.
+        # The result is only looked at by _step_online, after every offline check has passed.
+        if not self.tl_url or getattr(self._deferred, "active", False):
+            return None
+        try:
+            _, seq, _, _ = normalize_tl_fields(load_tl_proof(z))
+        except Exception:
+            # Whatever is wrong with the proof is reported by _step_tl_proof, in check order.
+            return None
+        if seq is None:
+            return None
+        client = self._notary()
+        if deadline is not None:
+            client = replace(client, timeout_s=deadline.cap(client.timeout_s))
+        return seq, self._checks().submit(fetch_tl_entry, client, seq)
+
+    def _step_online(
+        self,
+        tl: Optional[_TLFields],
+        summary: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        prefetched: Optional[_Prefetch] = None,
+    ) -> Optional[_Failure]:
+        online_enabled = bool(self.online or self.tl_url)
+        summary["tl_online"]["enabled"] = online_enabled
+        summary["tl_online"]["ok"] = None
+        summary["tl_online"]["reason_id"] = None
+        summary["tl_online"]["error"] = None
+        if not online_enabled:
+            return None
+
+        if not self.tl_url:
+            summary["tl_online"]["ok"] = False
+            summary["tl_online"]["reason_id"] = "ENV_NOTARY_URL_MISSING"
+            summary["tl_online"]["error"] = "online enabled but no --tl-url/--notary-url provided"
+            return "ENV_NOTARY_URL_MISSING", summary["tl_online"]["error"]
+
+        if tl is None:
+            return None
+        if getattr(self._deferred, "active", False):
+            self._deferred.tl = tl
+            return None
+        merkle_root, seq, sth_sig, _ = tl
+        if deadline is not None:
+            deadline.check("tl_online")
+        if prefetched is not None and prefetched[0] == seq:
+            ok_online, rid, err = classify_lookup(_await(prefetched[1], deadline, "tl_online"), seq, merkle_root)
+        else:
+            client = self._notary()
+            if deadline is not None:
+                client = replace(client, timeout_s=deadline.cap(client.timeout_s))
+            ok_online, rid, err = online_tl_check(client, seq, merkle_root, sth_sig)
+        if deadline is not None and not ok_online:
+            # A notary request cut short by our own deadline is a timeout, not an unreachable notary.
+            deadline.check("tl_online")
+        summary["tl_online"]["ok"] = ok_online
+        summary["tl_online"]["reason_id"] = rid
+        summary["tl_online"]["error"] = err
+        if not ok_online and rid:
+            return rid, err or "online TL check failed"
+        return None
+
+    def _verify_opened(
+        self, z: Bundle, summary: Dict[str, Any], deadline: Optional[Deadline] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        def check(stage: str) -> None:
+            set_stage(stage)
+            if deadline is not None:
+                deadline.check(stage)
+
+        if self.budgets.enabled():
+            check_entries(self.budgets, z.entries())
+        check("manifest")
+        manifest, fail = self._step_manifest(z, summary)
+        if manifest is None:
+            return _fail(summary, fail)
+        if self.all_checks:
+            return self._verify_all(z, manifest, summary, deadline)
+
+        prefetched = self._prefetch_online(z, deadline)
+        try:
+            return self._verify_steps(z, manifest, summary, check, deadline, prefetched)
+        finally:
+            if prefetched is not None:
+                # Not needed when an offline check failed first; a lookup already in flight just finishes unread.
+                prefetched[1].cancel()
+
+    def _verify_steps(
+        self,
+        z: Bundle,
+        manifest: Dict[str, Any],
+        summary: Dict[str, Any],
+        check: Callable[[str], None],
+        deadline: Optional[Deadline],
+        prefetched: Optional[_Prefetch],
+    ) -> Tuple[bool, Dict[str, Any]]:
+        set_stage("hashes")
+        fail = self._step_hashes(z, manifest, summary, deadline)
+        if fail:
+            return _fail(summary, fail)
+        check("merkle")
+        fail = self._step_merkle(manifest, summary, deadline)
+        if fail:
+            return _fail(summary, fail)
+        check("jwks")
+        jwks, fail = self._step_jwks(z, summary)
+        if jwks is None:
+            return _fail(summary, fail)
+        check("manifest_sig")
+        fail = self._step_manifest_sig(manifest, jwks, summary)
+        if fail:
+            return _fail(summary, fail)
+        check("tl")
+        tl, fail = self._step_tl_proof(z, manifest, summary["merkle"]["manifest_root"], summary)
+        if fail:
+            return _fail(summary, fail)
+        if tl is not None:
+            fail = self._step_tl_sig(tl, jwks, summary)
+            if fail:
+                return _fail(summary, fail)
+        set_stage("tl_online")
+        fail = self._step_online(tl, summary, deadline, prefetched)
+        if fail:
+            return _fail(summary, fail)
+        return True, summary
+
+    def _verify_all(
+        self, z: Bundle, manifest: Dict[str, Any], summary: Dict[str, Any], deadline: Optional[Deadline] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        summary["all_checks"] = True
+        merkle_info = manifest.get("merkle")
+        manifest_root = merkle_info.get("root_cid") if isinstance(merkle_info, dict) else None
+
+        # The JSON members are read up front so only the payload hashing touches the archive concurrently.
+        jwks, jwks_fail = self._step_jwks(z, summary)
+        tl, tl_fail = self._step_tl_proof(z, manifest, manifest_root, summary)
+
+        pool = self._checks()
+        hashes = pool.submit(staged, "hashes", self._step_hashes, z, manifest, summary, deadline)
+        merkle = pool.submit(staged, "merkle", self._step_merkle, manifest, summary, deadline)
+        manifest_sig = None
+        if jwks is not None:
+            manifest_sig = pool.submit(staged, "manifest_sig", self._step_manifest_sig, manifest, jwks, summary)
+        tl_sig = None
+        if tl is not None and jwks is not None:
+            tl_sig = pool.submit(staged, "tl", self._step_tl_sig, tl, jwks, summary)
+        online: Optional["Future[Optional[_Failure]]"] = None
+        if getattr(self._deferred, "active", False):
+            # Deferred for _verify_batched, which merges the result the way it is merged below.
+            self._step_online(tl, summary, deadline)
+        else:
+            online = pool.submit(staged, "tl_online", self._step_online, tl, summary, deadline)
+        # Let every check settle before reading results so none is still writing to summary if one raises.
+        wait([f for f in (hashes, merkle, manifest_sig, tl_sig, online) if f is not None])
+
+        failures: List[_Failure] = []
+        for f in (hashes, merkle):
+            r = f.result()
+            if r:
+                failures.append(r)
+        if jwks_fail:
+            failures.append(jwks_fail)
+        if manifest_sig is not None:
+            r = manifest_sig.result()
+            if r:
+                failures.append(r)
+        if tl_fail:
+            failures.append(tl_fail)
+        if tl_sig is not None:
+            r = tl_sig.result()
+            if r:
+                failures.append(r)
+
+        # Offline truth first: an unreachable notary must not turn a content failure into an env failure.
+        online_fail = online.result() if online is not None else None
+        if online_fail and not (failures and online_fail[0] in ENV_REASON_IDS):
+            failures.append(online_fail)
+
+        if not failures:
+            return True, summary
+        summary["error"] = failures[0][1]
+        summary["reason_ids"] = list(dict.fromkeys(rid for rid, _ in failures))
         return False, summary
 
-    return True, summary
+    def _deadline(self, deadline: Optional[Deadline]) -> Optional[Deadline]:
+        if deadline is None and self.timeout_s is not None:
+            return Deadline(self.timeout_s)
+        return deadline
+
+    def verify_path(self, path: Path, deadline: Optional[Deadline] = None) -> Tuple[bool, Dict[str, Any]]:
+        if path.is_dir():
+            return self.verify_dir(path, deadline)
+        summary = _new_summary(str(path), self.online)
+        deadline = self._deadline(deadline)
+
+        if not path.is_file():
+            summary["error"] = "bundle path does not exist or is not a file"
+            summary["error_kind"] = "env"
+            summary["reason_ids"] = ["ENV_PATH_MISSING"]
+            return False, summary
+
+        key: Optional[Tuple[str, int, int]] = None
+        if self.cache_size:
+            st = path.stat()
+            key = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+            hit = self._cache_get(key)
+            if hit is not None:
+                hit[1]["bundle_path"] = str(path)
+                return hit
+
+        set_stage("open")
+        try:
+            with path.open("rb") as fp:
+                z = ZipBundle(fp, COALESCE_BYTES, self.pipeline_depth, deadline)
+                ok, summary = self._verify_opened(z, summary, deadline)
+        except DeadlineExceeded as e:
+            ok, summary = _fail_timeout(summary, e)
+            key = None
+        except BudgetExceeded as e:
+            ok, summary = _fail_budget(summary, e)
+        except zipfile.BadZipFile as e:
+            ok, summary = _fail_bad_zip(summary, e)
+        except RuntimeError as e:
+            ok, summary = _fail_runtime(summary, e)
+        finally:
+            set_stage(None)
+
+        if key is not None and not getattr(self._deferred, "active", False):
+            self._cache_put(key, ok, summary)
+        return ok, summary
+
+    def verify_dir(self, path: Path, deadline: Optional[Deadline] = None) -> Tuple[bool, Dict[str, Any]]:
+        # An already-extracted bundle; same checks and reason IDs as the ZIP, minus the inflate. Not cached: a
+        # directory's mtime does not change when a file inside it is rewritten.
+        summary = _new_summary(str(path), self.online)
+        deadline = self._deadline(deadline)
+        set_stage("open")
+        try:
+            with DirBundle(path) as z:
+                return self._verify_opened(z, summary, deadline)
+        except DeadlineExceeded as e:
+            return _fail_timeout(summary, e)
+        except BudgetExceeded as e:
+            return _fail_budget(summary, e)
+        except RuntimeError as e:
+            return _fail_runtime(summary, e)
+        except OSError as e:
+            summary["error"] = f"bundle directory could not be read: {e}"
+            summary["error_kind"] = "env"
+            summary["reason_ids"] = ["ENV_PATH_UNREADABLE"]
+            return False, summary
+        finally:
+            set_stage(None)
+
+    def verify_url(self, url: str, deadline: Optional[Deadline] = None) -> Tuple[bool, Dict[str, Any]]:
+        summary = _new_summary(url, self.online)
+        deadline = self._deadline(deadline)
+        set_stage("open")
+        try:
+            with HTTPRangeFile(url, headers=self.http_headers, deadline=deadline) as fp:
+                z = ZipBundle(fp, pipeline_depth=self.pipeline_depth, deadline=deadline)
+                return self._verify_opened(z, summary, deadline)
+        except DeadlineExceeded as e:
+            return _fail_timeout(summary, e)
+        except HTTPRangeError as e:
+            summary["error"] = f"bundle URL could not be read: {e}"
+            summary["error_kind"] = "env"
+            summary["reason_ids"] = ["ENV_URL_UNREACHABLE"]
+            return False, summary
+        except BudgetExceeded as e:
+            return _fail_budget(summary, e)
+        except zipfile.BadZipFile as e:
+            return _fail_bad_zip(summary, e)
+        except RuntimeError as e:
+            return _fail_runtime(summary, e)
+        finally:
+            set_stage(None)
+
+    def verify_bytes(
+        self, buf: Any, label: str = "-", deadline: Optional[Deadline] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        # `buf` is any buffer-protocol object; payload members are inflated and hashed straight out of it.
+        summary = _new_summary(label, self.online)
+        deadline = self._deadline(deadline)
+        set_stage("open")
+        try:
+            with BufferFile(buf) as fp:
+                z = ZipBundle(fp, pipeline_depth=self.pipeline_depth, deadline=deadline)
+                return self._verify_opened(z, summary, deadline)
+        except DeadlineExceeded as e:
+            return _fail_timeout(summary, e)
+        except BudgetExceeded as e:
+            return _fail_budget(summary, e)
+        except zipfile.BadZipFile as e:
+            return _fail_bad_zip(summary, e)
+        except RuntimeError as e:
+            return _fail_runtime(summary, e)
+        finally:
+            set_stage(None)
+
+    def verify_stream(
+        self, stream: BinaryIO, label: str = "-", deadline: Optional[Deadline] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        summary = _new_summary(label, self.online)
+        deadline = self._deadline(deadline)
+        set_stage("stream")
+        try:
+            z = read_bundle_stream(stream, budgets=self.budgets, deadline=deadline)
+            return self._verify_opened(z, summary, deadline)
+        except DeadlineExceeded as e:
+            return _fail_timeout(summary, e)
+        except BudgetExceeded as e:
+            return _fail_budget(summary, e)
+        except zipfile.BadZipFile as e:
+            return _fail_bad_zip(summary, e)
+        except RuntimeError as e:
+            return _fail_runtime(summary, e)
+        finally:
+            set_stage(None)
+
+    def verify(self, target: Union[Path, str], deadline: Optional[Deadline] = None) -> Tuple[bool, Dict[str, Any]]:
+        if isinstance(target, str) and target.startswith(("http://", "https://")):
+            return self.verify_url(target, deadline)
+        return self.verify_path(Path(target), deadline)
+
+    def _verify_deferred(self, target: Union[Path, str]) -> Tuple[bool, Dict[str, Any], Optional[_TLFields]]:
+        state = self._deferred
+        state.active, state.tl = True, None
+        try:
+            ok, summary = self.verify(target)
+            return ok, summary, state.tl
+        finally:
+            state.active, state.tl = False, None
+
+    def _verify_batched(self, targets: Iterable[Union[Path, str]]) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        if self._batcher is None:
+            self._batcher = TLBatcher(self._notary())
+        it = iter(targets)
+        while True:
+            chunk = list(islice(it, self.tl_batch))
+            if not chunk:
+                return
+            if self.workers == 1:
+                results = [self._verify_deferred(t) for t in chunk]
+            else:
+                results = list(self._pool().map(self._verify_deferred, chunk))
+
+            # A deferred lookup means the bundle reached the online check: every offline check passed, or, with
+            # all_checks, the checks ran side by side and the bundle may already have failed.
+            pending = [(i, tl) for i, (_, _, tl) in enumerate(results) if tl is not None]
+            checked = self._batcher.check((tl[1], tl[0]) for _, tl in pending)
+            for (i, _), (ok_online, rid, err) in zip(pending, checked):
+                ok, summary, _ = results[i]
+                summary["tl_online"]["ok"] = ok_online
+                summary["tl_online"]["reason_id"] = rid
+                summary["tl_online"]["error"] = err
+                if not ok_online and rid:
+                    if ok:
+                        ok, summary = _fail(summary, (rid, err or "online TL check failed"))
+                    elif rid not in ENV_REASON_IDS:
+                        # As in _verify_all: offline failures come first and an unreachable notary adds nothing.
+                        summary["reason_ids"] = list(dict.fromkeys(summary["reason_ids"] + [rid]))
+                results[i] = (ok, summary, None)
+            for ok, summary, _ in results:
+                yield ok, summary
+
+    def verify_many(
+        self, targets: Iterable[Union[Path, str]], ordered: bool = False
+    ) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        # Online lookups are deferred and coalesced per window of bundles, so results come back in input order. A
+        # deferred lookup would count other bundles' checks against each bundle's deadline, so with timeout_s set
+        # lookups stay per bundle and tl_batch has no effect.
+        if self.tl_batch and self.tl_url and self.timeout_s is None:
+            yield from self._verify_batched(targets)
+            return
+        if self.workers == 1:
+            for t in targets:
+                yield self.verify(t)
+            return
+
+        pool = self._pool()
+        window = self.workers * 2
+        if ordered:
+            queue: Deque["Future[Tuple[bool, Dict[str, Any]]]"] = deque()
+            for t in targets:
+                queue.append(pool.submit(self.verify, t))
+                if len(queue) >= window:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+            return
+
+        pending: Set["Future[Tuple[bool, Dict[str, Any]]]"] = set()
+        for t in targets:
+            pending.add(pool.submit(self.verify, t))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    yield f.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield f.result()
+
+
+def verify_bundle(
+    path: Path,
+    tl_url: Optional[str] = None,
+    online: bool = False,
+    tl_api_key: Optional[str] = None,
+    tl_timeout_s: float = 5.0,
+    timeout_s: Optional[float] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    with Verifier(
+        tl_url=tl_url, online=online, tl_api_key=tl_api_key, tl_timeout_s=tl_timeout_s, timeout_s=timeout_s
+    ) as v:
+        return v.verify_path(path)
+
+
+def verify_bundle_bytes(
+    buf: Any,
+    label: str = "-",
+    tl_url: Optional[str] = None,
+    online: bool = False,
+    tl_api_key: Optional[str] = None,
+    tl_timeout_s: float = 5.0,
+    timeout_s: Optional[float] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    with Verifier(
+        tl_url=tl_url, online=online, tl_api_key=tl_api_key, tl_timeout_s=tl_timeout_s, timeout_s=timeout_s
+    ) as v:
+        return v.verify_bytes(buf, label=label)
+
+
+def verify_stream(
+    stream: BinaryIO,
+    label: str = "-",
+    tl_url: Optional[str] = None,
+    online: bool = False,
+    tl_api_key: Optional[str] = None,
+    tl_timeout_s: float = 5.0,
+) -> Tuple[bool, Dict[str, Any]]:
+    with Verifier(tl_url=tl_url, online=online, tl_api_key=tl_api_key, tl_timeout_s=tl_timeout_s) as v:
+        return v.verify_stream(stream, label=label)
+
+
+def verify_url(
+    url: str,
+    tl_url: Optional[str] = None,
+    online: bool = False,
+    tl_api_key: Optional[str] = None,
+    tl_timeout_s: float = 5.0,
+    http_headers: Optional[Dict[str, str]] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    with Verifier(
+        tl_url=tl_url, online=online, tl_api_key=tl_api_key, tl_timeout_s=tl_timeout_s, http_headers=http_headers
+    ) as v:
+        return v.verify_url(url)
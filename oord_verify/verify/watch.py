@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import shutil
+import stat
+import struct
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from oord_verify.verify.output import wrap_json
+from oord_verify.verify.results import ResultRecord
+from oord_verify.verify.verifier import Verifier
+
+BUNDLE_PATTERN = "oord_bundle_*.zip"
+SETTLE_S = 2.0
+POLL_INTERVAL_S = 1.0
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_IN_GONE = _IN_MOVED_FROM | _IN_DELETE
+_IN_Q_OVERFLOW = 0x00004000
+_EVENT = struct.Struct("iIII")
+
+# (size, mtime_ns) of a file as last seen; a change restarts the settle timer or re-arms a verified name.
+_Signature = Tuple[int, int]
+OnResult = Callable[[Dict[str, Any]], None]
+
+
+class Inotify:
+    # Linux inotify through libc. Raises OSError where it is unavailable, and callers then fall back to polling.
+    def __init__(self, root: Path) -> None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            init1, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (OSError, AttributeError) as e:
+            raise OSError(f"inotify is not available: {e}")
+        fd = init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if add_watch(fd, os.fsencode(root), _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_GONE) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed for {root}")
+        self.fd = fd
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def read(self, timeout_s: float) -> Tuple[List[Tuple[int, str]], bool]:
+        # (mask, name) events for the watched directory, and whether the kernel queue overflowed.
+        ready, _, _ = select.select([self.fd], [], [], timeout_s)
+        if not ready:
+            return [], False
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return [], False
+        events: List[Tuple[int, str]] = []
+        overflow = False
+        pos = 0
+        while pos + _EVENT.size <= len(data):
+            _, mask, _, n = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            name = data[pos : pos + n].rstrip(b"\0")
+            pos += n
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+            elif name:
+                events.append((mask, os.fsdecode(name)))
+        return events, overflow
+
+
+class Watcher:
+    # Verifies bundles as they land in one directory. With inotify a close-after-write or rename event means the file
+    # is complete; otherwise (and for files found by a scan) its size and mtime must hold still for settle_s. Verified
+    # names are remembered with their signature, so nothing is verified twice unless it is rewritten.
+    def __init__(
+        self,
+        root: Path,
+        verifier: Verifier,
+        on_result: OnResult,
+        pattern: str = BUNDLE_PATTERN,
+        settle_s: float = SETTLE_S,
+        poll_interval_s: float = POLL_INTERVAL_S,
+        existing: bool = False,
+        use_inotify: bool = True,
+        workers: int = 1,
+        pass_dir: Optional[Path] = None,
+        fail_dir: Optional[Path] = None,
+    ) -> None:
+        self.root = root
+        self.verifier = verifier
+        self.on_result = on_result
+        self.pattern = pattern
+        self.settle_s = float(settle_s)
+        self.poll_interval_s = float(poll_interval_s)
+        self.existing = bool(existing)
+        self.workers = max(1, int(workers))
+        self.pass_dir = pass_dir
+        self.fail_dir = fail_dir
+        self.inotify: Optional[Inotify] = None
+        if use_inotify:
+            try:
+                self.inotify = Inotify(root)
+            except OSError:
+                self.inotify = None
+        self.submitted = 0
+        self.completed = 0
+        self._pending: Dict[str, Tuple[_Signature, float]] = {}
+        self._done: Dict[str, _Signature] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._max_bundles: Optional[int] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self.inotify is not None else "polling"
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    def _signature(self, name: str) -> Optional[_Signature]:
+        try:
+            st = os.lstat(self.root / name)
+        except FileNotFoundError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def _observe(self, name: str, sig: _Signature, now: float) -> None:
+        if self._done.get(name) == sig:
+            return
+        prev = self._pending.get(name)
+        if prev is None or prev[0] != sig:
+            self._pending[name] = (sig, now)
+        elif now - prev[1] >= self.settle_s:
+            self._submit(name, sig)
+
+    def scan(self, now: float, full: bool = True) -> None:
+        # full: list the directory (polling, startup, inotify overflow); otherwise only re-stat settling candidates.
+        if not full:
+            for name in list(self._pending):
+                sig = self._signature(name)
+                if sig is None:
+                    del self._pending[name]
+                else:
+                    self._observe(name, sig, now)
+            return
+        seen = set()
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if not fnmatch.fnmatchcase(entry.name, self.pattern):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                seen.add(entry.name)
+                self._observe(entry.name, (st.st_size, st.st_mtime_ns), now)
+        for name in set(self._pending) - seen:
+            del self._pending[name]
+        for name in set(self._done) - seen:
+            del self._done[name]
+
+    def _closed(self, name: str) -> None:
+        if not fnmatch.fnmatchcase(name, self.pattern):
+            return
+        sig = self._signature(name)
+        if sig is not None and self._done.get(name) != sig:
+            self._submit(name, sig)
+
+    def _submit(self, name: str, sig: _Signature) -> None:
+        self._pending.pop(name, None)
+        self._done[name] = sig
+        if self._max_bundles is not None and self.submitted >= self._max_bundles:
+            return
+        self.submitted += 1
+        assert self._pool is not None
+        self._pool.submit(self._verify, name).add_done_callback(self._finished)
+
+    def _verify(self, name: str) -> Dict[str, Any]:
+        path = self.root / name
+        ok, summary = self.verifier.verify_path(path)
+        exit_code = ResultRecord.from_summary(ok, summary, keep_payload=False).exit_code
+        record: Dict[str, Any] = {"bundle": str(path), "ok": ok, "result": wrap_json(summary, exit_code)}
+        # Environment failures (notary down, timeout) say nothing about the bundle, so it stays where it is.
+        dest_dir = self.pass_dir if exit_code == 0 else self.fail_dir if exit_code == 1 else None
+        if dest_dir is not None:
+            dest = dest_dir / name
+            try:
+                shutil.move(str(path), str(dest))
+                record["moved_to"] = str(dest)
+            except OSError as e:
+                record["move_error"] = str(e)
+        return record
+
+    def _finished(self, future: "Future[Dict[str, Any]]") -> None:
+        if future.cancelled():
+            return
+        try:
+            record = future.result()
+        except Exception as e:
+            record = {"bundle": None, "ok": False, "error": f"watch worker failed: {e}"}
+        with self._lock:
+            self.on_result(record)
+            self.completed += 1
+            if self._max_bundles is not None and self.completed >= self._max_bundles:
+                self._stop.set()
+
+    def run(self, max_bundles: Optional[int] = None) -> None:
+        # Blocks until stop() is called, or until max_bundles results have been reported.
+        self._max_bundles = max_bundles
+        for d in (self.pass_dir, self.fail_dir):
+            if d is not None:
+                d.mkdir(parents=True, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="oord-watch")
+        try:
+            now = time.monotonic()
+            self.scan(now)
+            if not self.existing:
+                # Whatever is already there counts as seen; a file still being written changes and is picked up.
+                self._done.update((name, sig) for name, (sig, _) in self._pending.items())
+                self._pending.clear()
+            self._loop()
+        finally:
+            # Bundles already being verified are finished and reported; queued ones are dropped on an early stop.
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self.close()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            if self.inotify is None:
+                if self._stop.wait(self.poll_interval_s):
+                    return
+                self.scan(time.monotonic())
+                continue
+            timeout_s = min(self.poll_interval_s, self.settle_s) if self._pending else self.poll_interval_s
+            events, overflow = self.inotify.read(timeout_s)
+            for mask, name in events:
+                if mask & _IN_GONE:
+                    self._done.pop(name, None)
+                    self._pending.pop(name, None)
+                else:
+                    self._closed(name)
+            self.scan(time.monotonic(), full=overflow)
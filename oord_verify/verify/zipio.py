@@ -1,9 +1,215 @@
+import hashlib
 import json
+import os
 import zipfile
-from typing import Any, Dict
+from array import array
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
 
+from oord_verify.verify.cdir import CentralDirectory, MemberReader, RunDigests
+from oord_verify.verify.deadline import Deadline
+from oord_verify.verify.pipeline import prefetch
 
-def load_json_member(z: zipfile.ZipFile, name: str) -> Dict[str, Any]:
+HASH_CHUNK_SIZE = 1024 * 1024
+# Small reads against local files are served from blocks of this size (see MemberReader).
+COALESCE_BYTES = 256 * 1024
+# Members at least this large are read and inflated on a separate thread while the caller hashes.
+PIPELINE_MIN_BYTES = 4 * HASH_CHUNK_SIZE
+PIPELINE_DEPTH = 4
+# Scheduled members no larger than this, compressed and inflated, are hashed in runs of up to SMALL_RUN_BYTES of
+# archive read with one I/O (see MemberReader.digest_run).
+SMALL_MEMBER_BYTES = 64 * 1024
+SMALL_RUN_BYTES = 1024 * 1024
+# Covers a member's local header (30 bytes plus name and extra field) when hinting readahead.
+_READAHEAD_SLACK = 64 * 1024
+
+ChunkCallback = Callable[[int], None]
+# (crc32, compressed size, uncompressed size, compression method) as recorded in the central directory.
+Fingerprint = Tuple[int, int, int, int]
+
+
+class Bundle(Protocol):
+    def namelist(self) -> List[str]: ...
+
+    def entries(self) -> Iterator[Tuple[str, int, int]]: ...
+
+    def info(self, name: str) -> Tuple[int, int]: ...
+
+    def read(self, name: str) -> bytes: ...
+
+    def digest(self, name: str, on_chunk: Optional[ChunkCallback] = None) -> Tuple[str, int]: ...
+
+    def schedule(self, names: List[str]) -> List[str]: ...
+
+    def fingerprint(self, name: str) -> Optional[Fingerprint]: ...
+
+
+def _fileno(fp: BinaryIO) -> Optional[int]:
+    if not hasattr(os, "posix_fadvise"):
+        return None
+    try:
+        return fp.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class ZipBundle:
+    def __init__(
+        self, fp: BinaryIO, coalesce: int = 0, pipeline_depth: int = 0, deadline: Optional[Deadline] = None
+    ) -> None:
+        self.fp = fp
+        self.pipeline_depth = pipeline_depth
+        self.deadline = deadline
+        self.cdir = CentralDirectory(fp)
+        self._members = MemberReader(fp, self.cdir, coalesce)
+        self._zipfile: Optional[zipfile.ZipFile] = None
+        self._fd = _fileno(fp)
+        self._next: Dict[int, int] = {}
+        self._runs: List[List[int]] = []
+        self._run_of: Optional["array[int]"] = None
+        self._run_pos: Optional["array[int]"] = None
+        self._batch: Optional[Tuple[int, RunDigests]] = None
+        self._order: List[str] = []
+        self._order_idx: "array[int]" = array("q")
+        self._cursor = 0
+
+    def schedule(self, names: List[str]) -> List[str]:
+        # Visit members in archive order so reads sweep the file once instead of seeking back and forth; names that
+        # are not in the archive sort first and fail fast in digest().
+        keyed: List[Tuple[int, int, str]] = []
+        for name in names:
+            try:
+                i = self.cdir.index(name)
+            except KeyError:
+                keyed.append((-1, -1, name))
+                continue
+            keyed.append((self.cdir.offsets[i], i, name))
+        keyed.sort(key=lambda k: k[0])
+        self._order = [name for _, _, name in keyed]
+        self._order_idx = array("q", [i for _, i, _ in keyed])
+        self._cursor = 0
+        indices = [i for _, i, _ in keyed if i >= 0]
+        self._plan_runs(indices)
+        if self._fd is not None:
+            self._next = dict(zip(indices, indices[1:]))
+            try:
+                os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                self._fd = None
+        return list(self._order)
+
+    def _index(self, name: str) -> int:
+        # Callers walking the schedule in order get the member index computed there instead of a second lookup.
+        c = self._cursor
+        if c < len(self._order) and self._order[c] is name:
+            self._cursor = c + 1
+            i = self._order_idx[c]
+            if i >= 0:
+                return i
+        return self.cdir.index(name)
+
+    def _plan_runs(self, indices: List[int]) -> None:
+        runs = self._members.plan_runs(indices, SMALL_MEMBER_BYTES, SMALL_RUN_BYTES)
+        self._runs = runs
+        self._batch = None
+        if not runs:
+            self._run_of = self._run_pos = None
+            return
+        n = len(self.cdir)
+        self._run_of = array("q", [-1]) * n
+        self._run_pos = array("q", [0]) * n
+        for r, run in enumerate(runs):
+            for k, i in enumerate(run):
+                self._run_of[i] = r
+                self._run_pos[i] = k
+
+    def _digest_batched(self, i: int, r: int, on_chunk: Optional[ChunkCallback]) -> Tuple[str, int]:
+        assert self._run_pos is not None
+        if self._batch is None or self._batch[0] != r:
+            if r + 1 < len(self._runs) and self._fd is not None:
+                start, end = self._members.run_span(self._runs[r + 1])
+                try:
+                    os.posix_fadvise(self._fd, start, end - start, os.POSIX_FADV_WILLNEED)
+                except OSError:
+                    self._fd = None
+            self._batch = (r, self._members.digest_run(self._runs[r]))
+        digests, sizes, errors = self._batch[1]
+        k = self._run_pos[i]
+        if k in errors:
+            raise errors[k]
+        size = sizes[k]
+        if on_chunk is not None and size:
+            on_chunk(size)
+        return digests[32 * k : 32 * k + 32].hex(), size
+
+    def _readahead(self, i: int) -> None:
+        # Ask the kernel to start fetching the next scheduled member while this one is being hashed.
+        j = self._next.get(i)
+        if j is None or self._fd is None:
+            return
+        start = self.cdir.offsets[j]
+        try:
+            os.posix_fadvise(self._fd, start, self.cdir.compressed[j] + _READAHEAD_SLACK, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            self._fd = None
+
+    def _chunks(self, name: str, i: Optional[int] = None) -> Iterator[bytes]:
+        if i is None:
+            i = self.cdir.index(name)
+        self._readahead(i)
+        try:
+            return self._members.chunks(i, name)
+        except NotImplementedError:
+            pass
+        # Compression methods beyond stored/deflate/bzip2 are rare enough to hand to zipfile wholesale.
+        if self._zipfile is None:
+            self._zipfile = zipfile.ZipFile(self.fp)
+        return _read_chunks(self._zipfile.open(name))
+
+    def namelist(self) -> List[str]:
+        return [self.cdir.name(i) for i in range(len(self.cdir))]
+
+    def entries(self) -> Iterator[Tuple[str, int, int]]:
+        return iter(self.cdir)
+
+    def info(self, name: str) -> Tuple[int, int]:
+        i = self.cdir.index(name)
+        return self.cdir.compressed[i], self.cdir.sizes[i]
+
+    def fingerprint(self, name: str) -> Optional[Fingerprint]:
+        cd = self.cdir
+        i = cd.index(name)
+        return cd.crcs[i], cd.compressed[i], cd.sizes[i], cd.methods[i]
+
+    def read(self, name: str) -> bytes:
+        return b"".join(self._chunks(name))
+
+    def digest(self, name: str, on_chunk: Optional[ChunkCallback] = None) -> Tuple[str, int]:
+        i = self._index(name)
+        if self._run_of is not None and self._run_of[i] >= 0:
+            return self._digest_batched(i, self._run_of[i], on_chunk)
+        chunks = self._chunks(name, i)
+        if self.pipeline_depth and self.info(name)[1] >= PIPELINE_MIN_BYTES:
+            chunks = prefetch(chunks, self.pipeline_depth, self.deadline)
+        h = hashlib.sha256()
+        size = 0
+        for chunk in chunks:
+            h.update(chunk)
+            size += len(chunk)
+            if on_chunk is not None:
+                on_chunk(len(chunk))
+        return h.hexdigest(), size
+
+
+def _read_chunks(f: BinaryIO) -> Iterator[bytes]:
+    with f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def load_json_member(z: Bundle, name: str) -> Dict[str, Any]:
     try:
         raw = z.read(name).decode("utf-8")
     except KeyError:
@@ -17,15 +223,15 @@ def load_json_member(z: zipfile.ZipFile, name: str) -> Dict[str, Any]:
     return obj
 
 
-def load_manifest(z: zipfile.ZipFile) -> Dict[str, Any]:
+def load_manifest(z: Bundle) -> Dict[str, Any]:
     return load_json_member(z, "manifest.json")
 
 
-def load_tl_proof(z: zipfile.ZipFile) -> Dict[str, Any]:
+def load_tl_proof(z: Bundle) -> Dict[str, Any]:
     return load_json_member(z, "tl_proof.json")
 
 
-def load_jwks(z: zipfile.ZipFile) -> Dict[str, Any]:
+def load_jwks(z: Bundle) -> Dict[str, Any]:
     obj = load_json_member(z, "jwks_snapshot.json")
     keys = obj.get("keys")
     if not isinstance(keys, list) or not keys:
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from oord_verify.notary_client.sim import NotarySimulator, SimConfig
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli_json
+
+_FILES = {"files/a.txt": b"alpha", "files/b.txt": b"beta"}
+
+
+def _multi_failure_bundle(tmp_path: Path) -> Path:
+    return build_bundle(
+        tmp_path / "multi.zip",
+        _FILES,
+        payload_overrides={"files/a.txt": b"tampered"},
+        manifest_overrides={"merkle": {"root_cid": "cid:sha256:" + "1" * 64}},
+    )
+
+
+def test_first_failure_mode_stops_at_hashes(tmp_path: Path) -> None:
+    with Verifier() as v:
+        ok, summary = v.verify(_multi_failure_bundle(tmp_path))
+    assert not ok
+    assert summary["reason_ids"] == ["HASH_MISMATCH"]
+    assert summary["merkle"]["ok"] is None
+
+
+def test_all_checks_reports_every_failure(tmp_path: Path) -> None:
+    with Verifier(all_checks=True) as v:
+        ok, summary = v.verify(_multi_failure_bundle(tmp_path))
+    assert not ok
+    assert summary["reason_ids"] == ["HASH_MISMATCH", "MERKLE_MISMATCH", "TL_ROOT_MISMATCH"]
+    assert summary["error"] == "hash mismatch (bundle payload does not match manifest)"
+    assert summary["hashes_ok"] is False
+    assert summary["merkle"]["ok"] is False
+    assert summary["jwks"]["ok"] is True
+    assert summary["tl"]["ok"] is False
+
+
+def test_all_checks_passes_clean_bundle(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "good.zip", _FILES)
+    with Verifier(all_checks=True) as v:
+        ok, summary = v.verify(bundle)
+    assert ok, summary
+    assert summary["reason_ids"] == []
+
+
+def test_all_checks_offline_failure_masks_online_env_failure(tmp_path: Path) -> None:
+    code, obj, _, _ = run_cli_json(
+        ["verify", str(_multi_failure_bundle(tmp_path)), "--json", "--all-checks", "--online"]
+    )
+    assert code == 1
+    assert "ENV_NOTARY_URL_MISSING" not in obj["reason_ids"]
+    assert obj["tl_online"]["reason_id"] == "ENV_NOTARY_URL_MISSING"
+
+
+def test_all_checks_keeps_online_content_failure_next_to_offline_failure(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES, payload_overrides={"files/a.txt": b"tampered"})
+    with NotarySimulator({}, SimConfig()) as sim, Verifier(tl_url=sim.url, online=True, all_checks=True) as v:
+        ok, summary = v.verify(bundle)
+    assert not ok
+    assert summary["reason_ids"] == ["HASH_MISMATCH", "TL_ONLINE_NOT_FOUND"]
+    assert summary["tl_online"]["reason_id"] == "TL_ONLINE_NOT_FOUND"
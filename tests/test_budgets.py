@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from oord_verify.verify.limits import Budgets
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli_json
+
+_BOMB = {"files/zeros.bin": b"\0" * (8 * 1024 * 1024), "files/a.txt": b"alpha"}
+
+
+@pytest.mark.parametrize(
+    "budgets, reason_id",
+    [
+        (Budgets(max_members=3), "BUDGET_MEMBER_COUNT"),
+        (Budgets(max_total_bytes=1024 * 1024), "BUDGET_TOTAL_BYTES"),
+        (Budgets(max_ratio=50.0), "BUDGET_COMPRESSION_RATIO"),
+        (Budgets(max_manifest_bytes=64), "BUDGET_MANIFEST_SIZE"),
+    ],
+)
+def test_budget_breaches_have_dedicated_reason_ids(tmp_path: Path, budgets: Budgets, reason_id: str) -> None:
+    bundle = build_bundle(tmp_path / "bomb.zip", _BOMB)
+    with Verifier(budgets=budgets) as v:
+        ok, summary = v.verify(bundle)
+        ok_s, summary_s = v.verify_stream(io.BytesIO(bundle.read_bytes()))
+    assert not ok and not ok_s
+    assert summary["reason_ids"] == [reason_id]
+    assert summary_s["reason_ids"] == [reason_id]
+    assert summary["budget"]["reason_id"] == reason_id
+    assert summary["hashes_ok"] is None
+
+
+def test_member_count_breach_reports_the_count(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "bomb.zip", _BOMB)
+    with Verifier(budgets=Budgets(max_members=3)) as v:
+        _, summary = v.verify(bundle)
+        _, summary_s = v.verify_stream(io.BytesIO(bundle.read_bytes()))
+    # manifest, JWKS, TL proof and two payload files; a stream stops reading at the fourth.
+    assert summary["budget"] == {"reason_id": "BUDGET_MEMBER_COUNT", "limit": 3, "actual": 5, "at_least": False}
+    assert summary_s["budget"] == {"reason_id": "BUDGET_MEMBER_COUNT", "limit": 3, "actual": 4, "at_least": True}
+
+
+def test_orphan_bytes_budget_skips_hashing_orphans(tmp_path: Path) -> None:
+    bundle = build_bundle(
+        tmp_path / "orphans.zip",
+        {"files/a.txt": b"alpha"},
+        extra_members={"files/orphan.bin": b"x" * 4096},
+    )
+    with Verifier(budgets=Budgets(max_orphan_bytes=1024)) as v:
+        ok, summary = v.verify(bundle)
+    assert not ok
+    assert summary["reason_ids"] == ["BUDGET_ORPHAN_BYTES"]
+
+
+def test_within_budget_bundle_passes(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "bomb.zip", _BOMB)
+    budgets = Budgets(max_members=10, max_total_bytes=64 * 1024 * 1024, max_ratio=5000.0, max_manifest_bytes=4096)
+    with Verifier(budgets=budgets) as v:
+        ok, summary = v.verify(bundle)
+    assert ok, summary
+
+
+def test_cli_budget_breach_is_content_failure(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "bomb.zip", _BOMB)
+    code, obj, _, _ = run_cli_json(["verify", str(bundle), "--json", "--max-ratio", "50"])
+    assert code == 1
+    assert obj["reason_ids"] == ["BUDGET_COMPRESSION_RATIO"]
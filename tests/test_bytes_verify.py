@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import pytest
+
+from oord_verify.verify.memio import BufferFile
+from oord_verify.verify.verifier import Verifier, verify_bundle_bytes
+from tests.util import build_bundle
+
+_FILES = {f"files/{i:02d}.bin": bytes([i]) * (3000 * i + 1) for i in range(12)}
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2])
+def test_bytes_match_path(tmp_path: Path, compression: int) -> None:
+    bundle = build_bundle(
+        tmp_path / "b.zip", _FILES, compression=compression, payload_overrides={"files/04.bin": b"tampered"}
+    )
+    data = bundle.read_bytes()
+    with Verifier() as v:
+        ok, summary = v.verify_path(bundle)
+        for buf in (data, bytearray(data), memoryview(data)):
+            ok_b, summary_b = v.verify_bytes(buf, label="upload-17")
+            assert summary_b["bundle_path"] == "upload-17"
+            assert (ok_b, dict(summary_b, bundle_path=None)) == (ok, dict(summary, bundle_path=None))
+    assert summary["reason_ids"] == ["HASH_MISMATCH"]
+
+
+def test_shared_memory_is_released(tmp_path: Path) -> None:
+    data = build_bundle(tmp_path / "b.zip", _FILES).read_bytes()
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[: len(data)] = data
+        ok, summary = verify_bundle_bytes(shm.buf[: len(data)], label="shm")
+        assert ok, summary
+    finally:
+        # Raises BufferError if the verifier still held a view of the segment.
+        shm.close()
+        shm.unlink()
+
+
+def test_not_a_zip() -> None:
+    ok, summary = verify_bundle_bytes(b"not a zip at all", label="junk")
+    assert not ok
+    assert summary["reason_ids"] == ["ZIP_BAD"]
+    assert summary["bundle_path"] == "junk"
+
+
+def test_buffer_file_behaves_like_bytesio() -> None:
+    data = bytes(range(256)) * 4
+    a, b = BufferFile(data), io.BytesIO(data)
+    for op in [(0, 0), (10, 0), (-5, 2), (3, 1), (5000, 0)]:
+        assert a.seek(*op) == b.seek(*op)
+        assert a.read(7) == b.read(7)
+        assert a.tell() == b.tell()
+    a.seek(1000)
+    b.seek(1000)
+    assert a.read() == b.read()
+    out = bytearray(5)
+    a.seek(2)
+    assert a.readinto(out) == 5 and bytes(out) == data[2:7]
+    # view() slices the caller's object instead of copying it.
+    assert a.view(10, 4).obj is data and bytes(a.view(10, 4)) == data[10:14]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from oord_verify.verify.cdir import CentralDirectory
+from oord_verify.verify.verifier import Verifier
+from oord_verify.verify.zipio import ZipBundle
+from tests.util import build_bundle
+
+
+def _zip(members: dict, compression: int = zipfile.ZIP_DEFLATED, **kw: object) -> io.BytesIO:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=compression, **kw) as z:
+        for name, data in members.items():
+            z.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA])
+def test_matches_zipfile(compression: int) -> None:
+    members = {f"files/{i}.txt": f"payload {i}".encode() * (i + 1) for i in range(50)}
+    members["files/ünïcode.txt"] = b"unicode"
+    buf = _zip(members, compression)
+    zb = ZipBundle(buf)
+    with zipfile.ZipFile(buf) as z:
+        assert zb.namelist() == z.namelist()
+        assert list(zb.entries()) == [(zi.filename, zi.compress_size, zi.file_size) for zi in z.infolist()]
+        for name in z.namelist():
+            assert zb.read(name) == z.read(name)
+    with pytest.raises(KeyError):
+        zb.info("files/missing")
+
+
+def test_duplicate_names_resolve_to_last_entry() -> None:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z, pytest.warns(UserWarning):
+        z.writestr("a", b"first")
+        z.writestr("a", b"second")
+    assert ZipBundle(buf).read("a") == b"second"
+
+
+def test_prepended_stub_and_comment() -> None:
+    buf = _zip({"a": b"alpha"})
+    with zipfile.ZipFile(buf, "a") as z:
+        z.comment = b"x" * 1000
+    stubbed = io.BytesIO(b"#!stub\n" * 100 + buf.getvalue())
+    assert ZipBundle(stubbed).read("a") == b"alpha"
+
+
+def test_zip64_central_directory() -> None:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", allowZip64=True) as z:
+        with z.open("big", "w", force_zip64=True) as f:
+            f.write(b"z" * 1000)
+    cd = CentralDirectory(buf)
+    assert list(cd) == [("big", cd.compressed[0], 1000)]
+    assert ZipBundle(buf).read("big") == b"z" * 1000
+
+
+def test_corrupt_member_is_bad_zip(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {"files/a.txt": b"alpha" * 100}, compression=zipfile.ZIP_STORED)
+    data = bytearray(bundle.read_bytes())
+    i = data.find(b"alphaalpha")
+    data[i] ^= 0xFF
+    bundle.write_bytes(bytes(data))
+    with Verifier() as v:
+        ok, summary = v.verify(bundle)
+    assert not ok
+    assert summary["reason_ids"] == ["ZIP_BAD"]
+    assert "Bad CRC-32" in summary["error"]
+
+
+def test_not_a_zip() -> None:
+    with pytest.raises(zipfile.BadZipFile):
+        CentralDirectory(io.BytesIO(b"not a zip at all" * 10))
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from oord_verify.verify.conformance import run_conformance
+from tests.util import build_bundle, run_cli, run_cli_json
+
+
+def _protocol_dir(tmp_path: Path) -> Path:
+    v1 = tmp_path / "oord-protocol" / "test-vectors" / "v1"
+    (v1 / "bundles").mkdir(parents=True)
+    (v1 / "expected").mkdir()
+    build_bundle(v1 / "bundles" / "good_001.zip", {"files/a.txt": b"alpha"})
+    build_bundle(
+        v1 / "bundles" / "tampered_001.zip", {"files/a.txt": b"alpha"}, payload_overrides={"files/a.txt": b"beta"}
+    )
+    (v1 / "expected" / "good_001.json").write_text(json.dumps({"reason_ids": [], "hashes_ok": True}))
+    (v1 / "expected" / "tampered_001.json").write_text(
+        json.dumps({"reason_ids": ["HASH_MISMATCH"], "hashes_ok": False})
+    )
+    lines = [
+        f"{hashlib.sha256(p.read_bytes()).hexdigest()}  bundles/{p.name}" for p in sorted((v1 / "bundles").iterdir())
+    ]
+    (v1 / "SHA256SUMS").write_text("\n".join(lines) + "\n")
+    return tmp_path / "oord-protocol"
+
+
+def test_conformance_passes_matching_vectors(tmp_path: Path) -> None:
+    report = run_conformance(_protocol_dir(tmp_path), workers=2)
+    assert report["ok"] is True, report
+    assert [v["name"] for v in report["vectors"]] == ["good_001", "tampered_001"]
+    assert [v["exit_code"] for v in report["vectors"]] == [0, 1]
+    assert all(v["seconds"] >= 0 for v in report["vectors"])
+
+
+def test_conformance_reports_diffs_and_checksum_errors(tmp_path: Path) -> None:
+    root = _protocol_dir(tmp_path)
+    v1 = root / "test-vectors" / "v1"
+    (v1 / "expected" / "good_001.json").write_text(json.dumps({"reason_ids": ["TL_MISSING"]}))
+    with (v1 / "bundles" / "tampered_001.zip").open("ab") as f:
+        f.write(b"\0")
+
+    code, obj, _, _ = run_cli_json(["conformance", "--protocol-dir", str(root), "--json"])
+    assert code == 1
+    by_name = {v["name"]: v for v in obj["vectors"]}
+    assert by_name["good_001"]["ok"] is False
+    assert any("reason_ids" in p for p in by_name["good_001"]["problems"])
+    assert any("sha256 mismatch" in p for p in by_name["tampered_001"]["problems"])
+    assert obj["failed"] == 2
+
+
+def test_conformance_missing_dir(tmp_path: Path) -> None:
+    p = run_cli(["conformance", "--protocol-dir", str(tmp_path / "nope")])
+    assert p.returncode == 2
+    assert "protocol vectors not found" in p.stderr
+
+
+def test_conformance_requires_a_protocol_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OORD_PROTOCOL_DIR", raising=False)
+    p = run_cli(["conformance"])
+    assert p.returncode == 2
+    assert "pass --protocol-dir or set OORD_PROTOCOL_DIR" in p.stderr
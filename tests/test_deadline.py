@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from oord_verify.verify.deadline import Deadline, DeadlineExceeded
+from oord_verify.verify.pipeline import prefetch
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli_json
+
+_FILES = {f"files/{i:02d}.txt": f"payload {i}".encode() for i in range(20)}
+
+
+class _ExpiresAfter(Deadline):
+    def __init__(self, checks: int) -> None:
+        super().__init__(3600)
+        self.left = checks
+
+    def expired(self) -> bool:
+        self.left -= 1
+        return self.left < 0
+
+
+def test_timeout_during_hashing_keeps_completed_sections(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES, payload_overrides={"files/00.txt": b"tampered"})
+    with Verifier() as v:
+        ok, summary = v.verify(bundle, deadline=_ExpiresAfter(6))
+    assert not ok
+    assert summary["reason_ids"] == ["TIMEOUT"]
+    assert summary["timeout"]["stage"] == "hashes"
+    assert summary["batch"]["file_count"] == 20
+    assert summary["hashes_ok"] is None
+    assert summary["hash_mismatch_counts"] == {"hash_mismatch": 1, "size_mismatch": 1}
+    assert summary["hash_mismatches_truncated"] is True
+
+
+def test_timeout_while_waiting_for_notary(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES)
+    with socket.socket() as silent:
+        silent.bind(("127.0.0.1", 0))
+        silent.listen()
+        url = f"http://127.0.0.1:{silent.getsockname()[1]}"
+        start = time.monotonic()
+        with Verifier(tl_url=url, online=True, tl_timeout_s=30, timeout_s=0.5) as v:
+            ok, summary = v.verify(bundle)
+    assert time.monotonic() - start < 5
+    assert not ok
+    assert summary["reason_ids"] == ["TIMEOUT"]
+    assert summary["timeout"]["stage"] == "tl_online"
+    assert summary["hashes_ok"] is True
+    assert summary["merkle"]["ok"] is True
+
+
+def test_cli_timeout_is_exit_2(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES)
+    code, obj, _, _ = run_cli_json(["verify", str(bundle), "--json", "--timeout-s", "0"])
+    assert code == 2
+    assert obj["reason_ids"] == ["TIMEOUT"]
+    assert obj["checks"]["hashes_ok"] is None
+
+    code, obj, _, _ = run_cli_json(["verify", str(bundle), "--json", "--timeout-s", "60"])
+    assert code == 0
+
+
+class _StallingRangeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    data: bytes
+    release: threading.Event
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        pass  # the verifier hangs up on stalled requests
+
+
+class _StallingRangeHandler(BaseHTTPRequestHandler):
+    # Answers the first (tail) range request, then hangs on every later one.
+    server: _StallingRangeServer
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        data = self.server.data
+        m = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers["Range"])
+        assert m
+        if not m.group(1):
+            start, end = max(0, len(data) - int(m.group(2))), len(data) - 1
+        else:
+            self.server.release.wait(30)
+            start, end = int(m.group(1)), min(len(data) - 1, int(m.group(2)))
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(data[start : end + 1])
+
+
+def test_timeout_bounds_stalled_range_server(tmp_path: Path) -> None:
+    files = {f"files/{i}.bin": os.urandom(300_000) for i in range(3)}
+    srv = _StallingRangeServer(("127.0.0.1", 0), _StallingRangeHandler)
+    srv.data = build_bundle(tmp_path / "b.zip", files).read_bytes()
+    srv.release = threading.Event()
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        start = time.monotonic()
+        with Verifier(timeout_s=0.5) as v:
+            ok, summary = v.verify_url(f"http://127.0.0.1:{srv.server_address[1]}/b.zip")
+        assert time.monotonic() - start < 5
+    finally:
+        srv.release.set()
+        srv.shutdown()
+        srv.server_close()
+    assert not ok
+    assert summary["reason_ids"] == ["TIMEOUT"]
+
+
+def test_timeout_bounds_stuck_pipeline_reader() -> None:
+    release = threading.Event()
+
+    def chunks() -> Iterator[bytes]:
+        yield b"first"
+        release.wait(30)
+        yield b"second"
+
+    start = time.monotonic()
+    out = []
+    with pytest.raises(DeadlineExceeded):
+        for chunk in prefetch(chunks(), 2, Deadline(0.3)):
+            out.append(chunk)
+    release.set()
+    assert out == [b"first"]
+    assert time.monotonic() - start < 5
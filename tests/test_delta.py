@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+from oord_verify.verify.delta import load_baseline
+from oord_verify.verify.results import ResultRecord
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli, run_cli_json
+
+_FILES = {f"files/{i:02d}.txt": f"payload {i}".encode() for i in range(10)}
+
+
+def test_only_changed_members_are_rehashed(tmp_path: Path) -> None:
+    old = build_bundle(tmp_path / "old.zip", _FILES)
+    new_files = dict(_FILES, **{"files/03.txt": b"changed", "files/new.txt": b"added"})
+    new = build_bundle(tmp_path / "new.zip", new_files)
+
+    code, obj, _, _ = run_cli_json(["verify", str(new), "--baseline", str(old), "--json"])
+    assert code == 0
+    assert obj["delta"]["carried_over"] == 9
+    assert obj["delta"]["rehashed"] == 2
+    assert obj["delta"]["baseline"] == str(old.resolve())
+    # Carried-over members are not counted as verified bytes.
+    assert ResultRecord.from_summary(True, obj).bytes_verified == len(b"changed") + len(b"added")
+
+
+def test_zip_level_changes_force_rehash(tmp_path: Path) -> None:
+    old = build_bundle(tmp_path / "old.zip", _FILES)
+    # Same manifest, but members stored instead of deflated, and one payload tampered behind the manifest's back.
+    new = build_bundle(
+        tmp_path / "new.zip", _FILES, compression=zipfile.ZIP_STORED, payload_overrides={"files/05.txt": b"evil"}
+    )
+    with Verifier(baseline=load_baseline(str(old))) as v:
+        ok, summary = v.verify_path(new)
+    assert not ok
+    assert summary["reason_ids"] == ["HASH_MISMATCH"]
+    assert summary["delta"]["carried_over"] == 0
+    assert [m["file"] for m in summary["hash_mismatches"]] == ["files/05.txt", "files/05.txt"]
+
+
+def test_unreadable_baseline_is_an_env_error(tmp_path: Path) -> None:
+    new = build_bundle(tmp_path / "new.zip", _FILES)
+    p = run_cli(["verify", str(new), "--baseline", str(tmp_path / "missing.zip")])
+    assert p.returncode == 2
+    assert "baseline bundle could not be read" in p.stderr
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from oord_verify.verify.dirbundle import DirBundle
+from oord_verify.verify.limits import Budgets
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli_json
+
+_FILES = {f"files/d{i % 3}/{i:03d}.bin": os.urandom(1000 + 37 * i) for i in range(60)}
+
+
+def _extract(bundle: Path, dest: Path) -> Path:
+    with zipfile.ZipFile(bundle) as z:
+        z.extractall(dest)
+    return dest
+
+
+def _strip(summary: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(summary, bundle_path=None)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"payload_overrides": {"files/d0/003.bin": b"tampered"}},
+        {"extra_members": {"files/orphan.bin": b"not in manifest"}},
+        {"manifest_overrides": {"merkle": {"root_cid": "cid:sha256:" + "0" * 64}}},
+    ],
+)
+def test_directory_matches_zip(tmp_path: Path, kwargs: Dict[str, Any]) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES, **kwargs)
+    root = _extract(bundle, tmp_path / "b")
+    with Verifier() as v:
+        zip_result = v.verify_path(bundle)
+        dir_result = v.verify_path(root)
+    assert dir_result[1]["bundle_path"] == str(root)
+    assert (dir_result[0], _strip(dir_result[1])) == (zip_result[0], _strip(zip_result[1]))
+
+
+def test_missing_members_and_manifest(tmp_path: Path) -> None:
+    root = _extract(build_bundle(tmp_path / "b.zip", _FILES), tmp_path / "b")
+    (root / "files/d1/004.bin").unlink()
+    with Verifier() as v:
+        ok, summary = v.verify_path(root)
+        assert not ok
+        assert [(m["file"], m["reason"]) for m in summary["hash_mismatches"]] == [
+            ("files/d1/004.bin", "missing_from_zip")
+        ]
+        (root / "manifest.json").unlink()
+        ok, summary = v.verify_path(root)
+    assert summary["reason_ids"] == ["BUNDLE_MANIFEST_MISSING"]
+
+
+def test_symlinks_are_not_members(tmp_path: Path) -> None:
+    root = _extract(build_bundle(tmp_path / "b.zip", {"files/a.txt": b"a"}), tmp_path / "b")
+    (tmp_path / "outside.txt").write_bytes(b"secret")
+    os.symlink(tmp_path / "outside.txt", root / "files" / "link.txt")
+    with DirBundle(root) as z:
+        assert "files/link.txt" not in z.namelist()
+        with pytest.raises(KeyError):
+            z.read("files/link.txt")
+        with pytest.raises(KeyError):
+            z.read("files/../../outside.txt")
+
+
+def test_early_stop_and_budgets(tmp_path: Path) -> None:
+    overrides = {p: b"bad" for p in list(_FILES)[::2]}
+    root = _extract(build_bundle(tmp_path / "b.zip", _FILES, payload_overrides=overrides), tmp_path / "b")
+    with Verifier(stop_after_mismatches=2) as v:
+        ok, summary = v.verify_path(root)
+    assert not ok
+    assert summary["hash_mismatches_truncated"] is True
+    assert len(summary["hash_mismatches"]) >= 2
+
+    with Verifier(budgets=Budgets(max_total_bytes=1000)) as v:
+        ok, summary = v.verify_path(root)
+    assert summary["reason_ids"] == ["BUDGET_TOTAL_BYTES"]
+
+
+def test_cli_accepts_directory(tmp_path: Path) -> None:
+    root = _extract(build_bundle(tmp_path / "b.zip", _FILES), tmp_path / "b")
+    code, obj, _, _ = run_cli_json(["verify", str(root), "--json"])
+    assert code == 0
+    assert obj["hashes_ok"] is True
+
+
+def test_timeout_stops_pool_hashing_promptly(tmp_path: Path) -> None:
+    root = _extract(build_bundle(tmp_path / "b.zip", _FILES), tmp_path / "b")
+    for name in list(_FILES)[:4]:
+        with (root / name).open("r+b") as f:
+            f.truncate(1 << 30)
+    start = time.monotonic()
+    with Verifier(timeout_s=0.5) as v:
+        ok, summary = v.verify_path(root)
+    assert not ok
+    assert summary["reason_ids"] == ["TIMEOUT"]
+    assert summary["timeout"]["stage"] == "hashes"
+    assert time.monotonic() - start < 2.0
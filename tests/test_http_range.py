@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+import zipfile
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from oord_verify.verify.httpio import HTTPRangeFile
+from oord_verify.verify.verifier import verify_bundle, verify_url
+from oord_verify.verify.zipio import ZipBundle, load_manifest
+from tests.util import build_bundle
+
+
+class _RangeHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+        data = Path(path).read_bytes()
+        m = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+        if not m:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        if m.group(1):
+            start = int(m.group(1))
+            end = min(int(m.group(2)), len(data) - 1) if m.group(2) else len(data) - 1
+        else:
+            start = max(0, len(data) - int(m.group(2)))
+            end = len(data) - 1
+        body = data[start : end + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture()
+def served(tmp_path: Path) -> Iterator[tuple[str, Path]]:
+    def handler(*a, **kw):  # type: ignore[no-untyped-def]
+        return _RangeHandler(*a, directory=str(tmp_path), **kw)
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    try:
+        yield f"http://127.0.0.1:{srv.server_address[1]}", tmp_path
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def _files() -> dict[str, bytes]:
+    return {f"files/blob_{i}.bin": os.urandom(256 * 1024) for i in range(12)}
+
+
+def test_verify_url_matches_path_verifier(served: tuple[str, Path]) -> None:
+    base, root = served
+    bundle = build_bundle(root / "good.zip", _files(), compression=zipfile.ZIP_STORED)
+
+    ok_u, s_u = verify_url(f"{base}/good.zip")
+    ok_p, s_p = verify_bundle(bundle)
+    assert ok_u is True and ok_p is True
+    s_u.pop("bundle_path")
+    s_p.pop("bundle_path")
+    assert s_u == s_p
+
+
+def test_metadata_and_json_members_fetch_only_kilobytes(served: tuple[str, Path]) -> None:
+    base, root = served
+    bundle = build_bundle(root / "good.zip", _files(), compression=zipfile.ZIP_STORED)
+    assert bundle.stat().st_size > 3 * 1024 * 1024
+
+    with HTTPRangeFile(f"{base}/good.zip", prefetch=False, tail_size=16 * 1024, min_fetch=4096) as fp:
+        zb = ZipBundle(fp)
+        assert load_manifest(zb)["batch_id"] == "batch-test"
+        assert "tl_proof.json" in zb.namelist()
+        assert fp.requests <= 3
+        assert fp.bytes_fetched < 64 * 1024
+
+
+def test_verify_url_unreachable_is_env(served: tuple[str, Path]) -> None:
+    base, _ = served
+    ok, summary = verify_url(f"{base}/missing.zip")
+    assert not ok
+    assert summary["error_kind"] == "env"
+    assert summary["reason_ids"] == ["ENV_URL_UNREACHABLE"]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from oord_verify.verify.journal import in_shard, load_journal, parse_shard, shard_of
+from tests.util import build_bundle, run_cli_json
+
+
+def _bundles(tmp_path: Path, n: int = 12) -> List[Path]:
+    out = []
+    for i in range(n):
+        overrides = {"files/a.txt": b"tampered"} if i == 4 else None
+        out.append(build_bundle(tmp_path / f"b{i:02d}.zip", {"files/a.txt": b"alpha"}, payload_overrides=overrides))
+    return out
+
+
+def test_parse_shard() -> None:
+    assert parse_shard("3/16") == (3, 16)
+    for bad in ("0/4", "5/4", "x", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_shards_partition_inputs() -> None:
+    keys = [f"/archive/{i}.zip" for i in range(200)]
+    assigned = [[k for k in keys if in_shard(k, i, 4)] for i in (1, 2, 3, 4)]
+    assert sorted(sum(assigned, [])) == sorted(keys)
+    assert all(assigned)
+    assert shard_of(keys[0], 4) == shard_of(keys[0], 4)
+
+
+def test_sharded_journals_merge_into_one_report(tmp_path: Path) -> None:
+    bundles = [str(p) for p in _bundles(tmp_path)]
+    journals = []
+    for i in (1, 2, 3):
+        j = tmp_path / f"shard{i}.ndjson"
+        run_cli_json(["verify", *bundles, "--json", "--shard", f"{i}/3", "--journal", str(j)])
+        journals.append(str(j))
+
+    code, obj, _, _ = run_cli_json(["merge-journals", *journals, "--json"])
+    assert code == 1
+    assert sorted(r["bundle_path"] for r in obj) == sorted(bundles)
+    failed = [r["bundle_path"] for r in obj if r["reason_ids"]]
+    assert failed == [bundles[4]]
+    assert all(r["exit_code"] == 1 for r in obj)
+
+
+def test_resume_skips_journaled_bundles(tmp_path: Path) -> None:
+    bundles = [str(p) for p in _bundles(tmp_path, 4)]
+    journal = tmp_path / "run.ndjson"
+    run_cli_json(["verify", *bundles[:2], "--json", "--journal", str(journal)])
+    # Simulate a crash mid-append, then make an already-journaled bundle unreadable.
+    with journal.open("a") as f:
+        f.write('{"bundle": "torn')
+    Path(bundles[0]).write_bytes(b"not a zip")
+
+    code, obj, _, _ = run_cli_json(["verify", *bundles, "--json", "--journal", str(journal), "--resume"])
+    assert code == 0
+    assert [r["bundle_path"] for r in obj] == bundles
+    records = load_journal(journal)
+    assert sorted(records) == sorted(bundles)
+    assert all(json.loads(line) for line in journal.read_text().splitlines()[3:])
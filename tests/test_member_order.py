@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import zipfile
+from pathlib import Path
+from typing import List
+
+from oord_verify.verify.verifier import _check_hashes_from_manifest
+from oord_verify.verify.zipio import ZipBundle
+from tests.util import build_bundle
+
+
+class _RecordingFile(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads: List[int] = []
+
+    def read(self, n: int = -1) -> bytes:  # type: ignore[override]
+        self.reads.append(self.tell())
+        return super().read(n)
+
+
+def test_members_are_read_in_archive_order_and_reported_in_manifest_order(tmp_path: Path) -> None:
+    files = {f"files/{i:02d}.txt": f"payload {i}".encode() for i in range(10)}
+    bundle = build_bundle(
+        tmp_path / "b.zip", files, payload_overrides={"files/02.txt": b"bad", "files/07.txt": b"bad"}
+    )
+    manifest = {
+        "files": [
+            {"path": p, "sha256": hashlib.sha256(b).hexdigest(), "size_bytes": len(b)}
+            for p, b in reversed(list(files.items()))
+        ]
+    }
+    fp = _RecordingFile(bundle.read_bytes())
+    z = ZipBundle(fp)
+    fp.reads.clear()
+
+    ok, mismatches = _check_hashes_from_manifest(z, manifest)
+
+    assert not ok
+    assert [m["file"] for m in mismatches] == ["files/07.txt", "files/07.txt", "files/02.txt", "files/02.txt"]
+    assert fp.reads == sorted(fp.reads)
+    order = z.schedule(["files/05.txt", "files/missing", "files/01.txt"])
+    assert order == ["files/missing", "files/01.txt", "files/05.txt"]
+
+
+def test_small_member_reads_are_coalesced() -> None:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        for i in range(20):
+            zf.writestr(f"files/{i:02d}.txt", b"x" * 100)
+    plain, coalesced = _RecordingFile(buf.getvalue()), _RecordingFile(buf.getvalue())
+    for fp, coalesce in ((plain, 0), (coalesced, 64 * 1024)):
+        z = ZipBundle(fp, coalesce=coalesce)
+        fp.reads.clear()
+        for name in z.schedule(z.namelist()):
+            assert z.read(name) == b"x" * 100
+    assert len(coalesced.reads) == 1
+    assert len(plain.reads) == 60
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Dict, List
+
+import pytest
+
+from oord_verify.verify import merkle
+from oord_verify.verify.merkle import compute_merkle_root_from_manifest_files, external_sort
+
+
+def _reference_root(files: List[Dict[str, object]]) -> str:
+    # Level-by-level construction: pair neighbours, promote a trailing odd node unchanged.
+    level = [
+        hashlib.sha256(b"leaf:" + bytes.fromhex(str(fe["sha256"]))).digest()
+        for fe in sorted(files, key=lambda fe: str(fe["path"]))
+    ]
+    while len(level) > 1:
+        nxt = [hashlib.sha256(b"node:" + level[i] + level[i + 1]).digest() for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    return "cid:sha256:" + level[0].hex()
+
+
+def _files(n: int, rng: random.Random) -> List[Dict[str, object]]:
+    return [
+        {"path": f"files/{rng.randrange(n)}/{i}.bin", "sha256": hashlib.sha256(str(i).encode()).hexdigest()}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 7, 8, 9, 31, 33, 100, 257])
+def test_streaming_root_matches_level_by_level(n: int) -> None:
+    rng = random.Random(n)
+    files = _files(n, rng)
+    assert compute_merkle_root_from_manifest_files(files) == _reference_root(files)
+    files.sort(key=lambda fe: str(fe["path"]))
+    assert compute_merkle_root_from_manifest_files(files) == _reference_root(files)
+
+
+def test_external_sort_is_stable_and_used_for_large_unsorted_manifests(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(7)
+    files = _files(500, rng)
+    files.append(dict(files[3], sha256=hashlib.sha256(b"duplicate path").hexdigest()))
+    leaves = [(str(fe["path"]), bytes.fromhex(str(fe["sha256"]))) for fe in files]
+    assert list(external_sort(leaves, run_size=37)) == sorted(leaves, key=lambda item: item[0])
+
+    monkeypatch.setattr(merkle, "EXTERNAL_SORT_THRESHOLD", 50)
+    assert compute_merkle_root_from_manifest_files(files) == _reference_root(files)
+
+
+def test_invalid_entry_reported_even_after_unsorted_prefix() -> None:
+    files = _files(10, random.Random(1))
+    files.sort(key=lambda fe: str(fe["path"]), reverse=True)
+    files.append({"path": "outside/x", "sha256": "00" * 32})
+    with pytest.raises(ValueError, match="must start with 'files/'"):
+        compute_merkle_root_from_manifest_files(files)
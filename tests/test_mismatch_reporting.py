@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from oord_verify.verify.verifier import MismatchLog, Verifier
+from tests.util import build_bundle, run_cli, run_cli_json
+
+
+def _corrupted(tmp_path: Path, n: int = 40) -> Path:
+    files = {f"files/{i:03d}.txt": f"payload {i}".encode() for i in range(n)}
+    overrides = {p: b"corrupt" for p in files}
+    return build_bundle(
+        tmp_path / "corrupt.zip",
+        files,
+        payload_overrides=overrides,
+        extra_members={"files/orphan_a": b"a", "files/orphan_b": b"b"},
+    )
+
+
+def test_default_reports_everything(tmp_path: Path) -> None:
+    with Verifier() as v:
+        _, summary = v.verify(_corrupted(tmp_path))
+    assert len(summary["hash_mismatches"]) == 40 * 2 + 2
+    assert summary["hash_mismatch_counts"] == {"hash_mismatch": 40, "size_mismatch": 40, "missing_from_manifest": 2}
+    assert summary["hash_mismatches_truncated"] is False
+
+
+def test_max_mismatches_keeps_first_entries_and_full_counts(tmp_path: Path) -> None:
+    with Verifier(max_mismatches=5) as v:
+        ok, summary = v.verify(_corrupted(tmp_path))
+    assert not ok
+    assert summary["reason_ids"] == ["HASH_MISMATCH"]
+    assert [m["file"] for m in summary["hash_mismatches"]] == [
+        "files/000.txt",
+        "files/000.txt",
+        "files/001.txt",
+        "files/001.txt",
+        "files/002.txt",
+    ]
+    assert summary["hash_mismatch_counts"] == {"hash_mismatch": 40, "size_mismatch": 40, "missing_from_manifest": 2}
+    assert summary["hash_mismatches_truncated"] is True
+
+
+def test_deferred_entries_are_bounded_by_max_mismatches() -> None:
+    log = MismatchLog(max_entries=3)
+    for pos in [9, 4, 7, 1, 8, 4, 0, 6]:
+        log.defer(pos, {"file": f"f{pos}", "reason": "hash_mismatch"})
+        assert len(log._deferred) <= 3
+    assert log.counts == {"hash_mismatch": 8} and log.total == 8
+    log.flush()
+    assert [m["file"] for m in log.entries] == ["f0", "f1", "f4"]
+    assert log.truncated is True
+
+
+def test_stop_after_mismatches_stops_hashing(tmp_path: Path) -> None:
+    with Verifier(stop_after_mismatches=6) as v:
+        ok, summary = v.verify(_corrupted(tmp_path))
+    assert not ok
+    assert sum(summary["hash_mismatch_counts"].values()) == 6
+    assert "missing_from_manifest" not in summary["hash_mismatch_counts"]
+    assert summary["hash_mismatches_truncated"] is True
+
+
+def test_cli_max_mismatches(tmp_path: Path) -> None:
+    code, obj, _, _ = run_cli_json(["verify", str(_corrupted(tmp_path)), "--json", "--max-mismatches", "1"])
+    assert code == 1
+    assert len(obj["hash_mismatches"]) == 1
+    assert obj["hash_mismatches_truncated"] is True
+
+
+@pytest.mark.parametrize("flag", ["--max-mismatches", "--stop-after-mismatches"])
+def test_cli_rejects_negative_mismatch_limits(tmp_path: Path, flag: str) -> None:
+    p = run_cli(["verify", str(_corrupted(tmp_path)), "--json", flag, "-1"])
+    assert p.returncode == 2
+    assert "non-negative" in p.stderr
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+
+from oord_verify.notary_client.client import ConnectionPool, NotaryClient
+
+_ENTRY = {"seq": 7, "merkle_root": "cid:sha256:" + "1" * 64}
+
+
+class _Server(ThreadingHTTPServer):
+    paths: List[str]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.server.paths.append(self.path)
+        if "/old/" in self.path:
+            self.send_response(302)
+            self.send_header("Location", self.path.replace("/old/", "/"))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"entry": _ENTRY}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture()
+def server() -> Iterator[_Server]:
+    srv = _Server(("127.0.0.1", 0), _Handler)
+    srv.paths = []
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def _url(srv: _Server) -> str:
+    return f"http://127.0.0.1:{srv.server_address[1]}"
+
+
+@pytest.fixture(autouse=True)
+def _no_proxy_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for var in ("http_proxy", "HTTP_PROXY", "https_proxy", "HTTPS_PROXY", "no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+
+
+def test_pooled_client_follows_redirects(server: _Server) -> None:
+    pool = ConnectionPool()
+    client = NotaryClient(base_url=_url(server) + "/old", pool=pool)
+    try:
+        assert client.get_tl_entry_by_seq(7) == {"entry": _ENTRY}
+    finally:
+        pool.close()
+    assert server.paths == ["/old/v1/tl/entries/7", "/v1/tl/entries/7"]
+
+
+def test_pooled_client_honours_proxy_env(server: _Server, monkeypatch: pytest.MonkeyPatch) -> None:
+    # The test server doubles as the proxy: a proxied request carries the absolute URL as its target.
+    monkeypatch.setenv("http_proxy", _url(server))
+    pool = ConnectionPool()
+    client = NotaryClient(base_url="http://notary.invalid", pool=pool)
+    try:
+        assert client.get_tl_entry_by_seq(7) == {"entry": _ENTRY}
+        monkeypatch.setenv("no_proxy", "notary.invalid")
+        with pytest.raises(Exception):
+            client.get_tl_entry_by_seq(7)
+    finally:
+        pool.close()
+    assert server.paths == ["http://notary.invalid/v1/tl/entries/7"]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+from oord_verify.notary_client.sim import (
+    NotarySimulator,
+    SimConfig,
+    entries_from_bundles,
+    generate_entries,
+    load_entries,
+    parse_latency,
+)
+from oord_verify.notary_client.client import ConnectionPool, NotaryClient
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle
+
+
+def _bundles(tmp_path: Path, n: int) -> List[Path]:
+    return [
+        build_bundle(tmp_path / f"b{i:03d}.zip", {"files/a.txt": f"payload {i}".encode()}, seq=500 + i)
+        for i in range(n)
+    ]
+
+
+def _reasons(sim: NotarySimulator, bundles: List[Path], tl_batch: int = 0) -> List[List[str]]:
+    with Verifier(tl_url=sim.url, online=True, tl_batch=tl_batch) as v:
+        return [s["reason_ids"] for _, s in v.verify_many(bundles)]
+
+
+def test_parse_latency() -> None:
+    rng = random.Random(1)
+    assert parse_latency("0")(rng) == 0.0
+    assert parse_latency("fixed:20")(rng) == pytest.approx(0.02)
+    assert all(0.005 <= parse_latency("uniform:5,50")(rng) <= 0.05 for _ in range(100))
+    assert all(parse_latency("normal:1,50")(rng) >= 0.0 for _ in range(100))
+    assert parse_latency("exp:0")(rng) == 0.0
+    for bad in ("exp", "uniform:5", "pareto:1,2", "fixed:x"):
+        with pytest.raises(ValueError):
+            parse_latency(bad)
+
+
+def test_recorded_entries_verify_online(tmp_path: Path) -> None:
+    bundles = _bundles(tmp_path, 3)
+    entries = entries_from_bundles(bundles)
+    assert sorted(entries) == [500, 501, 502]
+
+    for tl_batch in (0, 64):
+        with NotarySimulator(entries) as sim:
+            assert _reasons(sim, bundles, tl_batch) == [[], [], []]
+        assert sim.stats == {"ok": 1 if tl_batch else 3}
+
+    with NotarySimulator(entries, SimConfig(supports_range=False)) as sim:
+        assert _reasons(sim, bundles, tl_batch=64) == [[], [], []]
+
+
+@pytest.mark.parametrize(
+    "config, reason",
+    [
+        (SimConfig(p_unauthorized=1.0), "TL_ONLINE_UNAUTHORIZED"),
+        (SimConfig(p_not_found=1.0), "TL_ONLINE_NOT_FOUND"),
+        (SimConfig(p_server_error=1.0), "TL_ONLINE_UNREACHABLE"),
+        (SimConfig(p_drop=1.0), "TL_ONLINE_UNREACHABLE"),
+        (SimConfig(p_malformed=1.0), "TL_ONLINE_BAD_RESPONSE"),
+    ],
+)
+def test_injected_faults(tmp_path: Path, config: SimConfig, reason: str) -> None:
+    bundles = _bundles(tmp_path, 1)
+    with NotarySimulator(entries_from_bundles(bundles), config) as sim:
+        assert _reasons(sim, bundles) == [[reason]]
+
+
+def test_fault_rates_are_seeded() -> None:
+    config = SimConfig(p_server_error=0.3, p_drop=0.2, seed=7)
+    draws = []
+    for _ in range(2):
+        sim = NotarySimulator({}, config)
+        draws.append([sim.draw()[0] for _ in range(1000)])
+        sim.server_close()
+    assert draws[0] == draws[1]
+    assert 200 < draws[0].count("server_error") < 400
+    assert 100 < draws[0].count("drop") < 300
+
+
+def test_load_entries_formats(tmp_path: Path) -> None:
+    gen = generate_entries(3, start_seq=10)
+    records = list(gen.values())
+    (tmp_path / "list.json").write_text(json.dumps(records))
+    (tmp_path / "obj.json").write_text(json.dumps({"entries": [r["entry"] for r in records]}))
+    (tmp_path / "lines.ndjson").write_text("\n".join(json.dumps(r) for r in records) + "\n")
+    for name in ("list.json", "obj.json", "lines.ndjson"):
+        loaded = load_entries(tmp_path / name)
+        assert {s: r["entry"] for s, r in loaded.items()} == {s: r["entry"] for s, r in gen.items()}
+
+
+def test_kept_alive_requests_cost_only_the_configured_latency() -> None:
+    entries = generate_entries(1, 1)
+    with NotarySimulator(entries, SimConfig(latency="fixed:20")) as sim:
+        pool = ConnectionPool()
+        client = NotaryClient(base_url=sim.url, pool=pool)
+        times = []
+        try:
+            for _ in range(12):
+                t0 = time.perf_counter()
+                client.get_tl_entry_by_seq(1)
+                times.append(time.perf_counter() - t0)
+        finally:
+            pool.close()
+    # Without a buffered response every reused request paid an extra ~40 ms delayed ACK.
+    assert statistics.median(times[1:]) < 0.035, times
+
+
+class _CountingSimulator(NotarySimulator):
+    connections = 0
+
+    def get_request(self) -> Tuple[Any, Any]:
+        self.connections += 1
+        return super().get_request()
+
+
+def test_verifier_reuses_one_connection_per_notary(tmp_path: Path) -> None:
+    bundles = _bundles(tmp_path, 10)
+    with _CountingSimulator(entries_from_bundles(bundles), SimConfig(latency="fixed:20")) as sim:
+        times = []
+        with Verifier(tl_url=sim.url, online=True) as v:
+            for b in bundles:
+                t0 = time.perf_counter()
+                ok, summary = v.verify(b)
+                times.append(time.perf_counter() - t0)
+                assert ok, summary
+        assert sim.connections == 1
+    # Each lookup costs the simulator's 20 ms, not a new connection or a delayed ACK on top.
+    assert statistics.median(times[1:]) < 0.035, times
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import io
+import threading
+import zipfile
+from typing import Iterator, List
+
+import pytest
+
+from oord_verify.verify.pipeline import prefetch
+from oord_verify.verify.zipio import PIPELINE_MIN_BYTES, ZipBundle
+
+
+def test_prefetch_preserves_order_and_bounds_read_ahead() -> None:
+    produced: List[int] = []
+
+    def source() -> Iterator[bytes]:
+        for i in range(50):
+            produced.append(i)
+            yield bytes([i])
+
+    seen = []
+    for chunk in prefetch(source(), depth=3):
+        # The reader can be at most depth queued chunks plus the one it is blocked on ahead of the consumer.
+        assert len(produced) - len(seen) <= 5
+        seen.append(chunk[0])
+    assert seen == list(range(50))
+
+
+def test_prefetch_forwards_errors_and_retires_reader_on_early_exit() -> None:
+    def failing() -> Iterator[bytes]:
+        yield b"a"
+        raise zipfile.BadZipFile("Bad CRC-32")
+
+    with pytest.raises(zipfile.BadZipFile):
+        list(prefetch(failing(), depth=2))
+
+    closed = threading.Event()
+
+    def endless() -> Iterator[bytes]:
+        try:
+            while True:
+                yield b"x"
+        finally:
+            closed.set()
+
+    it = prefetch(endless(), depth=2)
+    next(it)
+    it.close()
+    assert closed.is_set()
+    assert not [t for t in threading.enumerate() if t.name == "oord-verify-read"]
+
+
+def test_pipelined_digest_matches_serial() -> None:
+    data = bytes(range(256)) * (PIPELINE_MIN_BYTES // 256 + 4099)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("files/big.bin", data)
+    counted: List[int] = []
+    serial = ZipBundle(buf).digest("files/big.bin")
+    assert ZipBundle(buf, pipeline_depth=2).digest("files/big.bin", counted.append) == serial
+    assert sum(counted) == len(data)
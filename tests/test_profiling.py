@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pstats
+import time
+from pathlib import Path
+
+from oord_verify.verify.profiling import Profiler
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli
+
+
+def test_samples_are_labelled_by_stage(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {f"files/{i}.bin": bytes(1_000_000) for i in range(8)})
+    out = tmp_path / "prof" / "run"
+    with Profiler(out, mode="sample", interval_s=0.001) as prof, Verifier(pipeline_depth=0) as v:
+        deadline = time.monotonic() + 10
+        while "hashes" not in prof.stage_totals() and time.monotonic() < deadline:
+            assert v.verify_path(bundle)[0]
+    assert "hashes" in prof.stage_totals()
+    lines = (tmp_path / "prof" / "run.folded").read_text().splitlines()
+    assert lines and all(line.startswith("stage:") and line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("digest (zipio.py" in line for line in lines if line.startswith("stage:hashes;"))
+    assert not (tmp_path / "prof" / "run.pstats").exists()
+
+
+def test_cli_profile_writes_pstats_and_folded(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {"files/a.txt": b"alpha"})
+    p = run_cli(["verify", str(bundle), "--json", "--profile", str(tmp_path / "out")])
+    assert p.returncode == 0
+    assert "profile written" in p.stderr
+    assert (tmp_path / "out.folded").exists()
+    stats = pstats.Stats(str(tmp_path / "out.pstats"))
+    assert any(func[2] == "verify_path" for func in stats.stats)  # type: ignore[attr-defined]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+from oord_verify.verify.progress import Progress
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli
+
+
+def test_progress_counts_bytes_files_and_bundles(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {"files/a.txt": b"a" * 5000, "files/b.txt": b"b" * 3000})
+    out = io.StringIO()
+    progress = Progress(total_bundles=1, stream=out, tty=False, interval_s=60)
+    with Verifier(progress=progress) as v:
+        ok, _ = v.verify_path(bundle)
+    assert ok
+    assert (progress.bytes, progress.files, progress.expected_bytes) == (8000, 2, 8000)
+    progress.bundle_done()
+    assert progress.line().startswith("progress bundles=1/1 bytes=8000 ")
+
+
+def test_progress_tty_rewrites_one_line() -> None:
+    out = io.StringIO()
+    with Progress(total_bundles=4, stream=out, tty=True, interval_s=60) as progress:
+        progress.add_bytes(2_000_000)
+        progress.bundle_done()
+    text = out.getvalue()
+    assert text.startswith("\rbundles 1/4  2.0 MB hashed")
+    assert text.endswith("\n") and text.count("\n") == 1
+
+
+def test_progress_never_touches_stdout(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {"files/a.txt": b"alpha"})
+    plain = run_cli(["verify", str(bundle), "--json"])
+    p = run_cli(["verify", str(bundle), "--json", "--progress"])
+    assert p.returncode == plain.returncode == 0
+    assert json.loads(p.stdout) == json.loads(plain.stdout)
+    assert p.stderr.startswith("progress bundles=1/1 bytes=5 ")
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from oord_verify.verify.results import Aggregate, ResultRecord, ResultSpool
+from tests.util import build_bundle, run_cli_json
+
+
+def _summary(rids: list, hashes_ok: object = None, total_bytes: int = 0, error_kind: object = None) -> dict:
+    return {
+        "reason_ids": rids,
+        "error_kind": error_kind,
+        "hashes_ok": hashes_ok,
+        "batch": {"total_bytes": total_bytes},
+        "bundle_path": "/x.zip",
+    }
+
+
+def test_record_is_compact_and_round_trips() -> None:
+    s = _summary([], hashes_ok=True, total_bytes=10)
+    rec = ResultRecord.from_summary(True, s)
+    assert not hasattr(rec, "__dict__")
+    assert rec.summary() == s
+    assert rec.bytes_verified == 10
+    assert rec.exit_code == 0
+
+
+def test_record_without_payload_still_aggregates() -> None:
+    s = _summary(["HASH_MISMATCH"], hashes_ok=False, total_bytes=7)
+    full, bare = ResultRecord.from_summary(False, s), ResultRecord.from_summary(False, s, keep_payload=False)
+    assert bare.payload == b""
+    assert (bare.ok, bare.env, bare.reason_ids, bare.bytes_verified) == (
+        full.ok, full.env, full.reason_ids, full.bytes_verified
+    )
+
+
+def test_aggregate_folds_counts_and_exit_code() -> None:
+    agg = Aggregate()
+    agg.add(ResultRecord.from_summary(True, _summary([], hashes_ok=True, total_bytes=5)))
+    agg.add(ResultRecord.from_summary(False, _summary(["HASH_MISMATCH"], hashes_ok=False, total_bytes=7)))
+    assert agg.exit_code == 1
+    agg.add(ResultRecord.from_summary(False, _summary(["TIMEOUT"])))
+    agg.add(ResultRecord.from_summary(False, _summary(["ENV_PATH_MISSING"], error_kind="env")))
+    assert agg.as_dict() == {
+        "bundles": 4,
+        "passed": 1,
+        "failed": 3,
+        "env_failed": 2,
+        "bytes_verified": 5,
+        "reason_ids": {"ENV_PATH_MISSING": 1, "HASH_MISMATCH": 1, "TIMEOUT": 1},
+        "exit_code": 2,
+    }
+
+
+def test_spool_replays_records_in_order() -> None:
+    with ResultSpool() as spool:
+        for i in range(3):
+            spool.append(ResultRecord.from_summary(i != 1, _summary([] if i != 1 else ["X"])))
+        assert [ok for ok, _ in spool] == [True, False, True]
+        assert [s["reason_ids"] for _, s in spool] == [[], ["X"], []]
+
+
+def test_cli_summary_only(tmp_path: Path) -> None:
+    good = build_bundle(tmp_path / "good.zip", {"files/a.txt": b"alpha"})
+    bad = build_bundle(tmp_path / "bad.zip", {"files/a.txt": b"alpha"}, payload_overrides={"files/a.txt": b"beta"})
+    code, obj, _, _ = run_cli_json(["verify", str(good), str(bad), str(good), "--json", "--summary-only"])
+    assert code == 1
+    assert obj == {
+        "bundles": 3,
+        "passed": 2,
+        "failed": 1,
+        "env_failed": 0,
+        "bytes_verified": 10,
+        "reason_ids": {"HASH_MISMATCH": 1},
+        "exit_code": 1,
+    }
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from oord_verify.verify.sampling import Sampling, detection_probability
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle, run_cli_json
+
+_FILES = {f"files/{i:03d}.bin": bytes([i]) * (100 + i) for i in range(100)}
+
+
+def test_detection_probability() -> None:
+    assert detection_probability(100, 10, 1) == pytest.approx(0.1)
+    assert detection_probability(100, 0, 5) == 0.0
+    assert detection_probability(100, 96, 5) == 1.0
+    assert detection_probability(100, 10, 10) == pytest.approx(1 - 0.3304762, abs=1e-6)
+
+
+def test_seeded_sample_is_reproducible_and_reported(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES)
+    with Verifier(sampling=Sampling(rate=0.05, seed=42)) as v:
+        ok, summary = v.verify(bundle)
+        _, again = v.verify(bundle)
+    assert ok, summary
+    sampling = summary["sampling"]
+    assert sampling["seed"] == 42
+    assert sampling["members_total"] == 100
+    assert sampling["members_sampled"] == 5
+    assert sampling["coverage"] == pytest.approx(0.05)
+    assert sampling["detection_probability"]["one_member"] == pytest.approx(0.05)
+    assert again["sampling"] == sampling
+
+
+def test_byte_budget_limits_hashed_bytes(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES)
+    with Verifier(sampling=Sampling(max_bytes=1000, seed=1)) as v:
+        ok, summary = v.verify(bundle)
+    assert ok
+    assert 0 < summary["sampling"]["bytes_sampled"] <= 1000
+
+
+def test_unsampled_corruption_is_missed_but_sampled_is_caught(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES, payload_overrides={"files/000.bin": b"x" * 100})
+    caught = missed = 0
+    for seed in range(40):
+        with Verifier(sampling=Sampling(rate=0.1, seed=seed)) as v:
+            ok, summary = v.verify(bundle)
+        if ok:
+            missed += 1
+        else:
+            caught += 1
+            assert summary["reason_ids"] == ["HASH_MISMATCH"]
+    assert caught and missed
+
+
+def test_unsampled_members_still_checked_against_directory(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES, payload_overrides={"files/000.bin": b"short"})
+    with Verifier(sampling=Sampling(rate=0.0, seed=0)) as v:
+        ok, summary = v.verify(bundle)
+    assert not ok
+    assert summary["hash_mismatch_counts"] == {"size_mismatch": 1}
+
+
+def test_cli_sampling(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES)
+    code, obj, _, _ = run_cli_json(["verify", str(bundle), "--json", "--sample-rate", "0.2", "--sample-seed", "7"])
+    assert code == 0
+    assert obj["sampling"]["seed"] == 7
+    assert obj["sampling"]["members_sampled"] == 20
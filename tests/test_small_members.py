@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import random
+import zipfile
+from typing import Dict, List, Tuple
+
+import pytest
+
+from oord_verify.verify import zipio
+from oord_verify.verify.zipio import ZipBundle
+
+
+def _archive(members: List[Tuple[str, bytes, int]], extra: Dict[str, bytes] | None = None) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data, method in members:
+            info = zipfile.ZipInfo(name)
+            info.compress_type = method
+            info.extra = (extra or {}).get(name, b"")
+            zf.writestr(info, data)
+    return buf.getvalue()
+
+
+def _digests(data: bytes, names: List[str], batched: bool, monkeypatch: pytest.MonkeyPatch) -> Dict[str, object]:
+    monkeypatch.setattr(zipio, "SMALL_MEMBER_BYTES", zipio.SMALL_MEMBER_BYTES if batched else -1)
+    z = ZipBundle(io.BytesIO(data), coalesce=zipio.COALESCE_BYTES)
+    out: Dict[str, object] = {}
+    for name in z.schedule(names):
+        try:
+            out[name] = z.digest(name)
+        except (KeyError, zipfile.BadZipFile) as e:
+            out[name] = repr(e)
+    return out
+
+
+def test_runs_match_member_by_member_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(3)
+    methods = [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2]
+    members = [
+        (f"files/{i:04d}.bin", rng.randbytes(rng.randint(0, 3000)) * rng.randint(1, 4), rng.choice(methods))
+        for i in range(400)
+    ]
+    members.append(("files/big.bin", rng.randbytes(200_000), zipfile.ZIP_DEFLATED))
+    # The last member of the archive carries a local extra field larger than the run read-ahead slack.
+    members.append(("files/zz.bin", b"tail" * 100, zipfile.ZIP_STORED))
+    data = _archive(members, extra={"files/zz.bin": b"\xfe\xca" + (3000).to_bytes(2, "little") + b"\0" * 3000})
+
+    names = [m[0] for m in members[:-1] if rng.random() < 0.8] + ["files/zz.bin", "files/missing"]
+    rng.shuffle(names)
+    batched = _digests(data, names, True, monkeypatch)
+    assert batched == _digests(data, names, False, monkeypatch)
+    expected = {name: (hashlib.sha256(b).hexdigest(), len(b)) for name, b, _ in members}
+    assert all(batched[n] == expected[n] for n in names if n != "files/missing")
+    assert "KeyError" in str(batched["files/missing"])
+
+
+def test_corrupt_member_only_fails_itself(monkeypatch: pytest.MonkeyPatch) -> None:
+    members = [(f"files/{i:02d}.txt", f"payload {i} ".encode() * 50, zipfile.ZIP_DEFLATED) for i in range(20)]
+    data = bytearray(_archive(members))
+    zf = zipfile.ZipFile(io.BytesIO(bytes(data)))
+    info = zf.getinfo("files/07.txt")
+    data[info.header_offset + 30 + len(info.filename) + 5] ^= 0xFF
+    info = zf.getinfo("files/12.txt")
+    data[info.header_offset + 30] ^= 0x01  # first byte of the local file name
+
+    names = [m[0] for m in members]
+    batched = _digests(bytes(data), names, True, monkeypatch)
+    assert batched == _digests(bytes(data), names, False, monkeypatch)
+    assert "BadZipFile" in str(batched["files/07.txt"])
+    assert "differ" in str(batched["files/12.txt"])
+    assert batched["files/08.txt"] == (hashlib.sha256(members[8][1]).hexdigest(), len(members[8][1]))
+
+
+def test_runs_share_one_read() -> None:
+    members = [(f"files/{i:04d}.txt", b"x" * 500, zipfile.ZIP_DEFLATED) for i in range(1000)]
+    reads: List[int] = []
+
+    class Recording(io.BytesIO):
+        def read(self, n: int = -1) -> bytes:  # type: ignore[override]
+            reads.append(n)
+            return super().read(n)
+
+    z = ZipBundle(Recording(_archive(members)))
+    reads.clear()
+    for name in z.schedule([m[0] for m in members]):
+        z.digest(name)
+    assert len(reads) == 1
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from oord_verify.verify.stream import read_bundle_stream
+from oord_verify.verify.verifier import verify_bundle, verify_stream
+from tests.util import build_bundle
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self, data: bytes) -> None:
+        self._inner = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:  # type: ignore[no-untyped-def]
+        chunk = self._inner.read(min(len(b), 4096))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class _UnseekableSink(io.RawIOBase):
+    def __init__(self) -> None:
+        self.buf = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore[no-untyped-def]
+        self.buf += b
+        return len(b)
+
+
+_FILES = {"files/a.txt": b"alpha\n" * 1000, "files/b.bin": bytes(range(256)) * 64, "files/empty": b""}
+
+
+def _strip_path(summary: dict) -> dict:
+    out = dict(summary)
+    out.pop("bundle_path")
+    return out
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_stream_matches_path_verifier(tmp_path: Path, compression: int) -> None:
+    good = build_bundle(tmp_path / "good.zip", _FILES, compression=compression)
+    tampered = build_bundle(
+        tmp_path / "tampered.zip",
+        _FILES,
+        compression=compression,
+        payload_overrides={"files/b.bin": b"nope"},
+        extra_members={"files/orphan": b"x"},
+    )
+    for bundle in (good, tampered):
+        ok_p, s_p = verify_bundle(bundle)
+        ok_s, s_s = verify_stream(_Unseekable(bundle.read_bytes()), label="-")
+        assert ok_p == ok_s
+        assert _strip_path(s_p) == _strip_path(s_s)
+    assert verify_stream(_Unseekable(good.read_bytes()))[0] is True
+    assert verify_stream(_Unseekable(tampered.read_bytes()))[1]["reason_ids"] == ["HASH_MISMATCH"]
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_LZMA])
+def test_stream_handles_data_descriptors(tmp_path: Path, compression: int) -> None:
+    src = build_bundle(tmp_path / "src.zip", _FILES, compression=compression)
+    sink = _UnseekableSink()
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(sink, "w", compression) as zout:
+        for info in zin.infolist():
+            with zin.open(info) as fin, zout.open(info.filename, "w") as fout:
+                fout.write(fin.read())
+
+    ok, summary = verify_stream(_Unseekable(bytes(sink.buf)))
+    assert ok, summary
+    assert summary["hashes_ok"] is True
+
+
+def _with_stub(bundle: Path) -> Path:
+    bundle.write_bytes(b"#!/bin/sh\nexec unzip \"$0\" # PK\n" * 40 + bundle.read_bytes())
+    return bundle
+
+
+_PATH_FIXTURES = {
+    "duplicate_names": lambda p: build_bundle(p, _FILES, extra_members={"files/a.txt": b"second copy"}),
+    "duplicate_identical": lambda p: build_bundle(p, _FILES, extra_members={"files/a.txt": _FILES["files/a.txt"]}),
+    "lzma": lambda p: build_bundle(p, _FILES, compression=zipfile.ZIP_LZMA),
+    "bzip2": lambda p: build_bundle(p, _FILES, compression=zipfile.ZIP_BZIP2),
+    "prepended_stub": lambda p: _with_stub(build_bundle(p, _FILES)),
+    "stub_and_tampered": lambda p: _with_stub(build_bundle(p, _FILES, payload_overrides={"files/a.txt": b"x"})),
+}
+
+
+@pytest.mark.filterwarnings("ignore:Duplicate name")
+@pytest.mark.parametrize("fixture", sorted(_PATH_FIXTURES))
+def test_stream_parity_with_path_fixtures(tmp_path: Path, fixture: str) -> None:
+    bundle = _PATH_FIXTURES[fixture](tmp_path / "b.zip")
+    ok_p, s_p = verify_bundle(bundle)
+    ok_s, s_s = verify_stream(_Unseekable(bundle.read_bytes()))
+    assert (ok_s, _strip_path(s_s)) == (ok_p, _strip_path(s_p))
+
+
+def test_streamed_digest_reports_bytes(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", _FILES)
+    z = read_bundle_stream(_Unseekable(bundle.read_bytes()))
+    seen: List[int] = []
+    assert z.digest("files/a.txt", seen.append)[1] == len(_FILES["files/a.txt"])
+    assert seen == [len(_FILES["files/a.txt"])]
+
+
+def test_stream_truncated_is_zip_bad(tmp_path: Path) -> None:
+    data = build_bundle(tmp_path / "good.zip", _FILES).read_bytes()
+    ok, summary = verify_stream(_Unseekable(data[: len(data) // 2]))
+    assert not ok
+    assert summary["reason_ids"] == ["ZIP_BAD"]
+
+
+def test_cli_verify_stdin(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "good.zip", _FILES)
+    p = subprocess.run(
+        [sys.executable, "-m", "oord_verify.cli", "verify", "-", "--json"],
+        input=bundle.read_bytes(),
+        capture_output=True,
+    )
+    assert p.returncode == 0, p.stdout
+    assert b'"bundle_path": "-"' in p.stdout
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from oord_verify.verify.tl import coalesce_seqs
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle
+
+
+class _FakeNotary(ThreadingHTTPServer):
+    entries: Dict[int, Dict[str, Any]]
+    supports_range: bool
+    range_cap: Optional[int]
+    range_status: int
+    paths: List[str]
+
+
+class _NotaryHandler(BaseHTTPRequestHandler):
+    server: _FakeNotary
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, obj: Any) -> None:
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.server.paths.append(self.path)
+        parts = urlsplit(self.path)
+        if parts.path == "/v1/tl/entries":
+            if not self.server.supports_range:
+                self._send(404, {"error": "no such route"})
+                return
+            if self.server.range_status != 200:
+                self._send(self.server.range_status, {"error": "bad request"})
+                return
+            q = parse_qs(parts.query)
+            start, end = int(q["start"][0]), int(q["end"][0])
+            found = [{"entry": e} for s, e in sorted(self.server.entries.items()) if start <= s <= end]
+            found = found[: self.server.range_cap]
+            self._send(200, {"entries": found})
+            return
+        seq = int(parts.path.rsplit("/", 1)[-1])
+        if seq not in self.server.entries:
+            self._send(404, {"error": "not found"})
+            return
+        self._send(200, {"entry": self.server.entries[seq]})
+
+
+@pytest.fixture()
+def notary() -> Iterator[_FakeNotary]:
+    srv = _FakeNotary(("127.0.0.1", 0), _NotaryHandler)
+    srv.entries = {}
+    srv.supports_range = True
+    srv.range_cap = None
+    srv.range_status = 200
+    srv.paths = []
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def _bundles(tmp_path: Path, notary: _FakeNotary, n: int) -> List[Path]:
+    out = []
+    for i in range(n):
+        seq = 1000 + i
+        p = build_bundle(tmp_path / f"b{i:03d}.zip", {"files/a.txt": f"payload {i}".encode()}, seq=seq)
+        with Verifier() as v:
+            _, summary = v.verify(p)
+        notary.entries[seq] = {"seq": seq, "merkle_root": summary["merkle"]["manifest_root"], "signer_key_id": "stub-kid"}
+        out.append(p)
+    return out
+
+
+def _run(notary: _FakeNotary, bundles: List[Path], tl_batch: int, **kwargs: Any) -> List[Tuple[bool, Dict[str, Any]]]:
+    url = f"http://127.0.0.1:{notary.server_address[1]}"
+    with Verifier(tl_url=url, online=True, tl_batch=tl_batch, **kwargs) as v:
+        return list(v.verify_many(bundles))
+
+
+def test_coalesce_seqs() -> None:
+    assert coalesce_seqs([5, 1, 2, 3, 200, 3]) == [(1, 5), (200, 200)]
+    assert coalesce_seqs(range(10), max_gap=1, max_span=4) == [(0, 3), (4, 7), (8, 9)]
+
+
+def test_batched_lookups_coalesce_and_classify(tmp_path: Path, notary: _FakeNotary) -> None:
+    bundles = _bundles(tmp_path, notary, 40)
+    del notary.entries[1005]
+    notary.entries[1007] = dict(notary.entries[1007], merkle_root="cid:sha256:" + "0" * 64)
+
+    results = _run(notary, bundles, tl_batch=64, workers=4)
+    # The one seq absent from the range page is confirmed with a per-entry GET before it is reported as not found.
+    assert notary.paths[1:] == ["/v1/tl/entries/1005"]
+    assert [s["bundle_path"] for _, s in results] == [str(p) for p in bundles]
+    by_seq = {1000 + i: r for i, r in enumerate(results)}
+    assert by_seq[1005][1]["reason_ids"] == ["TL_ONLINE_NOT_FOUND"]
+    assert by_seq[1007][1]["reason_ids"] == ["TL_ONLINE_CONTRADICTION"]
+    others = [ok for seq, (ok, _) in by_seq.items() if seq not in (1005, 1007)]
+    assert all(others)
+    assert by_seq[1000][1]["tl_online"]["ok"] is True
+
+
+def test_falls_back_to_per_entry_without_range_endpoint(tmp_path: Path, notary: _FakeNotary) -> None:
+    bundles = _bundles(tmp_path, notary, 6)
+    notary.supports_range = False
+    unbatched = _run(notary, bundles, tl_batch=0)
+    notary.paths.clear()
+
+    batched = _run(notary, bundles, tl_batch=64)
+    assert notary.paths[0].startswith("/v1/tl/entries?")
+    assert len(notary.paths) == 1 + len(bundles)
+    assert batched == unbatched
+
+
+def test_capped_range_pages_are_completed_per_entry(tmp_path: Path, notary: _FakeNotary) -> None:
+    bundles = _bundles(tmp_path, notary, 12)
+    notary.range_cap = 5
+    results = _run(notary, bundles, tl_batch=64)
+    assert all(ok for ok, _ in results)
+    assert len(notary.paths) == 1 + 7
+
+
+def _range_requests(notary: _FakeNotary) -> int:
+    return sum(p.startswith("/v1/tl/entries?") for p in notary.paths)
+
+
+@pytest.mark.parametrize("status", [400, 500, 503])
+def test_range_errors_fall_back_per_window(tmp_path: Path, notary: _FakeNotary, status: int) -> None:
+    bundles = _bundles(tmp_path, notary, 6)
+    notary.range_status = status
+    results = _run(notary, bundles, tl_batch=3)
+    assert all(ok for ok, _ in results), [s["reason_ids"] for _, s in results]
+    # A failed range request says nothing about the next one, so each window of three tries again.
+    assert _range_requests(notary) == 2
+    assert len(notary.paths) == 2 + len(bundles)
+
+
+@pytest.mark.parametrize("status", [405, 501])
+def test_unsupported_range_endpoint_is_not_retried(tmp_path: Path, notary: _FakeNotary, status: int) -> None:
+    bundles = _bundles(tmp_path, notary, 6)
+    notary.range_status = status
+    results = _run(notary, bundles, tl_batch=3)
+    assert all(ok for ok, _ in results), [s["reason_ids"] for _, s in results]
+    assert _range_requests(notary) == 1
+    assert len(notary.paths) == 1 + len(bundles)
+
+
+def test_all_checks_keeps_online_results_of_failed_bundles(tmp_path: Path, notary: _FakeNotary) -> None:
+    bundles = _bundles(tmp_path, notary, 4)
+    for i in (1, 2):
+        files = {"files/a.txt": f"payload {i}".encode()}
+        build_bundle(bundles[i], files, seq=1000 + i, payload_overrides={"files/a.txt": b"tampered"})
+    notary.entries[1002] = dict(notary.entries[1002], merkle_root="cid:sha256:" + "0" * 64)
+    unbatched = _run(notary, bundles, tl_batch=0, all_checks=True)
+    notary.paths.clear()
+
+    batched = _run(notary, bundles, tl_batch=64, all_checks=True)
+    assert notary.paths == ["/v1/tl/entries?start=1000&end=1003"]
+    assert batched == unbatched
+    assert batched[1][1]["reason_ids"] == ["HASH_MISMATCH"]
+    assert batched[1][1]["tl_online"]["ok"] is True
+    assert batched[2][1]["reason_ids"] == ["HASH_MISMATCH", "TL_ONLINE_CONTRADICTION"]
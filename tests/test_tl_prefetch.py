@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from oord_verify.notary_client.sim import NotarySimulator, SimConfig, entries_from_bundles
+from oord_verify.verify.deadline import Deadline
+from oord_verify.verify.verifier import Verifier
+from tests.util import build_bundle
+
+_DELAY_S = 0.4
+
+
+def _slow_hashes(monkeypatch: pytest.MonkeyPatch) -> None:
+    original = Verifier._step_hashes
+
+    def slow(self: Verifier, *args: Any, **kwargs: Any) -> Optional[Any]:
+        time.sleep(_DELAY_S)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Verifier, "_step_hashes", slow)
+
+
+def test_lookup_overlaps_hashing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {"files/a.txt": b"a"}, seq=41)
+    _slow_hashes(monkeypatch)
+    config = SimConfig(latency=str(int(_DELAY_S * 1000)))
+    with NotarySimulator(entries_from_bundles([bundle]), config) as sim, Verifier(tl_url=sim.url, online=True) as v:
+        t0 = time.monotonic()
+        ok, summary = v.verify_path(bundle)
+        elapsed = time.monotonic() - t0
+    assert ok, summary
+    assert summary["tl_online"]["ok"] is True
+    assert sim.stats == {"ok": 1}
+    # Sequential would be hashing plus the round trip.
+    assert elapsed < 2 * _DELAY_S * 0.9
+
+
+def test_offline_failure_still_wins(tmp_path: Path) -> None:
+    bundle = build_bundle(
+        tmp_path / "b.zip", {"files/a.txt": b"a"}, seq=41, payload_overrides={"files/a.txt": b"tampered"}
+    )
+    with NotarySimulator(entries_from_bundles([bundle]), SimConfig(p_server_error=1.0)) as sim:
+        with Verifier(tl_url=sim.url, online=True) as v:
+            ok, summary = v.verify_path(bundle)
+    assert not ok
+    assert summary["reason_ids"] == ["HASH_MISMATCH"]
+    assert summary["tl_online"]["ok"] is None
+
+
+def test_prefetched_failures_keep_their_reason_ids(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {"files/a.txt": b"a"}, seq=41)
+    entries = entries_from_bundles([bundle])
+    entries[41] = {"entry": dict(entries[41]["entry"], merkle_root="cid:sha256:" + "0" * 64)}
+    with NotarySimulator(entries) as sim, Verifier(tl_url=sim.url, online=True) as v:
+        assert v.verify_path(bundle)[1]["reason_ids"] == ["TL_ONLINE_CONTRADICTION"]
+    with NotarySimulator({}) as sim, Verifier(tl_url=sim.url, online=True) as v:
+        assert v.verify_path(bundle)[1]["reason_ids"] == ["TL_ONLINE_NOT_FOUND"]
+
+
+def test_slow_notary_hits_the_deadline(tmp_path: Path) -> None:
+    bundle = build_bundle(tmp_path / "b.zip", {"files/a.txt": b"a"}, seq=41)
+    with NotarySimulator(entries_from_bundles([bundle]), SimConfig(latency="2000")) as sim:
+        with Verifier(tl_url=sim.url, online=True) as v:
+            ok, summary = v.verify_path(bundle, deadline=Deadline(0.3))
+    assert summary["reason_ids"] == ["TIMEOUT"]
+    assert summary["timeout"]["stage"] == "tl_online"
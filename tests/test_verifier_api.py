@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from oord_verify.verify import crypto
+from oord_verify.verify.crypto import KeyRing
+from oord_verify.verify.verifier import Verifier, verify_bundle
+from tests.util import build_bundle
+
+
+def _bundles(tmp_path: Path, n: int) -> list[Path]:
+    out = []
+    for i in range(n):
+        files = {f"files/{i}.txt": f"payload {i}".encode()}
+        overrides = {f"files/{i}.txt": b"tampered"} if i % 3 == 0 else None
+        out.append(build_bundle(tmp_path / f"b{i}.zip", files, payload_overrides=overrides))
+    return out
+
+
+def test_verify_many_yields_every_result(tmp_path: Path) -> None:
+    bundles = _bundles(tmp_path, 9)
+    with Verifier(workers=4) as v:
+        got = {s["bundle_path"]: ok for ok, s in v.verify_many(bundles)}
+    assert got == {str(b): verify_bundle(b)[0] for b in bundles}
+
+
+def test_verify_many_ordered_keeps_input_order(tmp_path: Path) -> None:
+    bundles = _bundles(tmp_path, 7)
+    with Verifier(workers=3) as v:
+        paths = [s["bundle_path"] for _, s in v.verify_many(bundles, ordered=True)]
+    assert paths == [str(b) for b in bundles]
+
+
+def test_result_cache_returns_independent_copies(tmp_path: Path) -> None:
+    (bundle,) = _bundles(tmp_path, 1)
+    with Verifier(cache_size=4) as v:
+        ok1, s1 = v.verify(bundle)
+        s1["reason_ids"].append("MUTATED")
+        ok2, s2 = v.verify(bundle)
+    assert ok1 == ok2 is False
+    assert s2["reason_ids"] == ["HASH_MISMATCH"]
+
+
+def test_keyring_is_a_bounded_lru(monkeypatch: pytest.MonkeyPatch) -> None:
+    parsed: list[bytes] = []
+
+    class _Key:
+        @staticmethod
+        def from_public_bytes(b: bytes) -> Any:
+            parsed.append(b)
+            return ("key", b)
+
+    monkeypatch.setattr(crypto, "Ed25519PublicKey", _Key)
+    ring = KeyRing(max_keys=2)
+    for b in [b"a", b"b", b"a", b"c", b"a", b"b"]:
+        assert ring.load(b) == ("key", b)
+    # "b" was evicted by "c" (least recently used), "a" never was.
+    assert parsed == [b"a", b"b", b"c", b"b"]
+    assert len(ring._keys) == 2
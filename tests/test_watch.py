@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from oord_verify.verify.verifier import Verifier
+from oord_verify.verify.watch import Inotify, Watcher
+from tests.util import build_bundle, run_cli
+
+_FILES = {f"files/{i:02d}.bin": os.urandom(2000 + i) for i in range(8)}
+
+
+def _land(src: Path, root: Path, name: str) -> Path:
+    dest = root / name
+    os.replace(src, dest)
+    return dest
+
+
+def _run(watcher: Watcher, max_bundles: int) -> threading.Thread:
+    t = threading.Thread(target=watcher.run, kwargs={"max_bundles": max_bundles}, daemon=True)
+    t.start()
+    return t
+
+
+def _inotify_available(path: Path) -> bool:
+    try:
+        Inotify(path).close()
+    except OSError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_new_bundles_are_verified_and_moved(tmp_path: Path, use_inotify: bool) -> None:
+    if use_inotify and not _inotify_available(tmp_path):
+        pytest.skip("inotify not available")
+    root = tmp_path / "landing"
+    root.mkdir()
+    old = build_bundle(root / "oord_bundle_old.zip", _FILES)
+    good = build_bundle(tmp_path / "good.zip", _FILES)
+    bad = build_bundle(tmp_path / "bad.zip", _FILES, payload_overrides={"files/03.bin": b"tampered"})
+    results: List[Dict[str, Any]] = []
+    with Verifier() as v:
+        watcher = Watcher(
+            root,
+            v,
+            results.append,
+            settle_s=0.2,
+            poll_interval_s=0.05,
+            use_inotify=use_inotify,
+            workers=2,
+            pass_dir=tmp_path / "pass",
+            fail_dir=tmp_path / "fail",
+        )
+        assert watcher.mode == ("inotify" if use_inotify else "polling")
+        t = _run(watcher, 2)
+        time.sleep(0.2)
+        _land(good, root, "oord_bundle_good.zip")
+        _land(bad, root, "oord_bundle_bad.zip")
+        (root / "notes.txt").write_text("ignored")
+        t.join(20)
+        assert not t.is_alive()
+
+    by_name = {Path(r["bundle"]).name: r for r in results}
+    assert set(by_name) == {"oord_bundle_good.zip", "oord_bundle_bad.zip"}
+    assert by_name["oord_bundle_good.zip"]["result"]["exit_code"] == 0
+    assert by_name["oord_bundle_bad.zip"]["result"]["reason_ids"] == ["HASH_MISMATCH"]
+    assert (tmp_path / "pass" / "oord_bundle_good.zip").is_file()
+    assert (tmp_path / "fail" / "oord_bundle_bad.zip").is_file()
+    assert old.is_file()
+
+
+def test_close_event_skips_settle_wait(tmp_path: Path) -> None:
+    if not _inotify_available(tmp_path):
+        pytest.skip("inotify not available")
+    data = build_bundle(tmp_path / "src.zip", _FILES).read_bytes()
+    root = tmp_path / "landing"
+    root.mkdir()
+    results: List[Dict[str, Any]] = []
+    with Verifier() as v:
+        watcher = Watcher(root, v, results.append, settle_s=60, poll_interval_s=0.05)
+        t = _run(watcher, 1)
+        time.sleep(0.2)
+        start = time.monotonic()
+        with (root / "oord_bundle_1.zip").open("wb") as f:
+            f.write(data[:1000])
+            f.flush()
+            f.write(data[1000:])
+        t.join(20)
+    assert results and results[0]["ok"] is True
+    assert time.monotonic() - start < 10
+
+
+def test_scan_waits_for_size_to_settle(tmp_path: Path) -> None:
+    data = build_bundle(tmp_path / "src.zip", _FILES).read_bytes()
+    root = tmp_path / "landing"
+    root.mkdir()
+    submitted: List[str] = []
+    watcher = Watcher(root, Verifier(), lambda r: None, settle_s=1.0, use_inotify=False)
+    watcher._submit = lambda name, sig: submitted.append(name)  # type: ignore[method-assign]
+    path = root / "oord_bundle_1.zip"
+    path.write_bytes(data[:500])
+    watcher.scan(0.0)
+    watcher.scan(0.9)
+    with path.open("ab") as f:
+        f.write(data[500:])
+    watcher.scan(1.5)
+    watcher.scan(2.0)
+    assert submitted == []
+    watcher.scan(2.6)
+    assert submitted == ["oord_bundle_1.zip"]
+
+
+def test_cli_watch_existing(tmp_path: Path) -> None:
+    root = tmp_path / "landing"
+    root.mkdir()
+    build_bundle(root / "oord_bundle_a.zip", _FILES)
+    p = run_cli(["watch", str(root), "--existing", "--max-bundles", "1", "--settle-s", "0.1", "--poll"])
+    assert p.returncode == 0, p.stderr
+    (line,) = p.stdout.splitlines()
+    rec = json.loads(line)
+    assert rec["bundle"] == str(root / "oord_bundle_a.zip")
+    assert rec["result"]["exit_code"] == 0
+    assert "polling" in p.stderr
@@ -1,10 +1,12 @@
 # oord-verify/tests/util.py
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import subprocess
 import sys
+import zipfile
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -55,3 +57,51 @@ def vector_bundle(name: str) -> Path | None:
         return None
     p = (pr / "test-vectors" / "v1" / "bundles" / name).resolve()
     return p if p.is_file() else None
+
+
+def build_bundle(
+    dest: Path,
+    files: Dict[str, bytes],
+    *,
+    tl_mode: str = "included",
+    seq: int = 7,
+    payload_overrides: Dict[str, bytes] | None = None,
+    manifest_overrides: Dict[str, Any] | None = None,
+    extra_members: Dict[str, bytes] | None = None,
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> Path:
+    from oord_verify.verify.merkle import compute_merkle_root_from_manifest_files
+
+    entries = [
+        {"path": p, "sha256": hashlib.sha256(b).hexdigest(), "size_bytes": len(b)} for p, b in files.items()
+    ]
+    root = compute_merkle_root_from_manifest_files(entries)
+    manifest = {
+        "org_id": "org-test",
+        "batch_id": "batch-test",
+        "created_at_ms": 1700000000000,
+        "key_id": "stub-kid",
+        "signature": "",
+        "files": entries,
+        "merkle": {"root_cid": root},
+        "tl_mode": tl_mode,
+    }
+    manifest.update(manifest_overrides or {})
+    jwks = {"keys": [{"kid": "stub-kid", "kty": "OKP", "crv": "Ed25519", "x": ""}]}
+    tl_proof = {
+        "entry": {"seq": seq, "merkle_root": root, "signer_key_id": "stub-kid"},
+        "sth": {"sth_sig": "stub"},
+    }
+
+    payload = dict(files)
+    payload.update(payload_overrides or {})
+    with zipfile.ZipFile(dest, "w", compression) as z:
+        z.writestr("manifest.json", json.dumps(manifest))
+        z.writestr("jwks_snapshot.json", json.dumps(jwks))
+        if tl_mode == "included":
+            z.writestr("tl_proof.json", json.dumps(tl_proof))
+        for p, b in payload.items():
+            z.writestr(p, b)
+        for p, b in (extra_members or {}).items():
+            z.writestr(p, b)
+    return dest